@@ -19,6 +19,7 @@ __all__ = [
     "OspGrillageBeam",
     "OspGrillageShell",
     "create_grillage",
+    "OutputRequest",
     # Members & sections
     "GrillageMember",
     "Section",
@@ -9,7 +9,7 @@ import numpy as np
 import pprint
 from collections import namedtuple
 from collections.abc import Iterable
-from copy import deepcopy
+from copy import copy, deepcopy
 from typing import Union
 
 from scipy import interpolate
@@ -224,9 +224,9 @@ def create_moving_path(**kwargs):
 
 
 # named tuple definition
-LoadPoint = namedtuple("Point", ["x", "y", "z", "p"])
-NodeForces = namedtuple("node_forces", ["Fx", "Fy", "Fz", "Mx", "My", "Mz"])
-Line = namedtuple("line", ["m", "c", "phi"])
+LoadPoint = namedtuple("LoadPoint", ["x", "y", "z", "p"])
+NodeForces = namedtuple("NodeForces", ["Fx", "Fy", "Fz", "Mx", "My", "Mz"])
+Line = namedtuple("Line", ["m", "c", "phi"])
 
 
 # ----------------------------------------------------------------------------------------------------------------
@@ -419,6 +419,20 @@ class Loads:
                 else self.load_point_8
             )
 
+    def get_moved_load(self, ref_point: Point):
+        """
+        Function to get a copy of the load moved by a reference coordinate. Unlike :func:`move_load`, the load
+        object is not modified. The copy is shallow - it shares all attributes other than the load points with
+        the load object.
+
+        :param ref_point: coordinate to be moved
+        :type ref_point: namedTuple Point(x,y,z)
+        :returns: Moved copy of load object
+        """
+        moved_load = copy(self)
+        moved_load.move_load(ref_point)
+        return moved_load
+
     def apply_load_factor(self, factor=1):
         """
         Apply a load factor to all load point magnitudes.
@@ -1103,6 +1117,22 @@ class CompoundLoad:
                 append_load_list  # overwrite it to class variable
             )
 
+    def get_moved_load(self, ref_point: Point):
+        """
+        Function to get a copy of the compound load with each load moved by a reference coordinate. The compound
+        load and its loads are not modified.
+
+        :param ref_point: coordinate to be moved
+        :type ref_point: namedTuple Point(x,y,z)
+        :returns: Moved copy of compound load
+        """
+        moved_load = copy(self)
+        moved_load.compound_load_obj_list = [
+            load_obj.get_moved_load(ref_point)
+            for load_obj in self.compound_load_obj_list
+        ]
+        return moved_load
+
 
 # ---------------------------------------------------------------------------------------------------------------
 class LoadCase:
@@ -1156,6 +1186,45 @@ class LoadCase:
         load_dict.setdefault("factor", load_factor)
         self.load_groups.append(load_dict)
 
+    def add_load_reference(
+        self, load_obj: Union[Loads, CompoundLoad], offset: Point = None, **kwargs
+    ):
+        """
+        Add a reference to a load or compound load to this load case, without copying the load object. If an
+        offset is given, the load is moved by the offset when load groups are retrieved via
+        :func:`get_load_groups`. Used by :class:`MovingLoad` to represent each increment by its position on the
+        path, instead of a moved copy of its loads.
+
+        :param load_obj: The load to add.
+        :type load_obj: Loads or CompoundLoad
+        :param offset: Offset to move the load by.
+        :type offset: Point namedtuple, optional
+        :param load_factor: Scale factor applied to this load object within
+            the load case. Defaults to ``1``.
+        :type load_factor: float, optional
+        """
+        load_dict = dict(load=load_obj, factor=kwargs.get("load_factor", 1))
+        if offset is not None:
+            load_dict["offset"] = offset
+        self.load_groups.append(load_dict)
+
+    def get_load_groups(self) -> list:
+        """
+        Returns the load groups of this load case, with loads added by :func:`add_load_reference` moved by their
+        offsets.
+
+        :returns: List of dicts with keys ``load`` and ``factor``
+        """
+        load_groups = []
+        for load_dict in self.load_groups:
+            if "offset" in load_dict:
+                load_dict = dict(
+                    load=load_dict["load"].get_moved_load(load_dict["offset"]),
+                    factor=load_dict["factor"],
+                )
+            load_groups.append(load_dict)
+        return load_groups
+
     # function for if load groups are to change its ref position due to movement / traversing loads
     # warning : this function is only to be handled by MovingLoad class
     def move_load_group(self, ref_point: Point):
@@ -1185,7 +1254,14 @@ class LoadCase:
         self.position = ref_point
         for load_dict in self.load_groups:
             load_obj = load_dict.get("load")
-            if isinstance(load_obj, CompoundLoad):
+            if "offset" in load_dict:  # referenced load, update its offset
+                offset = load_dict["offset"]
+                load_dict["offset"] = Point(
+                    offset.x + ref_point.x,
+                    offset.y + ref_point.y,
+                    offset.z + ref_point.z,
+                )
+            elif isinstance(load_obj, CompoundLoad):
                 for ind_load_obj in load_obj.compound_load_obj_list:
                     ind_load_obj.move_load(self.position)
             else:
@@ -1307,10 +1383,14 @@ class MovingLoad:
             if not load_pair_dict["path"]:  # empty path, load is static
                 self.static_load_case.append(load_pair_dict["load"])
 
+        # copy loads once, increments are references to the copies moved by the position of the increment
+        static_load_copies = [
+            deepcopy(static_load) for static_load in self.static_load_case
+        ]
         # create load case obj for each step in the move
         for load_pair_dict in self.load_case_dict_list:
             path_list = load_pair_dict["path"]  # extract path_list of load object
-            load_obj = load_pair_dict["load"]
+            load_obj_copy = deepcopy(load_pair_dict["load"]) if path_list else None
             # loop to create a load case for each increment of the path obj
             load_case_list = []
             for steps in path_list:
@@ -1319,27 +1399,15 @@ class MovingLoad:
                         self.name, steps[0], steps[1], steps[2]
                     )
                 )  # _lc in name stands for load case
-                load_obj_copy = deepcopy(
-                    load_obj
-                )  # Use deepcopy module to copy instance of load
-                load_step_lc.add_load(
-                    load_obj_copy
-                )  # and add load to newly created load case
-                # add entries of static load to load groups
                 step_point = Point(
                     steps[0], steps[1], steps[2]
                 )  # convert increment position into Point tuple
-                load_step_lc.move_load_group(
-                    step_point
-                )  # increment the load groups by step point
-                # static load not used
-                for (
-                    static_load
-                ) in (
-                    self.static_load_case
-                ):  # add static load portions to each incremental load case
-                    static_load_copy = deepcopy(static_load)
-                    load_step_lc.add_load(static_load_copy)
+                # add load to newly created load case, moved by the step point
+                load_step_lc.add_load_reference(load_obj_copy, offset=step_point)
+                load_step_lc.position = step_point
+                # add static load portions to each incremental load case
+                for static_load_copy in static_load_copies:
+                    load_step_lc.add_load_reference(static_load_copy)
                 load_case_list.append(load_step_lc)
             self.moving_load_case.append(load_case_list)
             self.parse = True
@@ -16,6 +16,7 @@ from ospgrillage.utils import (
     line_func,
     rotate_point_about_point,
     select_segment_function,
+    sort_vertices,
 )
 
 __all__ = [
@@ -134,6 +135,10 @@ class Mesh:
         self.edge_span_ele = []
         self.connect_ele = []
         self.link_str_list = []
+        # {ele tag: [node tags]} of elements created outside the element lists, e.g. shell and spring elements
+        self.model_ele_nodes = dict()
+        # cached connectivity arrays, see get_element_connectivity()
+        self.ele_connectivity = None
         # dict for node and ele transform
         self.transform_dict = dict()  # key: vector xz, val: transform tag
         self.node_spec = (
@@ -1510,6 +1515,280 @@ class Mesh:
                     else:
                         subdict["left"] = neighbour
             self.grid_vicinity_dict.setdefault(k, subdict)
+        self._create_grid_index()
+        self._create_element_index()
+
+    def _create_element_index(self):
+        """
+        Function to create a hashed index of node pairs to the grillage members between them. Keys are sorted
+        pairs of node tags, values are lists of indices of elements in ``long_ele``, ``trans_ele`` and
+        ``edge_span_ele``.
+        """
+        # {(node i, node j): ([long], [trans], [edge])}
+        self.node_pair_ele_index = dict()
+        for member_index, ele_list in enumerate(
+            [self.long_ele, self.trans_ele, self.edge_span_ele]
+        ):
+            for ele_index, ele in enumerate(ele_list):
+                node_pair = tuple(sorted(ele[1:3]))
+                self.node_pair_ele_index.setdefault(node_pair, ([], [], []))[
+                    member_index
+                ].append(ele_index)
+
+    def add_element_nodes(self, ele_tag: int, node_tags: list):
+        """
+        Function to record the nodes of an element created outside the element lists of the mesh, e.g. shell and
+        spring elements of the grillage model, for :func:`get_element_connectivity`.
+
+        :param ele_tag: Element tag
+        :type ele_tag: int
+        :param node_tags: Node tags of the element, in order of the element command
+        :type node_tags: list
+        """
+        self.model_ele_nodes[ele_tag] = list(node_tags)
+        self.ele_connectivity = None
+
+    def get_element_connectivity(self) -> tuple:
+        """
+        Function to get the node connectivity of all elements of the mesh - the elements of ``long_ele``,
+        ``trans_ele``, ``edge_span_ele`` and ``connect_ele``, and elements recorded with
+        :func:`add_element_nodes`. Connectivity is built once and shared until further elements are recorded.
+
+        :returns: Tuple of element tags (n,) int array, node tags (n, 4) int array padded with -1 for elements of
+            less than four nodes, and dict of element tag to row of the arrays.
+        """
+        if self.ele_connectivity is None:
+            ele_nodes = {
+                ele[0]: ele[1:3]
+                for ele_list in [
+                    self.long_ele,
+                    self.trans_ele,
+                    self.edge_span_ele,
+                    self.connect_ele,
+                ]
+                for ele in ele_list
+            }
+            ele_nodes.update(self.model_ele_nodes)
+            ele_tags = np.array(list(ele_nodes.keys()), dtype=int)
+            node_tags = np.full((len(ele_tags), 4), -1, dtype=int)
+            for row, nodes in enumerate(ele_nodes.values()):
+                node_tags[row, : len(nodes)] = nodes
+            ele_row = {tag: row for row, tag in enumerate(ele_nodes.keys())}
+            self.ele_connectivity = (ele_tags, node_tags, ele_row)
+        return self.ele_connectivity
+
+    def get_elements_between_nodes(self, node_i: int, node_j: int) -> tuple:
+        """
+        Function to query the grillage members between two nodes.
+
+        :param node_i: Node tag
+        :type node_i: int
+        :param node_j: Node tag
+        :type node_j: int
+        :returns: Tuple of lists of indices of elements in ``long_ele``, ``trans_ele`` and ``edge_span_ele``.
+        """
+        return self.node_pair_ele_index.get(
+            tuple(sorted([node_i, node_j])), ([], [], [])
+        )
+
+    def _create_grid_index(self):
+        """
+        Function to create a spatial index of grids in the x-z plane of the mesh. The plane is divided into
+        uniform buckets of the median grid size, each holding the grid numbers of grids whose bounding boxes
+        overlap the bucket. Grids containing a point are then searched within a single bucket.
+        """
+        self.grid_bounds = dict()  # {grid number: [x min, z min, x max, z max]}
+        for grid_tag, grid_nodes in self.grid_number_dict.items():
+            coords = np.array(
+                [self.node_spec[node_tag]["coordinate"] for node_tag in grid_nodes]
+            )
+            self.grid_bounds[grid_tag] = [
+                coords[:, 0].min(),
+                coords[:, 2].min(),
+                coords[:, 0].max(),
+                coords[:, 2].max(),
+            ]
+        # vertex arrays of grids, in order of grid_number_dict
+        grid_count = len(self.grid_number_dict)
+        self.grid_array_index = dict()  # {grid number: row of grid arrays}
+        self.grid_node_count = np.zeros(grid_count, dtype=int)
+        self.grid_vertices = np.zeros((grid_count, 4, 2))  # (grid, vertex, [x, z])
+        # vertices and node tags sorted counter clockwise from bottom left, see sort_vertices()
+        self.grid_sorted_vertices = np.zeros((grid_count, 4, 2))
+        self.grid_sorted_node_tags = np.zeros((grid_count, 4), dtype=int)
+        for row, (grid_tag, grid_nodes) in enumerate(self.grid_number_dict.items()):
+            point_list = [
+                Point(*self.node_spec[node_tag]["coordinate"])
+                for node_tag in grid_nodes
+            ]
+            sorted_points, sorted_node_tags = sort_vertices(point_list, grid_nodes)
+            # vertex order, repeating the last vertex of three node grids
+            order = list(range(len(grid_nodes))) + [-1] * (4 - len(grid_nodes))
+            self.grid_array_index[grid_tag] = row
+            self.grid_node_count[row] = len(grid_nodes)
+            self.grid_vertices[row] = [
+                [point_list[i].x, point_list[i].z] for i in order
+            ]
+            self.grid_sorted_vertices[row] = [
+                [sorted_points[i].x, sorted_points[i].z] for i in order
+            ]
+            self.grid_sorted_node_tags[row] = [sorted_node_tags[i] for i in order]
+        self.grid_index = dict()  # {(x bucket, z bucket): [grid numbers]}
+        self.grid_index_origin = [0, 0]
+        self.grid_index_size = [1, 1]
+        self.grid_index_tol = 0
+        self.grid_index_max_bucket = (-1, -1)
+        if not self.grid_bounds:
+            return
+        bounds = np.array(list(self.grid_bounds.values()))
+        self.grid_index_origin = [bounds[:, 0].min(), bounds[:, 1].min()]
+        extent = max(
+            bounds[:, 2].max() - bounds[:, 0].min(),
+            bounds[:, 3].max() - bounds[:, 1].min(),
+        )
+        self.grid_index_size = [
+            max(np.median(bounds[:, 2] - bounds[:, 0]), 1e-6 * extent, 1e-12),
+            max(np.median(bounds[:, 3] - bounds[:, 1]), 1e-6 * extent, 1e-12),
+        ]
+        # bounding boxes are padded to keep points on grid lines within round off of bucket edges
+        self.grid_index_tol = 1e-9 * max(extent, 1)
+        self.grid_index_max_bucket = self._get_grid_bucket(
+            bounds[:, 2].max() + self.grid_index_tol,
+            bounds[:, 3].max() + self.grid_index_tol,
+        )
+        tol = self.grid_index_tol
+        for grid_tag, (x_min, z_min, x_max, z_max) in self.grid_bounds.items():
+            i_min, j_min = self._get_grid_bucket(x_min - tol, z_min - tol)
+            i_max, j_max = self._get_grid_bucket(x_max + tol, z_max + tol)
+            for i in range(i_min, i_max + 1):
+                for j in range(j_min, j_max + 1):
+                    self.grid_index.setdefault((i, j), []).append(grid_tag)
+
+    def _get_grid_bucket(self, x: float, z: float) -> tuple:
+        return (
+            math.floor((x - self.grid_index_origin[0]) / self.grid_index_size[0]),
+            math.floor((z - self.grid_index_origin[1]) / self.grid_index_size[1]),
+        )
+
+    def get_grids_at_point(self, x: float, z: float) -> list:
+        """
+        Function to query the grids which may contain a point, from the spatial index of grids.
+
+        :param x: x coordinate of point
+        :type x: float
+        :param z: z coordinate of point
+        :type z: float
+        :returns: List of grid numbers, in ascending order, of grids with bounding box over the bucket of the point.
+        """
+        if x is None or z is None:
+            return []
+        return self.grid_index.get(self._get_grid_bucket(x, z), [])
+
+    def get_grids_in_bounds(
+        self, x_min: float, z_min: float, x_max: float, z_max: float
+    ) -> list:
+        """
+        Function to query the grids with bounding box overlapping a rectangular region, from the spatial index of
+        grids.
+
+        :param x_min: Minimum x coordinate of region
+        :type x_min: float
+        :param z_min: Minimum z coordinate of region
+        :type z_min: float
+        :param x_max: Maximum x coordinate of region
+        :type x_max: float
+        :param z_max: Maximum z coordinate of region
+        :type z_max: float
+        :returns: List of grid numbers, in order of ``grid_number_dict``.
+        """
+        tol = self.grid_index_tol
+        i_min, j_min = self._get_grid_bucket(x_min, z_min)
+        i_max, j_max = self._get_grid_bucket(x_max, z_max)
+        # buckets beyond the mesh are empty
+        i_min, j_min = max(i_min, 0), max(j_min, 0)
+        i_max = min(i_max, self.grid_index_max_bucket[0])
+        j_max = min(j_max, self.grid_index_max_bucket[1])
+        grids = set()
+        for i in range(i_min, i_max + 1):
+            for j in range(j_min, j_max + 1):
+                grids.update(self.grid_index.get((i, j), []))
+        return sorted(
+            [
+                grid_tag
+                for grid_tag in grids
+                if self.grid_bounds[grid_tag][0] <= x_max + tol
+                and self.grid_bounds[grid_tag][2] >= x_min - tol
+                and self.grid_bounds[grid_tag][1] <= z_max + tol
+                and self.grid_bounds[grid_tag][3] >= z_min - tol
+            ],
+            key=self.grid_array_index.get,
+        )
+
+    def get_grids_along_line(
+        self, x1: float, z1: float, x2: float, z2: float, start_grids: list = None
+    ) -> list:
+        """
+        Function to query the grids crossed by a line segment. Starting from grids which contain the end points of
+        the segment, the search walks across neighbouring grids of ``grid_vicinity_dict``, stepping only into grids
+        whose bounding box is crossed by the segment. The number of grids visited hence scales with the length of
+        the segment rather than the size of the mesh.
+
+        :param x1: x coordinate of start point
+        :type x1: float
+        :param z1: z coordinate of start point
+        :type z1: float
+        :param x2: x coordinate of end point
+        :type x2: float
+        :param z2: z coordinate of end point
+        :type z2: float
+        :param start_grids: Grid numbers of grids containing the start and end points of the segment. If not
+                            provided (e.g. an end point is off the mesh), bounding boxes of all grids are checked.
+        :type start_grids: list
+        :returns: List of grid numbers, in order of ``grid_number_dict``, of grids with bounding box crossed by the
+                  segment.
+        """
+        segment = (x1, z1, x2, z2)
+        if not start_grids:
+            start_grids = self.grid_bounds.keys()
+        start_grids = [
+            grid_tag
+            for grid_tag in start_grids
+            if self._check_line_in_grid_bounds(grid_tag, *segment)
+        ]
+        visited = set(start_grids)
+        grids_to_visit = list(visited)
+        while grids_to_visit:
+            grid_tag = grids_to_visit.pop()
+            for neighbour in self.grid_vicinity_dict.get(grid_tag, {}).values():
+                if neighbour in visited:
+                    continue
+                if self._check_line_in_grid_bounds(neighbour, *segment):
+                    visited.add(neighbour)
+                    grids_to_visit.append(neighbour)
+        return sorted(visited, key=self.grid_array_index.get)
+
+    def _check_line_in_grid_bounds(self, grid_tag, x1, z1, x2, z2) -> bool:
+        # clip the segment against the padded bounding box of grid, return True if any part of the segment remains
+        x_min, z_min, x_max, z_max = self.grid_bounds[grid_tag]
+        t_min, t_max = 0, 1
+        for start, delta, lower, upper in [
+            (x1, x2 - x1, x_min, x_max),
+            (z1, z2 - z1, z_min, z_max),
+        ]:
+            lower -= self.grid_index_tol
+            upper += self.grid_index_tol
+            if delta == 0:
+                if start < lower or start > upper:
+                    return False
+                continue
+            t_lower, t_upper = sorted(
+                [(lower - start) / delta, (upper - start) / delta]
+            )
+            t_min = max(t_min, t_lower)
+            t_max = min(t_max, t_upper)
+            if t_min > t_max:
+                return False
+        return True
 
     def _get_geo_transform_tag(self, ele_nodes: list, offset=None):
         # offset is not used in version 0.1.0
@@ -2449,6 +2728,8 @@ class ShellLinkMesh(Mesh):
 
         # meshing procedure to create beam offset element and tie it with rigid links to master nodes of model plane y=0
         self._create_offset_beam_element()
+        # index offset beam elements
+        self._create_element_index()
 
         # overwrite procedure to identify
         self._identify_common_z_group()
@@ -5,17 +5,23 @@ or executable py file. This is done by wrapping `OpenSeesPy` commands for creati
 This module also handles all load case assignment, analysis, and results by wrapping `OpenSeesPy` command for analysis
 """
 import ast
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 import dataclasses
 from dataclasses import dataclass
-from copy import deepcopy
+from copy import copy, deepcopy
 from datetime import datetime
 from itertools import combinations
 import logging
 import math
+import os
+import shutil
+import tempfile
 from typing import List, Tuple, Union, TYPE_CHECKING
 
 import numpy as np
 import openseespy.opensees as ops
+from scipy import sparse
 
 from ospgrillage.load import (
     CompoundLoad,
@@ -46,21 +52,26 @@ from ospgrillage.postprocessing import (
     plot_force,
 )
 from ospgrillage.utils import (
-    calculate_area_given_vertices,
-    check_dict_same_keys,
     check_intersect,
     check_point_in_grid,
+    clip_polygons,
     get_distance,
-    get_patch_centroid,
     intersection,
     is_between,
     line,
     solve_zeta_eta,
     sort_list_into_four_groups,
-    sort_vertices,
 )
 import xarray as xr
 
+try:
+    import netCDF4
+
+    _NETCDF4_AVAILABLE = True
+except ModuleNotFoundError:
+    # optional dependency of ResultStore, see pip install "ospgrillage[store]"
+    _NETCDF4_AVAILABLE = False
+
 if TYPE_CHECKING:
     ...
 
@@ -72,8 +83,13 @@ __all__ = [
     "OspGrillageShell",
     "create_grillage",
     "Analysis",
+    "AnalysisSession",
     "GrillageElement",
+    "InfluenceSurface",
+    "MovingLoadEnvelope",
+    "OutputRequest",
     "Results",
+    "ResultStore",
 ]
 
 
@@ -129,6 +145,27 @@ class _OpsProxy:
         name, args, kwargs = call
         getattr(self, name)(*args, **kwargs)
 
+    def _apply_nodal_loads(self, node_tags: np.ndarray, loads: np.ndarray) -> None:
+        """Apply a nodal load vector of :func:`_get_nodal_load_vector` to the active load pattern.
+
+        The ``load`` commands of all nodes are logged (and written in pyfile mode) as one block, and passed
+        straight to the module in live mode.
+        """
+        log = object.__getattribute__(self, "command_log")
+        filename = object.__getattribute__(self, "_filename")
+        calls = [
+            (node, *values) for node, values in zip(node_tags.tolist(), loads.tolist())
+        ]
+        lines = [_format_ops_cmd("load", args, {}) for args in calls]
+        log.extend(lines)
+        if filename is not None:
+            with open(filename, "a") as fh:
+                fh.write("".join(lines))
+        else:
+            load = object.__getattribute__(self, "_module").load
+            for args in calls:
+                load(*args)
+
     def __getattr__(self, name: str):
         def dispatch(*args, **kwargs):
             log = object.__getattribute__(self, "command_log")
@@ -144,6 +181,132 @@ class _OpsProxy:
         return dispatch
 
 
+def _get_nodal_load_vector(load_command: list, load_factor: float = 1) -> tuple:
+    """
+    Consolidates a list of ``("load", (node, *values), {})`` commands into an array-backed nodal load vector,
+    scaled by ``load_factor``. Load components at duplicated nodes are summed, and nodes are ordered by their
+    first load command.
+
+    :param load_command: List of load commands, e.g. ``load_command`` of a load case dict.
+    :type load_command: list
+    :returns: Tuple of node tag array (node,) and load array (node, dof)
+    """
+    if not load_command:
+        return np.zeros(0, dtype=int), np.zeros((0, 6))
+    load_array = np.array([args for _, args, _ in load_command], dtype=float)
+    node_tags, loads = _sum_nodal_loads(load_array[:, 0].astype(int), load_array[:, 1:])
+    if load_factor != 1:
+        loads *= load_factor
+    return node_tags, loads
+
+
+def _sum_nodal_loads(node_tags: np.ndarray, loads: np.ndarray) -> tuple:
+    """
+    Sums the rows of a load array (load, dof) with the same node tag, see :func:`_get_nodal_load_vector`.
+
+    :returns: Tuple of unique node tag array, ordered by first appearance, and summed load array
+    """
+    unique_tags, first_index, inverse = np.unique(
+        node_tags, return_index=True, return_inverse=True
+    )
+    # rank of each unique node by first appearance
+    order = np.argsort(first_index, kind="stable")
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    summed_loads = np.zeros((len(unique_tags), loads.shape[1]))
+    np.add.at(summed_loads, rank[inverse.ravel()], loads)
+    return unique_tags[order], summed_loads
+
+
+def _get_output_responses(output: dict = None) -> tuple:
+    """
+    Returns the node tags, element tags and responses to extract from the OpenSees domain for an output spec of
+    :func:`OspGrillage._get_output_spec`. Defaults to all responses of all nodes and elements in the domain.
+    """
+    if output is None:
+        return (
+            ops.getNodeTags(),
+            ops.getEleTags(),
+            ["disp", "vel", "accel", "localForces", "forces"],
+        )
+    return output["nodes"], output["elements"], output["responses"]
+
+
+def _replay_model_commands(model_command_list: list) -> None:
+    """Build the model in the OpenSees domain of a worker process from the command log of a live model."""
+    namespace = {"ops": ops, "np": np}
+    ops.wipe()
+    for line in model_command_list:
+        exec(line, namespace)
+
+
+def _evaluate_analysis_shard(
+    analysis_spec_list: list, factor_once: bool = False, **kwargs
+) -> list:
+    """
+    Evaluate a shard of analyses in the OpenSees domain of a worker process, see :func:`_replay_model_commands`.
+
+    :param analysis_spec_list: List of ``(analysis_name, [(node_tags, loads, load_factor), ...])`` tuples of
+        the nodal load vectors of the analyses, see :func:`Analysis.add_nodal_loads`.
+    :param factor_once: If True, evaluates the shard with a single factorisation, see :class:`AnalysisSession`.
+    :returns: List of ``(node_disp, node_vel, node_accel, ele_force, global_ele_force)`` tuples of dicts, in
+        the order of ``analysis_spec_list``.
+    """
+    analysis_list = []
+    time_series_counter = 1
+    pattern_counter = 1
+    for analysis_name, load_spec in analysis_spec_list:
+        analysis = Analysis(
+            analysis_name=analysis_name,
+            ops_grillage_name="worker",
+            pyfile=False,
+            node_counter=None,
+            ele_counter=None,
+            time_series_counter=time_series_counter,
+            pattern_counter=pattern_counter,
+            **kwargs,
+        )
+        for node_tags, loads, load_factor in load_spec:
+            analysis.add_nodal_loads(node_tags, loads, load_factor=load_factor)
+        time_series_counter = analysis.time_series_counter
+        pattern_counter = analysis.plain_counter
+        analysis_list.append(analysis)
+    AnalysisSession(
+        pattern_tag=pattern_counter,
+        time_series_tag=time_series_counter,
+        factor_once=factor_once,
+        **kwargs,
+    ).evaluate(analysis_list)
+    return [
+        (a.node_disp, a.node_vel, a.node_accel, a.ele_force, a.global_ele_force)
+        for a in analysis_list
+    ]
+
+
+# model of a worker process distributing load cases, see _set_distribution_model()
+_distribution_model = None
+
+
+def _set_distribution_model(model: "OspGrillage") -> None:
+    """Store the model used by :func:`_distribute_load_case_shard` in a worker process."""
+    global _distribution_model
+    _distribution_model = model
+
+
+def _distribute_load_case_shard(load_case_obj_list: list) -> list:
+    """
+    Distribute a shard of load cases to the nodes of the model of a worker process, see
+    :func:`_set_distribution_model`.
+
+    :param load_case_obj_list: List of :class:`~ospgrillage.load.LoadCase` objects.
+    :returns: List of load command lists, in the order of ``load_case_obj_list``.
+    """
+    return [
+        _distribution_model._distribute_load_types_to_model(load_case_obj=load_case_obj)
+        for load_case_obj in load_case_obj_list
+    ]
+
+
 def create_grillage(**kwargs):
     """
     Create a bridge deck grillage model.
@@ -171,6 +334,27 @@ def create_grillage(**kwargs):
     :param ext_to_int_dist: Distance between internal beams and exterior main beams.
         If a list of size 2 is provided, the two values are applied to the left and right side respectively.
     :type ext_to_int_dist: int, float, or list of int/float
+    :param system: Default OpenSees linear system of equations solver for analysis of the model, e.g.
+        ``"BandGeneral"`` (default), ``"BandSPD"``, ``"ProfileSPD"``, ``"SparseSPD"``, ``"UmfPack"``, or ``"auto"``.
+        See :func:`~ospgrillage.osp_grillage.OspGrillage.analyze`.
+    :type system: str
+    :param numberer: Default OpenSees DOF numberer for analysis of the model, e.g. ``"Plain"`` (default),
+        ``"RCM"``, or ``"AMD"``.
+    :type numberer: str
+    :param results_dtype: Numeric type of the stored results, ``numpy.float64`` (default) or ``numpy.float32``.
+    :type results_dtype: numpy.dtype
+    :param results_store: File name, or :class:`~ospgrillage.osp_grillage.ResultStore`, of a NetCDF4 file to which
+        results are appended as load cases are analysed, instead of keeping them in memory. Requires netCDF4.
+        Defaults to ``None``.
+    :type results_store: str or ResultStore
+    :param load_cache_size: Number of load distributions kept in the least recently used cache of distributed
+        loads, keyed by load type, rounded position and shape function. Defaults to ``4096``, ``0`` disables the
+        cache.
+    :type load_cache_size: int
+    :param lazy_load_distribution: If ``True``, load cases added with
+        :func:`~ospgrillage.osp_grillage.OspGrillage.add_load_case` are distributed to the nodes when they are
+        first analyzed, instead of when they are added. Defaults to ``False``.
+    :type lazy_load_distribution: bool
 
     Depending on the ``model_type`` argument, this function returns the relevant concrete class of
     :class:`~ospgrillage.osp_grillage.OspGrillage`.
@@ -197,6 +381,33 @@ class GrillageElement:
     a: list
 
 
+@dataclass
+class OutputRequest:
+    """
+    Class to specify the responses extracted and stored by :func:`~ospgrillage.osp_grillage.OspGrillage.analyze`.
+    Responses of nodes, elements and components not requested are neither extracted from OpenSees nor stored in
+    the results.
+
+    :param nodes: Node tags to record. Defaults to the nodes of ``members`` if provided, otherwise all nodes.
+        An empty list records no node responses.
+    :param elements: Element tags to record. Defaults to all elements if neither ``elements`` nor ``members``
+        are provided.
+    :param members: Member name strings (e.g. ``"interior_main_beam"``) of which elements (and nodes, if
+        ``nodes`` is not provided) are recorded, see :func:`~ospgrillage.osp_grillage.OspGrillage.get_element`.
+    :param components: Response component names to store, e.g. ``["y", "Mz_i", "Mz_j"]``. Node displacements,
+        velocities, accelerations and element forces are only extracted if any of their components are
+        requested. Defaults to all components of displacements and element forces, including velocities and
+        accelerations for transient analysis.
+    :param forces: Element forces to extract - ``"global"`` (default), ``"local"``, or ``"both"``.
+    """
+
+    nodes: list = None
+    elements: list = None
+    members: list = None
+    components: list = None
+    forces: str = "global"
+
+
 class OspGrillage:
     """
     Base class representing an OpenSees grillage structural model.
@@ -214,6 +425,9 @@ class OspGrillage:
     ``model_type``.
     """
 
+    # largest number of degrees of freedom solved with the banded solver for analyze(system="auto")
+    AUTO_BAND_DOF_LIMIT = 6000
+
     def __init__(
         self,
         bridge_name: str,
@@ -268,6 +482,23 @@ class OspGrillage:
         :type stitch_slab_elements: bool
         :param non_cont_spacing_x: Spacing or length of stitch elements for non-continuous spans.
         :type non_cont_spacing_x: float
+        :param system: Default OpenSees linear system of equations solver for analysis, or ``"auto"``.
+            See :func:`~ospgrillage.osp_grillage.OspGrillage.analyze`.
+        :type system: str
+        :param numberer: Default OpenSees DOF numberer for analysis. See
+            :func:`~ospgrillage.osp_grillage.OspGrillage.analyze`.
+        :type numberer: str
+        :param results_dtype: Numeric type of the stored results, ``numpy.float64`` (default) or ``numpy.float32``.
+        :type results_dtype: numpy.dtype
+        :param results_store: File name, or :class:`~ospgrillage.osp_grillage.ResultStore`, of a NetCDF4 file of
+            results appended as load cases are analysed. Defaults to ``None`` - results are kept in memory.
+        :type results_store: str or ResultStore
+        :param load_cache_size: Number of load distributions kept in the least recently used cache of distributed
+            loads. Defaults to ``4096``, ``0`` disables the cache.
+        :type load_cache_size: int
+        :param lazy_load_distribution: If ``True``, load cases are distributed to the nodes when first analyzed.
+            See :func:`~ospgrillage.osp_grillage.OspGrillage.add_load_case`. Defaults to ``False``.
+        :type lazy_load_distribution: bool
         :raises ValueError: If skew angle is greater than 90. If number of transverse grid lines is less than 2.
 
 
@@ -369,7 +600,8 @@ class OspGrillage:
 
         # dict for load cases and load types
         self.global_load_str = []  # store load() commands
-        self.global_patch_int_dict = dict()  # store patch intersection grid information
+        # store patch region within grids, [x, z] vertices of grid
+        self.global_patch_int_dict = dict()
         self.load_case_list = (
             []
         )  # list of dict, example [{'loadcase':LoadCase object, 'load_command': list of str}..]
@@ -395,6 +627,21 @@ class OspGrillage:
             "diagnostics", False
         )  # flag for diagnostics printed to terminal
 
+        # default solver options of analysis, None for the defaults of analyze()
+        self.system = kwargs.get("system", None)
+        self.numberer = kwargs.get("numberer", None)
+        # numeric type of stored results
+        self.results_dtype = kwargs.get("results_dtype", np.float64)
+        # on-disk store of results, a file name or ResultStore object
+        self.results_store = kwargs.get("results_store", None)
+        if isinstance(self.results_store, str):
+            self.results_store = ResultStore(self.results_store)
+        # least recently used cache of distributed loads, {cache key: distribution}
+        self.load_cache_size = kwargs.get("load_cache_size", 4096)
+        self.load_distribution_cache = OrderedDict()
+        # defer distribution of added load cases to analyze()
+        self.lazy_load_distribution = kwargs.get("lazy_load_distribution", False)
+
         # kwargs for rigid link modelling option
         self.model_type = kwargs.get(
             "model_type", "beam_only"
@@ -436,6 +683,8 @@ class OspGrillage:
         self.variable_command_list = []
         self.model_command_list = []  # to be populated
         self.analysis_command = None
+        # InfluenceSurface object, see build_influence_surfaces()
+        self.influence_surfaces = None
         self.global_ele_counter = self.Mesh_obj.element_counter
 
         # vars for spring
@@ -514,7 +763,11 @@ class OspGrillage:
         self._run_mesh_generation()
 
         # create the result object for the grillage model
-        self.results = Results(self.Mesh_obj)
+        self.results = Results(
+            self.Mesh_obj, dtype=self.results_dtype, store=self.results_store
+        )
+        # unit load responses of any previous model are invalid
+        self.influence_surfaces = None
         self._write_rigid_link()
 
     # function to run mesh generation
@@ -1073,6 +1326,7 @@ class OspGrillage:
                 node_tag_list=nodes,
                 materialtag=material_tag,
             )
+            self.Mesh_obj.add_element_nodes(ele_count, nodes)
             self.global_ele_counter += 1
             # removes boundary condition on nodes of node_list
             del self.Mesh_obj.edge_node_recorder[node_tag]
@@ -1129,36 +1383,11 @@ class OspGrillage:
         record_trans = []
         record_edge = []
         for combi in node_tag_combo:
-            long_mem_index = [
-                i
-                for i, x in enumerate(
-                    [
-                        combi[0] in n[1:3] and combi[1] in n[1:3]
-                        for n in self.Mesh_obj.long_ele
-                    ]
-                )
-                if x
-            ]
-            trans_mem_index = [
-                i
-                for i, x in enumerate(
-                    [
-                        combi[0] in n[1:3] and combi[1] in n[1:3]
-                        for n in self.Mesh_obj.trans_ele
-                    ]
-                )
-                if x
-            ]
-            edge_mem_index = [
-                i
-                for i, x in enumerate(
-                    [
-                        combi[0] in n[1:3] and combi[1] in n[1:3]
-                        for n in self.Mesh_obj.edge_span_ele
-                    ]
-                )
-                if x
-            ]
+            (
+                long_mem_index,
+                trans_mem_index,
+                edge_mem_index,
+            ) = self.Mesh_obj.get_elements_between_nodes(combi[0], combi[1])
             record_long = record_long + long_mem_index  # record
             record_trans = record_trans + trans_mem_index  # record
             record_edge = record_edge + edge_mem_index
@@ -1180,7 +1409,11 @@ class OspGrillage:
             loading_point = Point(x, y, z)
         elif isinstance(point, LoadPoint):
             loading_point = point
-        for grid_tag, grid_nodes in self.Mesh_obj.grid_number_dict.items():
+        # search only the grids indexed around the point
+        for grid_tag in self.Mesh_obj.get_grids_at_point(
+            loading_point.x, loading_point.z
+        ):
+            grid_nodes = self.Mesh_obj.grid_number_dict[grid_tag]
             # get grid nodes coordinate as named tuple Point
             point_list = []
             for node_tag in grid_nodes:
@@ -1231,14 +1464,20 @@ class OspGrillage:
         last_nd, last_grid = self._get_point_load_nodes(end_load_vertex)
 
         line_grid_intersect = dict()
-        # loop each grid check if line segment lies in grid
-        for grid_tag, grid_nodes in self.Mesh_obj.grid_number_dict.items():
-            point_list = []
-            # get coordinates of all nodes in grid
-            for node_tag in grid_nodes:
-                coord = self.Mesh_obj.node_spec[node_tag]["coordinate"]
-                coord_point = Point(coord[0], coord[1], coord[2])
-                point_list.append(coord_point)
+        # walk across grids crossed by the line segment, check if line segment lies in grid
+        line_grids = self.Mesh_obj.get_grids_along_line(
+            start_load_vertex.x,
+            start_load_vertex.z,
+            end_load_vertex.x,
+            end_load_vertex.z,
+            start_grids=(
+                [start_grid, last_grid]
+                if start_grid is not None and last_grid is not None
+                else None
+            ),
+        )
+        for grid_tag in line_grids:
+            grid_nodes = self.Mesh_obj.grid_number_dict[grid_tag]
             # get long, trans and edge elements in the grids. This is for searching intersection later on
             element_combi = combinations(grid_nodes, 2)
             long_ele_index, trans_ele_index, edge_ele_index = self._get_elements(
@@ -1291,7 +1530,7 @@ class OspGrillage:
         edited_dict = line_grid_intersect.copy()
         # if line does not intersect any grid, overwrite edited_dict
         if not edited_dict:
-            for key in self.Mesh_obj.grid_number_dict.keys():
+            for key in line_grids:
                 edited_dict.setdefault(
                     key,
                     {"long_intersect": [], "trans_intersect": [], "edge_intersect": []},
@@ -1330,27 +1569,19 @@ class OspGrillage:
         # i.e. where two vicinity grids with same intersection points are stored in edited_dict
 
         for grid_key, int_list in line_grid_intersect.items():
-            if grid_key not in removed_key:
-                check_dup_list = [
-                    int_list == val for val in line_grid_intersect.values()
-                ]
-                # if there are duplicates check_dup_list will be greater than 1,
-                # another case to remove if
-                if sum(check_dup_list) > 1:
-                    # check if grid key is a vicinity grid of current grid_key
-                    for dup_key in [
-                        key
-                        for (count, key) in enumerate(line_grid_intersect.keys())
-                        if check_dup_list[count] and key is not grid_key
-                    ]:
-                        if dup_key in [start_grid, last_grid]:
-                            continue
-                        elif (
-                            dup_key
-                            in self.Mesh_obj.grid_vicinity_dict[grid_key].values()
-                        ):
-                            removed_key.append(dup_key)
-                            del edited_dict[dup_key]
+            if grid_key in removed_key:
+                continue
+            # duplicates are only removed if grid is a vicinity grid of current grid_key
+            for dup_key in self.Mesh_obj.grid_vicinity_dict[grid_key].values():
+                if (
+                    dup_key == grid_key
+                    or dup_key in removed_key
+                    or dup_key in [start_grid, last_grid]
+                    or line_grid_intersect.get(dup_key) != int_list
+                ):
+                    continue
+                removed_key.append(dup_key)
+                del edited_dict[dup_key]
 
         return edited_dict, colinear_spec
 
@@ -1483,103 +1714,28 @@ class OspGrillage:
                 )  # Redge variable to be returned - as list
         return Rz, Rx, Redge, R_z_col, R_x_col, R_edge_col
 
-    # Getter for Patch loads
-    def _get_bounded_nodes(self, patch_load_obj):
-        # function to return nodes bounded by patch load
-        point_list = [
-            patch_load_obj.load_point_1,
-            patch_load_obj.load_point_2,
-            patch_load_obj.load_point_3,
-            patch_load_obj.load_point_4,
-        ]
-        bounded_node = []
-        bounded_grids = []
-        for node_tag, node_spec in self.Mesh_obj.node_spec.items():
-            coordinate = node_spec["coordinate"]
-            node = Point(coordinate[0], coordinate[1], coordinate[2])
-            flag = check_point_in_grid(node, point_list)
-            if flag:
-                # node is inside
-                bounded_node.append(node_tag)
-        # check if nodes form grid
-        for grid_number, grid_nodes in self.Mesh_obj.grid_number_dict.items():
-            check = all([nodes in bounded_node for nodes in grid_nodes])
-            if check:
-                bounded_grids.append(grid_number)
-        return bounded_node, bounded_grids
-
     # Setter for Point loads
     def _assign_load_to_four_node(self, point, mag, shape_func="linear"):
         """Assign point load to four nodes in quadrilateral element or grid"""
-        node_mx = []
-        node_mz = []
-        # search grid where the point lies in
-        grid_nodes, _ = self._get_point_load_nodes(point=point)
-        if grid_nodes is None:
-            load_str = []
-            return load_str
-        # if corner or edge grid with 3 nodes, run specific assignment for triangular grids
-        # extract coordinates
-        p1 = self.Mesh_obj.node_spec[grid_nodes[0]]["coordinate"]
-        p2 = self.Mesh_obj.node_spec[grid_nodes[1]]["coordinate"]
-        p3 = self.Mesh_obj.node_spec[grid_nodes[2]]["coordinate"]
-
-        point_list = [
-            Point(p1[0], p1[1], p1[2]),
-            Point(p2[0], p2[1], p2[2]),
-            Point(p3[0], p3[1], p3[2]),
-        ]
-        if len(grid_nodes) == 3:
-            sorted_list, sorted_node_tag = sort_vertices(point_list, grid_nodes)
-            Nv = ShapeFunction.linear_triangular(
-                x=point[0],
-                z=point[2],
-                x1=sorted_list[0].x,
-                z1=sorted_list[0].z,
-                x2=sorted_list[1].x,
-                z2=sorted_list[1].z,
-                x3=sorted_list[2].x,
-                z3=sorted_list[2].z,
-            )
-            node_load = [mag * n for n in Nv]
-            node_mx = np.zeros(len(node_load))
-            node_mz = np.zeros(len(node_load))
-        else:  # else run assignment for quadrilateral grids
-            # extract coordinates of fourth point
-            p4 = self.Mesh_obj.node_spec[grid_nodes[3]][
-                "coordinate"
-            ]  # get coordinate of fourth point
-            point_list.append(Point(p4[0], p4[1], p4[2]))
-            sorted_list, sorted_node_tag = sort_vertices(point_list, grid_nodes)
-            # mapping coordinates to natural coordinate, then finds eta (x) and zeta (z) of the point xp,zp
-            eta, zeta = solve_zeta_eta(
-                xp=point[0],
-                zp=point[2],
-                x1=sorted_list[0].x,
-                z1=sorted_list[0].z,
-                x2=sorted_list[1].x,
-                z2=sorted_list[1].z,
-                x3=sorted_list[2].x,
-                z3=sorted_list[2].z,
-                x4=sorted_list[3].x,
-                z4=sorted_list[3].z,
-            )
-
-            # access shape function of line load
-            if shape_func == "hermite":
-                Nv, Nmx, Nmz = ShapeFunction.hermite_shape_function_2d(eta, zeta)
-                node_mx = [mag * n for n in Nmx]
-                # Mz
-                node_mz = [mag * n for n in Nmz]
-            else:  # linear shaep function
-                Nv = ShapeFunction.linear_shape_function(eta, zeta)
-            # Nv, Nmx, Nmz = ShapeFunction.hermite_shape_function_2d(eta, zeta)
-            # Fy
-            node_load = [mag * n for n in Nv]
+        point_grid, node_tags, node_loads = self._distribute_point_loads(
+            x=[point[0]], z=[point[2]], mag=[mag], shape_func=[shape_func]
+        )
+        return self._get_point_load_commands(
+            point_grid[0], node_tags[0], node_loads[0], shape_func
+        )
 
+    def _get_point_load_commands(
+        self, grid_row: int, node_tags, node_loads, shape_func="linear"
+    ) -> list:
+        """Returns load commands of a point load distributed to the nodes of a grid"""
         load_str = []
+        if grid_row < 0:  # point outside mesh
+            return load_str
+        node_count = self.Mesh_obj.grid_node_count[grid_row]
+        node_tags = node_tags[:node_count].tolist()
+        node_load, node_mx, node_mz = node_loads[:node_count].T.tolist()
         if shape_func == "hermite":
-            for count, node in enumerate(sorted_node_tag):
+            for count, node in enumerate(node_tags):
                 load_str.append(
                     (
                         "load",
@@ -1588,12 +1744,144 @@ class OspGrillage:
                     )
                 )
         else:
-            for count, node in enumerate(sorted_node_tag):
+            for count, node in enumerate(node_tags):
                 load_str.append(
                     ("load", (node, 0, node_load[count], 0, 0, 0, 0), {})
                 )
         return load_str
 
+    def _locate_point_grids(self, x: np.ndarray, z: np.ndarray) -> np.ndarray:
+        """
+        Query the grids which encompass an array of points, as rows of the grid arrays of the mesh. As in
+        :func:`_get_point_load_nodes`, the last grid of ``grid_number_dict`` is taken for points on shared grid
+        lines. Returns -1 for points outside the mesh.
+        """
+        mesh = self.Mesh_obj
+        point_index = []
+        grid_row = []
+        for count, (xp, zp) in enumerate(zip(x.tolist(), z.tolist())):
+            if not (math.isfinite(xp) and math.isfinite(zp)):
+                continue
+            candidates = mesh.get_grids_at_point(xp, zp)
+            point_index += [count] * len(candidates)
+            grid_row += [mesh.grid_array_index[grid] for grid in candidates]
+        point_index = np.array(point_index, dtype=int)
+        grid_row = np.array(grid_row, dtype=int)
+        # sign of cross products of each grid edge with point, as in check_point_in_grid()
+        vertices = mesh.grid_vertices[grid_row]
+        next_vertices = np.roll(vertices, -1, axis=1)
+        signed_area = np.sum(
+            vertices[..., 0] * next_vertices[..., 1]
+            - next_vertices[..., 0] * vertices[..., 1],
+            axis=1,
+        )[:, None]
+        side = (z[point_index, None] - vertices[..., 1]) * (
+            next_vertices[..., 0] - vertices[..., 0]
+        ) - (x[point_index, None] - vertices[..., 0]) * (
+            next_vertices[..., 1] - vertices[..., 1]
+        )
+        outside = ((side < 0) & (signed_area >= 0)) | ((side > 0) & (signed_area < 0))
+        inside = ~outside.any(axis=1)
+        point_grid = np.full(len(x), -1, dtype=int)
+        np.maximum.at(point_grid, point_index[inside], grid_row[inside])
+        return point_grid
+
+    def _distribute_point_loads(self, x, z, mag, shape_func) -> tuple:
+        """
+        Distribute an array of point loads to the nodes of the grids they lie in.
+
+        :returns: Tuple of grid row of each point in the grid arrays of the mesh (-1 if outside the mesh), array
+            of sorted node tags of the grid (point, 4), and array of nodal loads (point, 4, [Fy, Mx, Mz]). Entries
+            beyond the node count of three node grids are zero loads.
+        """
+        mesh = self.Mesh_obj
+        x = np.asarray(x, dtype=float)
+        z = np.asarray(z, dtype=float)
+        mag = np.asarray(mag, dtype=float)
+        hermite = np.asarray(shape_func) == "hermite"
+        point_grid = self._locate_point_grids(x, z)
+        node_tags = mesh.grid_sorted_node_tags[point_grid]
+        node_loads = np.zeros((len(x), 4, 3))
+        vertices = mesh.grid_sorted_vertices[point_grid]
+        node_count = np.where(point_grid >= 0, mesh.grid_node_count[point_grid], 0)
+
+        # three node grids, linear triangular shape function
+        tri = node_count == 3
+        if tri.any():
+            v = vertices[tri]
+            Nv = ShapeFunction.linear_triangular(
+                x=x[tri],
+                z=z[tri],
+                x1=v[:, 0, 0],
+                z1=v[:, 0, 1],
+                x2=v[:, 1, 0],
+                z2=v[:, 1, 1],
+                x3=v[:, 2, 0],
+                z3=v[:, 2, 1],
+            )
+            node_loads[tri, :3, 0] = mag[tri, None] * np.stack(Nv, axis=-1)
+
+        # quadrilateral grids, mapping coordinates to natural coordinate eta (x) and zeta (z) of the points
+        quad = node_count == 4
+        if quad.any():
+            v = vertices[quad]
+            eta, zeta = solve_zeta_eta(x[quad], z[quad], *v.reshape(-1, 8).T)
+            Nv, Nmx, Nmz = ShapeFunction.hermite_shape_function_2d(eta, zeta)
+            Nv_linear = ShapeFunction.linear_shape_function(eta, zeta)
+            quad_hermite = hermite[quad][:, None]
+            Nv = np.where(
+                quad_hermite, np.stack(Nv, axis=-1), np.stack(Nv_linear, axis=-1)
+            )
+            node_loads[quad, :, 0] = mag[quad, None] * Nv
+            node_loads[quad, :, 1] = np.where(
+                quad_hermite, mag[quad, None] * np.stack(Nmx, axis=-1), 0
+            )
+            node_loads[quad, :, 2] = np.where(
+                quad_hermite, mag[quad, None] * np.stack(Nmz, axis=-1), 0
+            )
+        return point_grid, node_tags, node_loads
+
+    def distribute_point_loads(self, x, z, mag, shape_function="linear") -> np.ndarray:
+        """
+        Function to distribute an array of point loads to the nodes of the grillage mesh in a single vectorised
+        call. Each point load is distributed to the nodes of the grid it lies in, with the shape function of the
+        point load. Point loads outside the mesh are ignored.
+
+        :param x: x coordinates of point loads
+        :type x: array_like
+        :param z: z coordinates of point loads
+        :type z: array_like
+        :param mag: Magnitudes of point loads
+        :type mag: array_like
+        :param shape_function: Shape function, ``"linear"`` or ``"hermite"``, of all point loads or of each point
+            load. Defaults to ``"linear"``.
+        :type shape_function: str or array_like of str
+        :returns: Nodal load array of shape (node, 6) of forces and moments ``[Fx, Fy, Fz, Mx, My, Mz]``, summed
+            over the point loads. Rows are in order of node tags of
+            :func:`~ospgrillage.osp_grillage.OspGrillage.get_nodes`.
+        """
+        x = np.atleast_1d(np.asarray(x, dtype=float))
+        shape_function = np.broadcast_to(np.asarray(shape_function), x.shape)
+        point_grid, node_tags, node_loads = self._distribute_point_loads(
+            x=x,
+            z=np.atleast_1d(z),
+            mag=np.broadcast_to(mag, x.shape),
+            shape_func=shape_function,
+        )
+        node_row = {tag: row for row, tag in enumerate(self.Mesh_obj.node_spec.keys())}
+        nodal_loads = np.zeros((len(node_row), 6))
+        located = point_grid >= 0
+        rows = np.array(
+            [node_row[tag] for tag in node_tags[located].ravel().tolist()], dtype=int
+        )
+        # forces Fy and moments Mx, Mz
+        np.add.at(
+            nodal_loads,
+            (rows.reshape(-1, 1), [1, 3, 5]),
+            node_loads[located].reshape(-1, 3),
+        )
+        return nodal_loads
+
     # Setter for Line loads and above
     def _assign_line_to_four_node(
         self, line_load_obj, line_grid_intersect, line_ele_colinear
@@ -1728,129 +2016,185 @@ class OspGrillage:
 
     # setter for patch loads
     def _assign_patch_load(self, patch_load_obj: PatchLoading) -> list:
-        # searches grid that encompass the patch load
-        # use getter for line load, 4 times for each point
-        # between 4 dictionaries record the common grids as having the corners of the patch - to be evaluated different
-        bound_node, bound_grid = self._get_bounded_nodes(patch_load_obj)
-        patch_load_str = []  # final return str list
-        # assign patch for grids fully bounded by patch
-        for grid in bound_grid:
-            nodes = self.Mesh_obj.grid_number_dict[grid]  # read grid nodes
-            # get p value of each node
-            p_list = []
-            for tag in nodes:
-                coord = self.Mesh_obj.node_spec[tag]["coordinate"]
-                p = patch_load_obj.patch_mag_interpolate(
-                    coord[0], coord[2]
-                )  # object function returns array like
-                p_list.append(LoadPoint(coord[0], coord[1], coord[2], p))
-            # get centroid of patch on grid
-            xc, yc, zc = get_patch_centroid(p_list)
-            inside_point = Point(xc, yc, zc)
-            # volume = area of base x average height
-            A = self._get_node_area(inside_point=inside_point, p_list=p_list)
-            # _, A = calculate_area_given_four_points(inside_point, p_list[0], p_list[1], p_list[2], p_list[3])
-            mag = A * sum([point.p for point in p_list]) / len(p_list)
-            # assign point and mag to 4 nodes of grid
-            load_str = self._assign_load_to_four_node(
-                point=[xc, yc, zc], mag=mag, shape_func=patch_load_obj.shape_function
-            )
-            patch_load_str += load_str
-        # apply patch for full bound grids completed
-
-        # search the intersecting grids using line load function
-        intersect_grid_1, _ = self._get_line_load_nodes(
-            list_of_load_vertices=[
+        """
+        Returns load commands of a patch load. The patch is clipped against the grids of the mesh within its
+        bounding box. The area of each clipped region (shoelace formula) times the mean patch magnitude at its
+        vertices gives an equivalent point load at the magnitude weighted centroid of the vertices, which is
+        distributed to the grid nodes.
+        """
+        mesh = self.Mesh_obj
+        patch_points = [
+            point
+            for point in [
                 patch_load_obj.load_point_1,
                 patch_load_obj.load_point_2,
-            ]
-        )
-        intersect_grid_2, _ = self._get_line_load_nodes(
-            list_of_load_vertices=[
-                patch_load_obj.load_point_2,
-                patch_load_obj.load_point_3,
-            ]
-        )
-        intersect_grid_3, _ = self._get_line_load_nodes(
-            list_of_load_vertices=[
                 patch_load_obj.load_point_3,
                 patch_load_obj.load_point_4,
             ]
+            if point is not None
+        ]
+        patch_vertices = np.array([[point.x, point.z] for point in patch_points])
+        grids = mesh.get_grids_in_bounds(
+            *patch_vertices.min(axis=0), *patch_vertices.max(axis=0)
         )
-        intersect_grid_4, _ = self._get_line_load_nodes(
-            list_of_load_vertices=[
-                patch_load_obj.load_point_4,
-                patch_load_obj.load_point_1,
-            ]
+        if not grids:
+            return []
+        grid_rows = [mesh.grid_array_index[grid] for grid in grids]
+        grid_vertices = mesh.grid_sorted_vertices[grid_rows]
+        vertices, counts = clip_polygons(
+            patch_vertices, grid_vertices, tol=mesh.grid_index_tol
         )
-        # merging process of the intersect grid dicts
-        merged = check_dict_same_keys(intersect_grid_1, intersect_grid_2)
-        merged = check_dict_same_keys(merged, intersect_grid_3)
-        merged = check_dict_same_keys(merged, intersect_grid_4)
-        self.global_patch_int_dict.update(
-            merged
-        )  # save intersect grid dict to global dict
-
-        # all lines are ordered in path counter clockwise - sorted hereafter via sort_vertices
-        # get nodes in grid that are left (check inside variable greater than 0)
-        for grid, int_point_list in merged.items():  # [x y z]
-            grid_nodes = self.Mesh_obj.grid_number_dict[grid]  # read grid nodes
-            # get two grid nodes bounded by patch
-            node_in_grid = [
-                x
-                for x, y in zip(grid_nodes, [node in bound_node for node in grid_nodes])
-                if y
-            ]
-            node_list = int_point_list  # sort
-            p_list = []
-            # loop each int points - add extract coordinates, get patch magnitude using interpolation ,
-            # convert coordinate to namedtuple Loadpoint and append to point list p_list
-            for int_list in int_point_list.values():
-                for int_point in int_list:  # [x y z]
-                    p = (
-                        patch_load_obj.patch_mag_interpolate(int_point[0], int_point[2])
-                        if int_point != []
-                        else []
-                    )  # object function returns array like
-                    # p is array object, extract
-                    p_list.append(
-                        LoadPoint(int_point[0], int_point[1], int_point[2], p)
-                        if int_point != []
-                        else []
-                    )
-            # loop each node in grid points
-            for items in node_in_grid:
-                coord = self.Mesh_obj.node_spec[items]["coordinate"]
-                p = patch_load_obj.patch_mag_interpolate(
-                    coord[0], coord[2]
-                )  # object function returns array like
-                p_list.append(LoadPoint(coord[0], coord[1], coord[2], p))
-            # Loop each p_list object to find duplicates if any, remove duplicate
-            for count, point in enumerate(p_list):
-                dupe = [point == val for val in p_list]
-                # if duplicate, remove value
-                if sum(dupe) > 1:
-                    p_list.pop(count)
-            # sort points in counterclockwise
-            p_list, _ = sort_vertices(p_list)  # sort takes namedtuple
-            # get centroid of patch on grid
-            xc, yc, zc = get_patch_centroid(p_list)
-            inside_point = Point(xc, yc, zc)
-            # volume = area of base x average height
-            # _, A = calculate_area_given_four_points(inside_point, p_list[0], p_list[1], p_list[2], p_list[3])
-            A = self._get_node_area(inside_point=inside_point, p_list=p_list)
-            mag = A * sum([point.p for point in p_list]) / len(p_list)
-            # assign point and mag to 4 nodes of grid
-            load_str = self._assign_load_to_four_node(
-                point=[xc, yc, zc], mag=mag, shape_func=patch_load_obj.shape_function
+        index = np.arange(vertices.shape[1])
+        valid = index < counts[:, None]
+        next_index = np.where(index + 1 < counts[:, None], index + 1, 0)
+        x, z = vertices[..., 0], vertices[..., 1]
+        next_x = np.take_along_axis(x, next_index, axis=1)
+        next_z = np.take_along_axis(z, next_index, axis=1)
+        # area of patch within grid, shoelace formula as in calculate_area_given_vertices()
+        area = np.abs(np.sum(np.where(valid, x * next_z - next_x * z, 0), axis=1) / 2)
+        grid_x, grid_z = grid_vertices[..., 0], grid_vertices[..., 1]
+        grid_area = np.abs(
+            np.sum(
+                grid_x * np.roll(grid_z, -1, axis=1)
+                - np.roll(grid_x, -1, axis=1) * grid_z,
+                axis=1,
+            )
+            / 2
+        )
+        # patch magnitude at vertices of patch within grid
+        p = np.zeros(x.shape)
+        p[valid] = patch_load_obj.patch_mag_interpolate(x[valid], z[valid])
+        # centroid weighted by patch magnitude at vertices, as in get_patch_centroid()
+        sum_p = np.sum(p, axis=1)
+        sum_m = np.where(sum_p > 0, sum_p, 1)
+        xc = np.sum(p * x, axis=1) / sum_m
+        zc = np.sum(p * z, axis=1) / sum_m
+        # volume = area of base x average height
+        mag = area * sum_p / np.maximum(counts, 1)
+
+        # grids fully bounded by patch first, then grids on edges of patch in order of the patch edges
+        loaded = area > 1e-9 * grid_area
+        full = area >= (1 - 1e-9) * grid_area
+        first_edge = np.full(len(grids), len(patch_vertices))
+        for edge in reversed(range(len(patch_vertices))):
+            edge_vertices = patch_vertices[[edge, (edge + 1) % len(patch_vertices)]]
+            _, edge_counts = clip_polygons(
+                edge_vertices, grid_vertices, tol=mesh.grid_index_tol
+            )
+            first_edge[edge_counts > 0] = edge
+        order = np.lexsort((np.arange(len(grids)), np.where(full, -1, first_edge)))
+        order = order[loaded[order]]
+        # save patch region within grids to global dict
+        for i in order:
+            self.global_patch_int_dict[grids[i]] = vertices[i, : counts[i]].tolist()
+
+        # distribute equivalent point loads of all grids at once
+        point_grid, node_tags, node_loads = self._distribute_point_loads(
+            x=xc[order],
+            z=zc[order],
+            mag=mag[order],
+            shape_func=[patch_load_obj.shape_function] * len(order),
+        )
+        patch_load_str = []  # final return str list
+        for count in range(len(order)):
+            patch_load_str += self._get_point_load_commands(
+                point_grid[count],
+                node_tags[count],
+                node_loads[count],
+                patch_load_obj.shape_function,
             )
-            patch_load_str += load_str
         return patch_load_str
 
+    def _distribute_line_or_patch_load(
+        self, load_obj: Union[LineLoading, PatchLoading]
+    ) -> tuple:
+        """
+        Distribute a line or patch load to the model.
+
+        :returns: Tuple of load commands, and grid intersections of line loads distributed to grids (else None)
+        """
+        line_grid_intersect = None
+        if isinstance(load_obj, PatchLoading):
+            load_str = self._assign_patch_load(load_obj)
+        elif any(
+            [
+                load_obj.long_beam_ele_load_flag,
+                load_obj.trans_beam_ele_load_flag,
+            ]
+        ):
+            load_str = self._assign_beam_ele_line_load(line_load_obj=load_obj)
+        else:
+            (
+                line_grid_intersect,
+                line_ele_colinear,
+            ) = self._get_line_load_nodes(
+                line_load_obj=load_obj
+            )  # returns self.line_grid_intersect
+            load_str = self._assign_line_to_four_node(
+                load_obj,
+                line_grid_intersect=line_grid_intersect,
+                line_ele_colinear=line_ele_colinear,
+            )
+        return load_str, line_grid_intersect
+
     @staticmethod
-    def _get_node_area(inside_point, p_list) -> float:
-        A = calculate_area_given_vertices(p_list)
-        return A
+    def _get_load_cache_key(
+        load_obj: Union[PointLoad, LineLoading, PatchLoading], decimals: int = 9
+    ) -> tuple:
+        """
+        Returns the key of a load in the load distribution cache - the load type, its rounded load points and its
+        shape function. Point loads are distributed per unit magnitude, hence keyed without magnitude.
+        """
+        if isinstance(load_obj, PointLoad):
+            point = load_obj.load_point_1
+            return (
+                "point",
+                round(point.x, decimals),
+                round(point.z, decimals),
+                load_obj.shape_function,
+            )
+        # current load points, point_list is not updated when a moving load is moved
+        load_points = [
+            load_obj.load_point_1,
+            load_obj.load_point_2,
+            load_obj.load_point_3,
+            load_obj.load_point_4,
+            load_obj.load_point_5,
+            load_obj.load_point_6,
+            load_obj.load_point_7,
+            load_obj.load_point_8,
+        ]
+        key = (
+            type(load_obj).__name__,
+            tuple(
+                tuple(val if val is None else round(val, decimals) for val in point)
+                for point in load_points
+                if point is not None
+            ),
+            load_obj.shape_function,
+        )
+        if isinstance(load_obj, LineLoading):
+            key += (
+                load_obj.long_beam_ele_load_flag,
+                load_obj.trans_beam_ele_load_flag,
+            )
+        return key
+
+    def _get_cached_distribution(self, key: tuple):
+        """Returns the cached distribution of a load cache key, or None if not in cache"""
+        cached = self.load_distribution_cache.get(key, None)
+        if cached is not None:
+            self.load_distribution_cache.move_to_end(key)  # most recently used
+        return cached
+
+    def _cache_distribution(self, key: tuple, distribution):
+        """Stores a load distribution in the cache, evicting the least recently used distributions"""
+        if self.load_cache_size <= 0:
+            return
+        self.load_distribution_cache[key] = distribution
+        self.load_distribution_cache.move_to_end(key)
+        while len(self.load_distribution_cache) > self.load_cache_size:
+            self.load_distribution_cache.popitem(last=False)
 
     # ----------------------------------------------------------------------------------------------------------
     #  functions to add load case and load combination
@@ -1861,94 +2205,81 @@ class OspGrillage:
         load_str = []
         # check the input parameter type, set load_groups parameter according to its type
         if isinstance(load_case_obj, LoadCase):
-            load_groups = load_case_obj.load_groups
+            # loads of moving load increments are moved to the position of the increment here
+            load_groups = load_case_obj.get_load_groups()
         elif isinstance(load_case_obj.load_groups[0]["load"], CompoundLoad):
             load_groups = load_case_obj.load_groups[0]["load"].compound_load_obj_list
-        # loop through each load object
-        load_str = []
+        # list of load objects, with the load types within compound loads in place of compound loads
+        load_obj_list = []
         for load_dict in load_groups:
             load_obj = load_dict["load"]
-            # if compound load, distribute each individual load types within the compound load
             if isinstance(load_obj, CompoundLoad):
-                # load_obj is a Compound load class, start a nested loop through each load class within compound load
-                # nested loop through each load in compound load, assign and get
-                for nested_list_of_load in load_obj.compound_load_obj_list:
-                    if isinstance(nested_list_of_load, NodalLoad):
-                        load_str += [nested_list_of_load.get_nodal_load_call()]
-                    elif isinstance(nested_list_of_load, PointLoad):
-                        load_str += self._assign_load_to_four_node(
-                            point=list(nested_list_of_load.load_point_1)[:-1],
-                            mag=nested_list_of_load.load_point_1.p,
-                            shape_func=nested_list_of_load.shape_function,
-                        )
-                    elif isinstance(nested_list_of_load, LineLoading):
-                        if any(
-                            [
-                                nested_list_of_load.long_beam_ele_load_flag,
-                                nested_list_of_load.trans_beam_ele_load_flag,
-                            ]
-                        ):
-                            load_str += self._assign_beam_ele_line_load(
-                                line_load_obj=nested_list_of_load
-                            )
-                        else:
-                            (
-                                line_grid_intersect,
-                                line_ele_colinear,
-                            ) = self._get_line_load_nodes(
-                                line_load_obj=nested_list_of_load
-                            )  # returns self.line_grid_intersect
-                            self.global_line_int_dict.append(line_grid_intersect)
-                            load_str += self._assign_line_to_four_node(
-                                nested_list_of_load,
-                                line_grid_intersect=line_grid_intersect,
-                                line_ele_colinear=line_ele_colinear,
-                            )
-                    elif isinstance(nested_list_of_load, PatchLoading):
-                        load_str += self._assign_patch_load(nested_list_of_load)
-            # else, a single load type, assign it as it is
+                load_obj_list += load_obj.compound_load_obj_list
             else:
-                # run single assignment of load type (load_obj is a load class)
-                if isinstance(load_obj, NodalLoad):
-                    load_str += [load_obj.get_nodal_load_call()]
-                elif isinstance(load_obj, PointLoad):
-                    load_str += self._assign_load_to_four_node(
-                        point=list(load_obj.load_point_1)[:-1],
-                        mag=load_obj.load_point_1.p,
-                        shape_func=load_obj.shape_function,
-                    )
-                elif isinstance(load_obj, LineLoading):
-                    if any(
-                        [
-                            load_obj.long_beam_ele_load_flag,
-                            load_obj.trans_beam_ele_load_flag,
-                        ]
-                    ):
-                        load_str += self._assign_beam_ele_line_load(
-                            line_load_obj=load_obj
-                        )
-                    else:
-                        (
-                            line_grid_intersect,
-                            line_ele_colinear,
-                        ) = self._get_line_load_nodes(
-                            line_load_obj=load_obj
-                        )  # returns self.line_grid_intersect
-                        self.global_line_int_dict.append(line_grid_intersect)
-                        load_str += self._assign_line_to_four_node(
-                            load_obj,
-                            line_grid_intersect=line_grid_intersect,
-                            line_ele_colinear=line_ele_colinear,
-                        )
-                elif isinstance(load_obj, PatchLoading):
-                    load_str += self._assign_patch_load(load_obj)
+                load_obj_list.append(load_obj)
+        # distribute point loads per unit magnitude, from the distribution cache or in a single vectorised call
+        # {cache key: (grid row, node tags, unit node loads)}
+        point_distributions = dict()
+        new_point_loads = dict()  # {cache key: point load} of point loads not in cache
+        for load_obj in load_obj_list:
+            if isinstance(load_obj, PointLoad):
+                key = self._get_load_cache_key(load_obj)
+                cached = self._get_cached_distribution(key)
+                if cached is not None:
+                    point_distributions[key] = cached
+                elif key not in point_distributions:
+                    new_point_loads.setdefault(key, load_obj)
+        if new_point_loads:
+            new_point_load_list = list(new_point_loads.values())
+            point_grid, point_node_tags, point_node_loads = (
+                self._distribute_point_loads(
+                    x=[load_obj.load_point_1.x for load_obj in new_point_load_list],
+                    z=[load_obj.load_point_1.z for load_obj in new_point_load_list],
+                    mag=np.ones(len(new_point_load_list)),
+                    shape_func=[
+                        load_obj.shape_function for load_obj in new_point_load_list
+                    ],
+                )
+            )
+            for count, key in enumerate(new_point_loads.keys()):
+                point_distributions[key] = (
+                    point_grid[count],
+                    point_node_tags[count],
+                    point_node_loads[count],
+                )
+                self._cache_distribution(key, point_distributions[key])
+        # loop through each load object
+        load_str = []
+        for load_obj in load_obj_list:
+            if isinstance(load_obj, NodalLoad):
+                load_str += [load_obj.get_nodal_load_call()]
+            elif isinstance(load_obj, PointLoad):
+                grid_row, node_tags, unit_node_loads = point_distributions[
+                    self._get_load_cache_key(load_obj)
+                ]
+                load_str += self._get_point_load_commands(
+                    grid_row,
+                    node_tags,
+                    unit_node_loads * load_obj.load_point_1.p,
+                    shape_func=load_obj.shape_function,
+                )
+            elif isinstance(load_obj, (LineLoading, PatchLoading)):
+                key = self._get_load_cache_key(load_obj)
+                cached = self._get_cached_distribution(key)
+                if cached is None:
+                    cached = self._distribute_line_or_patch_load(load_obj)
+                    self._cache_distribution(key, cached)
+                distributed_load_str, line_grid_intersect = cached
+                if line_grid_intersect is not None:
+                    self.global_line_int_dict.append(line_grid_intersect)
+                load_str += distributed_load_str
 
         return load_str
 
     # ---------------------------------------------------------------
     # interface functions for load analysis utilities
     def add_load_case(
-        self, load_case_obj: Union[LoadCase, MovingLoad], load_factor=1
+        self, load_case_obj: Union[LoadCase, MovingLoad], load_factor=1, lazy=None
     ) -> None:
         """
         Function to add load cases to Ospllage grillage model. Function also adds moving load cases
@@ -1956,18 +2287,30 @@ class OspGrillage:
         :param load_factor: Optional load factor for the prescribed load case. Default = 1
         :param load_case_obj: LoadCase or MovingLoad object
         :type load_case_obj: LoadCase,MovingLoad
+        :param lazy: If ``True``, only the load case (or the increments of the moving load case) is recorded, and
+            its loads are distributed to the nodes when it is first selected in
+            :func:`~ospgrillage.osp_grillage.OspGrillage.analyze`. Defaults to ``lazy_load_distribution`` of the
+            model.
+        :type lazy: bool
 
         """
+        if lazy is None:
+            lazy = self.lazy_load_distribution
 
         if isinstance(load_case_obj, LoadCase):
-            # update the load command list of load case object
-            load_str = self._distribute_load_types_to_model(load_case_obj=load_case_obj)
+            # load commands of load case object, empty and pending until analyzed for lazy distribution
+            load_str = (
+                []
+                if lazy
+                else self._distribute_load_types_to_model(load_case_obj=load_case_obj)
+            )
             # store load case + load command in dict and add to load_case_list
             load_case_dict = {
                 "name": load_case_obj.name,
                 "loadcase": deepcopy(load_case_obj),
                 "load_command": load_str,
                 "load_factor": load_factor,
+                "pending": lazy,  # True until loads are distributed by analyze()
             }  # FORMATTING HERE
 
             self.load_case_list.append(load_case_dict)
@@ -1983,14 +2326,19 @@ class OspGrillage:
             # for each load case, find the load commands of load distribution
             for moving_load_case_list in moving_load_obj.moving_load_case:
                 for increment_load_case in moving_load_case_list:
-                    load_str = self._distribute_load_types_to_model(
-                        load_case_obj=increment_load_case
+                    load_str = (
+                        []
+                        if lazy
+                        else self._distribute_load_types_to_model(
+                            load_case_obj=increment_load_case
+                        )
                     )
                     increment_load_case_dict = {
                         "name": increment_load_case.name,
                         "loadcase": increment_load_case,
                         "load_command": load_str,
                         "load_factor": load_factor,
+                        "pending": lazy,
                     }
                     list_of_incr_load_case_dict.append(increment_load_case_dict)
                 self.moving_load_case_dict[moving_load_obj.name] = (
@@ -2017,7 +2365,44 @@ class OspGrillage:
         :type set_verbose: bool
         :param analysis_type: Type of OpenSees analysis to run. Defaults to ``"Static"``.
         :type analysis_type: str
-        :raises ValueError: If neither ``load_case`` nor ``all`` arguments are correctly provided.
+        :param factor_once: If ``True``, the stiffness matrix is assembled and factorised once, and all selected
+            load cases (including every increment of moving load cases) are solved by back substitution of their
+            load vectors. Only valid for linear static analysis. Defaults to ``False``.
+        :type factor_once: bool
+        :param influence_surfaces: If ``True``, responses of load cases are evaluated from the unit load response
+            matrices of :func:`~ospgrillage.osp_grillage.OspGrillage.build_influence_surfaces` without an OpenSees
+            solve. Cannot be combined with ``workers`` or ``factor_once``. Defaults to ``False``.
+        :type influence_surfaces: bool
+        :param workers: Number of worker processes. If greater than 1, the model is rebuilt from
+            ``model_command_list`` in each worker process, and the load cases and moving load increments are
+            sharded across the workers. Model commands executed directly with ``ops`` (not through the
+            OspGrillage model) are not replayed in workers. Load cases added with lazy distribution (see
+            :func:`~ospgrillage.osp_grillage.OspGrillage.add_load_case`) are also distributed in the worker
+            processes. Defaults to ``None`` - analyses run in this process.
+        :type workers: int
+        :param system: OpenSees linear system of equations solver, e.g. ``"BandGeneral"``, ``"BandSPD"``,
+            ``"ProfileSPD"``, ``"SparseSPD"``, or ``"UmfPack"``. If ``"auto"``, the solver and numberer are
+            selected based on the analysis type and size of the model. Defaults to the ``system`` of the model,
+            otherwise ``"BandGeneral"``.
+        :type system: str
+        :param numberer: OpenSees DOF numberer, e.g. ``"Plain"``, ``"RCM"``, or ``"AMD"``. Defaults to the
+            ``numberer`` of the model, otherwise ``"Plain"``.
+        :type numberer: str
+        :param output: Nodes, elements and response components to extract and store in the results. Pass as an
+            :class:`~ospgrillage.osp_grillage.OutputRequest` or a ``dict`` of its arguments. Results of load
+            cases analysed with different output requests should not be mixed - reset ``results`` in between.
+            Defaults to ``None`` - all responses of all nodes and elements are stored.
+        :type output: OutputRequest or dict
+        :param envelope: If ``True``, or a name string or list of name strings of moving load cases, the responses
+            of moving load increments are reduced into running maxima and minima as increments are analysed, and
+            are not stored in the results. Envelopes are obtained with
+            :func:`~ospgrillage.osp_grillage.OspGrillage.get_envelope`. Defaults to ``False``.
+        :type envelope: bool, str or list of str
+        :raises ValueError: If neither ``load_case`` nor ``all`` arguments are correctly provided, if
+            ``factor_once`` or ``influence_surfaces`` is requested for a non static analysis, if
+            ``influence_surfaces`` is combined with ``workers``, ``factor_once`` or pyfile mode, if ``output``
+            requests unknown nodes, elements, members or components, or if ``envelope`` is requested in pyfile
+            mode.
 
         """
         # analyze all load case defined in self.load_case_dict for OspGrillage instance
@@ -2027,6 +2412,39 @@ class OspGrillage:
         selected_load_case: list = kwargs.get("load_case", None)  #
         analysis_type = kwargs.get("analysis_type", "Static")
         step = kwargs.get("step", 1)  # default 1
+        factor_once = kwargs.get("factor_once", False)
+        if factor_once and analysis_type != "Static":
+            raise ValueError(
+                "factor_once= is only available for linear static analysis: hint: analysis_type='Static'"
+            )
+        workers = kwargs.get("workers", None)
+        envelope = kwargs.get("envelope", False)
+        if envelope and self.pyfile:
+            raise ValueError(
+                "envelope= requires responses of analyses, which are not extracted in pyfile mode: hint: "
+                "create_grillage(pyfile=False)"
+            )
+        store_results = self.results.store is not None
+        if store_results and self.pyfile:
+            raise ValueError(
+                "results_store requires responses of analyses, which are not extracted in pyfile mode: hint: "
+                "create_grillage(pyfile=False)"
+            )
+        use_influence_surfaces = kwargs.get("influence_surfaces", False)
+        if use_influence_surfaces:
+            if self.influence_surfaces is None:
+                raise ValueError(
+                    "No influence surfaces for model: hint: run build_influence_surfaces() first"
+                )
+            if analysis_type != "Static":
+                raise ValueError(
+                    "influence_surfaces= is only available for linear static analysis: hint: analysis_type='Static'"
+                )
+            if factor_once or (workers and workers > 1) or self.pyfile:
+                raise ValueError(
+                    "influence_surfaces= evaluates load cases without an OpenSees solve, and can not be combined "
+                    "with workers=, factor_once= or pyfile mode: hint: pass only one of these options"
+                )
         # check if any load cases are defined
         if self.load_case_list == [] and self.moving_load_case_dict == {}:
             raise ValueError("No load cases were defined")
@@ -2077,109 +2495,573 @@ class OspGrillage:
                 "missing kwargs for run options: hint: requires input for `load_case=`"
             )
 
-        # run basic load case
-        for load_case_dict in selected_basic_lc:
-            # create analysis object, run and get results
-            load_case_obj = load_case_dict["loadcase"]
-            load_command = load_case_dict["load_command"]
-            load_factor = load_case_dict["load_factor"]
-            load_case_analysis = Analysis(
-                analysis_name=load_case_obj.name,
-                analysis_type=analysis_type,
-                step=step,
-                ops_grillage_name=self.model_name,
-                pyfile=self.pyfile,
-                time_series_counter=self.global_time_series_counter,
-                pattern_counter=self.global_pattern_counter,
-                node_counter=self.Mesh_obj.node_counter,
-                ele_counter=self.Mesh_obj.element_counter,
-                constraint_type=self.constraint_type,
-                load_case=load_case_obj,
-                time_increment=kwargs.get("time_increment", 0.01),
-            )
-            load_case_analysis.add_load_command(load_command, load_factor=load_factor)
-            # run the Analysis object, collect results, and store Analysis object in the list for Analysis load case
-            (
-                self.global_time_series_counter,
-                self.global_pattern_counter,
-                node_disp,
-                ele_force,
-                self.analysis_command,
-            ) = load_case_analysis.evaluate_analysis()
+        system, numberer = self._get_solver_options(
+            system=kwargs.get("system", self.system),
+            numberer=kwargs.get("numberer", self.numberer),
+            analysis_type=analysis_type,
+        )
 
-            # print to terminal
-            if self.diagnostics:
-                logger.info("Analysis: %s completed", load_case_obj.name)
-            # store result in Recorder object
-            self.results.extract_analysis(analysis_obj=load_case_analysis)
+        # distribute selected load cases added with lazy load distribution
+        self._distribute_pending_load_cases(
+            list(selected_basic_lc)
+            + [
+                load_case_dict
+                for load_case_dict_list in (selected_moving_load_lc_list or {}).values()
+                for load_case_dict in load_case_dict_list
+            ],
+            workers=workers,
+        )
 
-        # run moving load case
-        # for moving_load_obj, load_case_dict_list in self.moving_load_case_dict.items():
+        # create analysis objects of basic load cases and of each increment of moving load cases
+        analysis_kwargs = dict(
+            analysis_type=analysis_type,
+            step=step,
+            time_increment=kwargs.get("time_increment", 0.01),
+            system=system,
+            numberer=numberer,
+            output=self._get_output_spec(
+                kwargs.get("output", None), analysis_type=analysis_type
+            ),
+        )
+        basic_analysis_list = [
+            self._create_analysis(load_case_dict, **analysis_kwargs)
+            for load_case_dict in selected_basic_lc
+        ]
+        moving_analysis_dict = dict()
+        enveloped_lc_dict = dict()  # moving load cases reduced into envelopes
+        stored_lc_dict = dict()  # moving load cases appended to the result store
+        if isinstance(envelope, str):
+            envelope = [envelope]
         if selected_moving_load_lc_list:
             for ml_name, load_case_dict_list in selected_moving_load_lc_list.items():
-                list_of_inc_analysis = []
-                for load_case_dict in load_case_dict_list:
-                    load_case_obj = load_case_dict["loadcase"]  # maybe unused
-                    load_command = load_case_dict["load_command"]
-                    load_factor = load_case_dict["load_factor"]
-                    incremental_analysis = Analysis(
-                        analysis_name=load_case_obj.name,
-                        analysis_type=analysis_type,
-                        step=step,
-                        ops_grillage_name=self.model_name,
-                        pyfile=self.pyfile,
-                        time_series_counter=self.global_time_series_counter,
-                        pattern_counter=self.global_pattern_counter,
-                        node_counter=self.Mesh_obj.node_counter,
-                        ele_counter=self.Mesh_obj.element_counter,
-                        constraint_type=self.constraint_type,
-                        load_case=load_case_obj,
-                        time_increment=kwargs.get("time_increment", 0.01),
-                    )
-                    incremental_analysis.add_load_command(
-                        load_command, load_factor=load_factor
-                    )
-                    (
-                        self.global_time_series_counter,
-                        self.global_pattern_counter,
-                        node_disp,
-                        ele_force,
-                        self.analysis_command,
-                    ) = incremental_analysis.evaluate_analysis()
-                    list_of_inc_analysis.append(incremental_analysis)
-                    if self.diagnostics:
-                        logger.info("Analysis: %s completed", load_case_obj.name)
-                    # store result in Recorder object
-                self.results.extract_analysis(list_of_inc_analysis=list_of_inc_analysis)
-                if self.diagnostics:
-                    logger.info("Analysis: %s completed", ml_name)
+                if envelope is True or (envelope and ml_name in envelope):
+                    enveloped_lc_dict[ml_name] = load_case_dict_list
+                    continue
+                if store_results:
+                    stored_lc_dict[ml_name] = load_case_dict_list
+                    continue
+                moving_analysis_dict[ml_name] = [
+                    self._create_analysis(load_case_dict, **analysis_kwargs)
+                    for load_case_dict in load_case_dict_list
+                ]
 
-    def add_load_combination(
-        self, load_combination_name: str, load_case_and_factor_dict: dict
-    ):
-        """
-        Function to add load combination to analysis. Load combinations are defined through a dict with
-        load case name str to be included in combination as keys, and load factor (type float/int) as value of dict.
+        # run analyses
+        analysis_list = basic_analysis_list + [
+            a for inc_list in moving_analysis_dict.values() for a in inc_list
+        ]
+        session = None
+        if not (use_influence_surfaces or self.pyfile or (workers and workers > 1)):
+            session = self._create_session(factor_once=factor_once, **analysis_kwargs)
+
+        def evaluate(analyses):
+            if use_influence_surfaces:
+                self.influence_surfaces.evaluate(analyses)
+            elif self.pyfile:
+                # each analysis writes its own executable py file
+                for analysis in analyses:
+                    self.analysis_command = analysis.evaluate_analysis()[-1]
+            elif workers and workers > 1:
+                self._evaluate_in_workers(
+                    analyses,
+                    workers=workers,
+                    factor_once=factor_once,
+                    **analysis_kwargs,
+                )
+            else:
+                for analysis in analyses:
+                    session.solve(analysis)
+                session.collect()
 
-        :param load_combination_name: Name string of load combination
-        :type load_combination_name: str
-        :param load_case_and_factor_dict: dict with name string of load cases within the combination as key,
-                                            corresponding load factor as value.
-        :type load_case_and_factor_dict: str
+        evaluate(analysis_list)
+        # store results of basic load cases in Results object
+        for load_case_analysis in basic_analysis_list:
+            if self.diagnostics:
+                logger.info("Analysis: %s completed", load_case_analysis.analysis_name)
+            self.results.extract_analysis(analysis_obj=load_case_analysis)
 
-        Example format of input dict for add_load_combination::
+        # moving load cases with envelopes are analysed in chunks of increments, each reduced into the
+        # running envelope and discarded
+        chunk_size = 64
+        for ml_name, load_case_dict_list in enveloped_lc_dict.items():
+            moving_envelope = MovingLoadEnvelope(
+                self.Mesh_obj, dtype=self.results_dtype
+            )
+            for start in range(0, len(load_case_dict_list), chunk_size):
+                inc_analysis_list = [
+                    self._create_analysis(load_case_dict, **analysis_kwargs)
+                    for load_case_dict in load_case_dict_list[
+                        start : start + chunk_size
+                    ]
+                ]
+                evaluate(inc_analysis_list)
+                moving_envelope.update(inc_analysis_list)
+            self.results.envelope_record[ml_name] = moving_envelope
+            if self.diagnostics:
+                logger.info("Envelope of analysis: %s completed", ml_name)
+        # moving load cases of a result store are analysed in chunks of increments, each appended to the store
+        for ml_name, load_case_dict_list in stored_lc_dict.items():
+            for start in range(0, len(load_case_dict_list), chunk_size):
+                inc_analysis_list = [
+                    self._create_analysis(load_case_dict, **analysis_kwargs)
+                    for load_case_dict in load_case_dict_list[
+                        start : start + chunk_size
+                    ]
+                ]
+                evaluate(inc_analysis_list)
+                self.results.extract_analysis(
+                    list_of_inc_analysis=inc_analysis_list,
+                    moving_load_name=ml_name,
+                    extend=start > 0,
+                )
+            if self.diagnostics:
+                logger.info("Analysis: %s completed", ml_name)
+        if session is not None:
+            session.close()
+            self.analysis_command = session.command_log
 
-            load_comb = {"name_of_load_case_1":1.2, "name_of_load_case_2": 1.5}
+        # store results of moving load cases
+        for ml_name, list_of_inc_analysis in moving_analysis_dict.items():
+            if self.diagnostics:
+                for incremental_analysis in list_of_inc_analysis:
+                    logger.info(
+                        "Analysis: %s completed", incremental_analysis.analysis_name
+                    )
+            self.results.extract_analysis(
+                list_of_inc_analysis=list_of_inc_analysis, moving_load_name=ml_name
+            )
+            if self.diagnostics:
+                logger.info("Analysis: %s completed", ml_name)
 
-        .. note::
+    def _get_output_spec(
+        self, output: Union[OutputRequest, dict] = None, analysis_type="Static"
+    ) -> Union[dict, None]:
+        """
+        Resolve an :class:`OutputRequest` into the node tags, element tags, responses and components to extract.
+        Responses are named after their OpenSees commands - ``"disp"``, ``"vel"``, ``"accel"`` for nodes, and
+        ``"localForces"``, ``"forces"`` for elements.
+
+        :returns: dict with keys ``"nodes"``, ``"elements"``, ``"responses"`` and ``"components"``, or None if
+            there is no output request (or the model is in pyfile mode, where no responses are extracted).
+        :raises ValueError: If the output request has unknown nodes, elements, members, components, or forces
+            option.
+        """
+        if output is None or self.pyfile:
+            return None
+        if isinstance(output, dict):
+            output = OutputRequest(**output)
+        if output.forces not in ["global", "local", "both"]:
+            raise ValueError(
+                "Unknown forces= option {} of output request: hint: 'global', 'local' or 'both'".format(
+                    output.forces
+                )
+            )
+        all_node_tags = ops.getNodeTags()
+        all_ele_tags = ops.getEleTags()
+        # elements of members
+        member_ele_tags = []
+        for member in output.members or []:
+            if member == "transverse_slab":
+                member_ele_tags += [ele[0] for ele in self.Mesh_obj.trans_ele]
+            elif member in ["start_edge", "end_edge"]:
+                member_ele_tags += self.get_element(member=member, options="elements")
+            elif member in self.common_grillage_element_z_group:
+                # all z groups of longitudinal members
+                for z_group_num in range(
+                    len(self.common_grillage_element_z_group[member])
+                ):
+                    member_ele_tags += self.get_element(
+                        member=member, options="elements", z_group_num=z_group_num
+                    )
+            else:
+                raise ValueError(
+                    "Unknown member {} of output request: hint: member names of get_element(member=)".format(
+                        member
+                    )
+                )
+        if output.elements is None and output.members is None:
+            ele_tags = list(all_ele_tags)
+        else:
+            requested = set(output.elements or []) | set(member_ele_tags)
+            ele_tags = [tag for tag in all_ele_tags if tag in requested]
+            if len(ele_tags) != len(requested):
+                raise ValueError(
+                    "Elements {} of output request are not in the model".format(
+                        sorted(requested - set(ele_tags))
+                    )
+                )
+        if output.nodes is not None:
+            requested = set(output.nodes)
+        elif output.members is not None:
+            _, connectivity, ele_row = self.Mesh_obj.get_element_connectivity()
+            member_nodes = connectivity[[ele_row[tag] for tag in member_ele_tags]]
+            requested = set(member_nodes[member_nodes >= 0].tolist())
+        else:
+            requested = set(all_node_tags)
+        node_tags = [tag for tag in all_node_tags if tag in requested]
+        if len(node_tags) != len(requested):
+            raise ValueError(
+                "Nodes {} of output request are not in the model".format(
+                    sorted(requested - set(node_tags))
+                )
+            )
+        # responses with requested components
+        force_responses = {
+            "global": ["forces"],
+            "local": ["localForces"],
+            "both": ["localForces", "forces"],
+        }[output.forces]
+        if output.components is None:
+            responses = ["disp"]
+            if analysis_type == "Transient":
+                responses += ["vel", "accel"]
+            responses += force_responses
+        else:
+            response_components = {
+                "disp": self.results.displacement_component,
+                "vel": self.results.vel_component,
+                "accel": self.results.acc_component,
+                "forces": self.results.force_component_shell,
+            }
+            unknown = set(output.components) - {
+                comp
+                for components in response_components.values()
+                for comp in components
+            }
+            if unknown:
+                raise ValueError(
+                    "Unknown components {} of output request: hint: components of displacements, velocity, "
+                    "acceleration or forces, e.g. 'y' or 'Mz_i'".format(sorted(unknown))
+                )
+            responses = [
+                response
+                for response in ["disp", "vel", "accel"]
+                if set(response_components[response]) & set(output.components)
+            ]
+            if set(response_components["forces"]) & set(output.components):
+                responses += force_responses
+        return {
+            "nodes": node_tags,
+            "elements": ele_tags,
+            "responses": responses,
+            "components": output.components,
+        }
 
-            As of release 0.1.0, load combinations can be directly obtained (calculated on the fly) by specifying
-            ``combination`` kwarg in :func:`~ospgrillage.osp_grillage.OspGrillage.get_results`. Hence, `add_combination`
-            is here for adding and storing information of load combination to  :class:`~ospgrillage.osp_grillage.OspGrillage`
-            object.
+    def _create_session(self, **kwargs) -> "AnalysisSession":
+        """
+        Create an :class:`AnalysisSession` for the model, reserving a load pattern and time series tag.
 
+        :returns: :class:`AnalysisSession`
         """
-        load_case_dict_list = []  # list of dict: structure of dict See line
+        session = AnalysisSession(
+            pattern_tag=self.global_pattern_counter,
+            time_series_tag=self.global_time_series_counter,
+            constraint_type=self.constraint_type,
+            **kwargs,
+        )
+        self.global_pattern_counter += 1
+        self.global_time_series_counter += 1
+        return session
+
+    def _get_solver_options(
+        self, system: str = None, numberer: str = None, analysis_type="Static"
+    ) -> Tuple[str, str]:
+        """
+        Returns the OpenSees system and numberer names for analysis, resolving ``system="auto"``.
+
+        For ``"auto"``, linear static analysis of models up to ``AUTO_BAND_DOF_LIMIT`` degrees of freedom use
+        the banded SPD solver with reverse Cuthill-McKee numbering. Larger models use the sparse SPD solver,
+        or the general sparse UmfPack solver for models with constraints handled by transformation
+        (shell-link models), for which the sparse SPD solver is not reliable. Other analysis types use the
+        general banded solver with RCM numbering.
+
+        :param system: Name of system, ``"auto"``, or None for the default.
+        :param numberer: Name of numberer, or None for the default.
+        :param analysis_type: Analysis type.
+        :returns: Tuple of system and numberer names.
+        """
+        if system == "auto":
+            if analysis_type != "Static":
+                auto_system = "BandGeneral"
+            elif len(self.Mesh_obj.node_spec) * 6 <= self.AUTO_BAND_DOF_LIMIT:
+                auto_system = "BandSPD"
+            elif self.constraint_type == "Plain":
+                auto_system = "SparseSPD"
+            else:
+                auto_system = "UmfPack"
+            return auto_system, numberer if numberer else "RCM"
+        return (
+            system if system else "BandGeneral",
+            numberer if numberer else "Plain",
+        )
+
+    def _distribute_pending_load_cases(self, load_case_dict_list: list, workers=None):
+        """
+        Distribute the loads of load case dicts added with lazy load distribution, i.e. flagged ``"pending"``,
+        storing their load commands in the load case dicts.
+
+        :param load_case_dict_list: Entries of ``load_case_list`` or of incremental lists in
+            ``moving_load_case_dict``
+        :type load_case_dict_list: list
+        :param workers: Number of worker processes to distribute the loads in. Defaults to ``None`` - loads are
+            distributed in this process.
+        :type workers: int
+        """
+        pending_list = [
+            load_case_dict
+            for load_case_dict in load_case_dict_list
+            if load_case_dict.get("pending", False)
+        ]
+        if not pending_list:
+            return
+        load_case_obj_list = [
+            load_case_dict["loadcase"] for load_case_dict in pending_list
+        ]
+        if workers and workers > 1 and len(pending_list) > 1:
+            workers = min(workers, len(pending_list))
+            chunk_size = math.ceil(len(pending_list) / workers)
+            shards = [
+                load_case_obj_list[start : start + chunk_size]
+                for start in range(0, len(load_case_obj_list), chunk_size)
+            ]
+            # workers need the mesh and load distribution methods, not the ops proxy, load cases or results
+            distribution_model = copy(self)
+            distribution_model._ops = None
+            distribution_model.results = None
+            distribution_model.influence_surfaces = None
+            distribution_model.load_case_list = []
+            distribution_model.moving_load_case_dict = dict()
+            distribution_model.load_combination_dict = dict()
+            distribution_model.load_distribution_cache = OrderedDict()
+            with ProcessPoolExecutor(
+                max_workers=len(shards),
+                initializer=_set_distribution_model,
+                initargs=(distribution_model,),
+            ) as executor:
+                load_str_list = [
+                    load_str
+                    for shard_load_str in executor.map(
+                        _distribute_load_case_shard, shards
+                    )
+                    for load_str in shard_load_str
+                ]
+        else:
+            load_str_list = [
+                self._distribute_load_types_to_model(load_case_obj=load_case_obj)
+                for load_case_obj in load_case_obj_list
+            ]
+        for load_case_dict, load_str in zip(pending_list, load_str_list):
+            load_case_dict["load_command"] = load_str
+            load_case_dict["pending"] = False
+        if self.diagnostics:
+            logger.info("Loads of %d load cases distributed", len(pending_list))
+
+    def _evaluate_in_workers(
+        self, analysis_list: list, workers: int, factor_once: bool = False, **kwargs
+    ):
+        """
+        Evaluate Analysis objects in a pool of worker processes, each with the model replayed from
+        ``model_command_list``. Analyses are sharded in contiguous chunks, and the responses of each
+        worker are stored back into the Analysis objects of this process.
+
+        :param analysis_list: Analysis objects with load commands added.
+        :type analysis_list: list
+        :param workers: Number of worker processes.
+        :type workers: int
+        """
+        if not analysis_list:
+            return
+        workers = min(workers, len(analysis_list))
+        chunk_size = math.ceil(len(analysis_list) / workers)
+        shards = [
+            analysis_list[start : start + chunk_size]
+            for start in range(0, len(analysis_list), chunk_size)
+        ]
+        with ProcessPoolExecutor(
+            max_workers=len(shards),
+            initializer=_replay_model_commands,
+            initargs=(list(self.model_command_list),),
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _evaluate_analysis_shard,
+                    [
+                        (
+                            analysis.analysis_name,
+                            [
+                                (*load_dict["nodal_loads"], load_dict["load_factor"])
+                                for load_dict in analysis.load_cases_dict_list
+                            ],
+                        )
+                        for analysis in shard
+                    ],
+                    factor_once=factor_once,
+                    constraint_type=self.constraint_type,
+                    **kwargs,
+                )
+                for shard in shards
+            ]
+            for shard, future in zip(shards, futures):
+                for analysis, responses in zip(shard, future.result()):
+                    (
+                        analysis.node_disp,
+                        analysis.node_vel,
+                        analysis.node_accel,
+                        analysis.ele_force,
+                        analysis.global_ele_force,
+                    ) = responses
+                if self.diagnostics:
+                    logger.info("Worker shard of %d analyses completed", len(shard))
+
+    def build_influence_surfaces(self, **kwargs):
+        """
+        Function to build influence surfaces of the grillage model. A unit load is solved at each degree of freedom
+        of every deck node in a single :class:`~ospgrillage.osp_grillage.AnalysisSession` with one factorisation of
+        the stiffness matrix, and the node displacements and element forces per unit load are stored in an :class:`~ospgrillage.osp_grillage.InfluenceSurface` object.
+
+        Once built, static :func:`~ospgrillage.osp_grillage.OspGrillage.analyze` evaluates the responses of
+        load cases and moving load increments as sparse matrix products of their nodal load vectors with the
+        response matrices, without an OpenSees solve.
+
+        :param node: List of node tags to apply unit loads to. Defaults to all nodes of the deck grids.
+        :type node: list
+        :param dof: List of degrees of freedom (1 to 6) to apply unit loads to. Defaults to ``[2, 4, 6]`` - the
+            vertical force and the two moments produced by the distribution of loads onto the deck.
+        :type dof: list
+        :param batch_size: Number of unit loads solved between storing of responses. Defaults to 200.
+        :type batch_size: int
+        :param system: OpenSees linear system of equations solver, see
+            :func:`~ospgrillage.osp_grillage.OspGrillage.analyze`.
+        :type system: str
+        :param numberer: OpenSees DOF numberer, see :func:`~ospgrillage.osp_grillage.OspGrillage.analyze`.
+        :type numberer: str
+        :returns: :class:`~ospgrillage.osp_grillage.InfluenceSurface`
+        :raises ValueError: If the model is in pyfile output mode.
+        """
+        if self.pyfile is None:
+            raise ValueError(
+                "Model not created: hint: run create_osp_model() before building influence surfaces"
+            )
+        if self.pyfile:
+            raise ValueError(
+                "Influence surfaces require the model instance in OpenSees: hint: create_osp_model(pyfile=False)"
+            )
+        node_list = kwargs.get(
+            "node",
+            sorted(
+                {
+                    node
+                    for grid_nodes in self.Mesh_obj.grid_number_dict.values()
+                    for node in grid_nodes
+                }
+            ),
+        )
+        dof_list = kwargs.get("dof", [2, 4, 6])
+        batch_size = kwargs.get("batch_size", 200)
+        system, numberer = self._get_solver_options(
+            system=kwargs.get("system", self.system),
+            numberer=kwargs.get("numberer", self.numberer),
+        )
+        if any(dof not in range(1, 7) for dof in dof_list):
+            raise ValueError("dof= accepts degrees of freedom 1 to 6")
+
+        influence_surfaces = InfluenceSurface(
+            unit_loads=[(node, dof) for node in node_list for dof in dof_list]
+        )
+        session = self._create_session(
+            factor_once=True, system=system, numberer=numberer
+        )
+        for start in range(0, len(influence_surfaces.unit_loads), batch_size):
+            unit_analysis_list = []
+            for node, dof in influence_surfaces.unit_loads[start : start + batch_size]:
+                unit_load = [0] * 6
+                unit_load[dof - 1] = 1
+                unit_analysis = Analysis(
+                    analysis_name="unit load {} dof {}".format(node, dof),
+                    ops_grillage_name=self.model_name,
+                    pyfile=self.pyfile,
+                    time_series_counter=self.global_time_series_counter,
+                    pattern_counter=self.global_pattern_counter,
+                    node_counter=self.Mesh_obj.node_counter,
+                    ele_counter=self.Mesh_obj.element_counter,
+                    constraint_type=self.constraint_type,
+                    system=system,
+                    numberer=numberer,
+                )
+                unit_analysis.add_load_command(
+                    [("load", (node, *unit_load), {})], load_factor=1
+                )
+                self.global_time_series_counter = unit_analysis.time_series_counter
+                self.global_pattern_counter = unit_analysis.plain_counter
+                unit_analysis_list.append(unit_analysis)
+            for unit_analysis in unit_analysis_list:
+                session.solve(unit_analysis)
+            session.collect()
+            influence_surfaces.add_unit_responses(unit_analysis_list)
+            if self.diagnostics:
+                logger.info(
+                    "Influence surfaces: %d of %d unit loads solved",
+                    start + len(unit_analysis_list),
+                    len(influence_surfaces.unit_loads),
+                )
+        session.close()
+        self.influence_surfaces = influence_surfaces
+        return influence_surfaces
+
+    def _create_analysis(self, load_case_dict: dict, **kwargs) -> "Analysis":
+        """
+        Create an :class:`Analysis` object for a load case dict of the model, adding its load commands and
+        updating the global time series and pattern counters of the model.
+
+        :param load_case_dict: Entry of ``load_case_list`` or of an incremental list in ``moving_load_case_dict``
+        :type load_case_dict: dict
+        :returns: :class:`Analysis`
+        """
+        load_case_obj = load_case_dict["loadcase"]
+        analysis = Analysis(
+            analysis_name=load_case_obj.name,
+            ops_grillage_name=self.model_name,
+            pyfile=self.pyfile,
+            time_series_counter=self.global_time_series_counter,
+            pattern_counter=self.global_pattern_counter,
+            node_counter=self.Mesh_obj.node_counter,
+            ele_counter=self.Mesh_obj.element_counter,
+            constraint_type=self.constraint_type,
+            load_case=load_case_obj,
+            **kwargs,
+        )
+        analysis.add_load_command(
+            load_case_dict["load_command"], load_factor=load_case_dict["load_factor"]
+        )
+        self.global_time_series_counter = analysis.time_series_counter
+        self.global_pattern_counter = analysis.plain_counter
+        return analysis
+
+    def add_load_combination(
+        self, load_combination_name: str, load_case_and_factor_dict: dict
+    ):
+        """
+        Function to add load combination to analysis. Load combinations are defined through a dict with
+        load case name str to be included in combination as keys, and load factor (type float/int) as value of dict.
+
+        :param load_combination_name: Name string of load combination
+        :type load_combination_name: str
+        :param load_case_and_factor_dict: dict with name string of load cases within the combination as key,
+                                            corresponding load factor as value.
+        :type load_case_and_factor_dict: str
+
+        Example format of input dict for add_load_combination::
+
+            load_comb = {"name_of_load_case_1":1.2, "name_of_load_case_2": 1.5}
+
+        .. note::
+
+            As of release 0.1.0, load combinations can be directly obtained (calculated on the fly) by specifying
+            ``combination`` kwarg in :func:`~ospgrillage.osp_grillage.OspGrillage.get_results`. Hence, `add_combination`
+            is here for adding and storing information of load combination to  :class:`~ospgrillage.osp_grillage.OspGrillage`
+            object.
+
+        """
+        load_case_dict_list = []  # list of dict: structure of dict See line
         # create dict with key (combination name) and val (list of dict of load cases)
         for (
             load_case_name,
@@ -2220,20 +3102,18 @@ class OspGrillage:
 
         :param combinations: Load combination definition. When provided, returns a modified DataSet
             computed from the specified combinations. Pass as a ``dict`` with load case name strings
-            as keys and load factors (``int`` or ``float``) as values.
-        :type combinations: dict, optional
+            as keys and load factors (``int`` or ``float``) as values, or a list of such dicts to evaluate
+            them along a ``Combination`` dimension, see :func:`~ospgrillage.osp_grillage.OspGrillage.get_combinations`.
+        :type combinations: dict or list of dict, optional
         :param save_file_name: File name for saving results to NetCDF format in the current working directory.
         :type save_file_name: str, optional
         :param load_case: Name string or list of name strings of specific load cases to extract.
             The returned DataSet contains only the specified load cases.
         :type load_case: str or list of str, optional
-        :returns: Xarray DataSet of analysis results. If ``combinations`` is provided, returns a list
-            of DataSets, one per load combination.
+        :returns: Xarray DataSet of analysis results. If ``combinations`` is a list, the DataSet has a
+            ``Combination`` dimension, one per load combination.
 
         """
-        # instantiate variables
-        list_of_moving_load_case = []
-        coordinate_name_list = None
         # get kwargs
         comb = kwargs.get("combinations", False)  # if Boolean true
         save_filename = kwargs.get("save_filename", None)  # str of file name
@@ -2247,126 +3127,213 @@ class OspGrillage:
         if isinstance(specific_load_case, str):
             specific_load_case = [specific_load_case]
 
-        # filter extract specific load case, overwriting basic da
+        # select specific load cases by their index along the Loadcase dimension, overwriting basic da
         if specific_load_case:
-            storing_da = None
-            for load_case_name in specific_load_case:
-                # lookup in basic load cases
-                namelist = [lc["name"] for lc in self.load_case_list]
-                for name in namelist:
-                    if load_case_name == name:
-                        extract_da = basic_da.sel(Loadcase=name)
-                        if storing_da is None:
-                            storing_da = extract_da
-                        else:  # storing_da is not none, concat in "loadcase" dimension
-                            storing_da = xr.concat(
-                                [storing_da, extract_da], dim="Loadcase"
-                            )
-                        if self.diagnostics:
-                            logger.debug("Extracted load case data for: %s", name)
-                # lookup in moving load cases
-                for moving_name in self.moving_load_case_dict.keys():
-                    if load_case_name == moving_name:
-                        # get all string of moving name, then slice
-                        incremental_lc_name_list = [
-                            a["name"] for a in self.moving_load_case_dict[moving_name]
-                        ]
-                        for name in incremental_lc_name_list:
-                            extract_da = basic_da.sel(Loadcase=name)
-                            if storing_da is None:
-                                storing_da = extract_da
-                            else:  # storing_da is not none, concat in "loadcase" dimension
-                                storing_da = xr.concat(
-                                    [storing_da, extract_da], dim="Loadcase"
-                                )
-
-            basic_da = (
-                storing_da  # Overwrite basic_da, proceed to check/evaluate combinations
-            )
+            index = self.results.get_load_case_index(specific_load_case)
+            if len(index) == 1:  # a single load case, without the Loadcase dimension
+                index = int(index[0])
+            elif np.all(np.diff(index) == 1):
+                # contiguous range, e.g. increments of a moving load case, selected as a view
+                index = slice(int(index[0]), int(index[-1]) + 1)
+            basic_da = basic_da.isel(Loadcase=index)
+            if self.diagnostics:
+                logger.debug("Extracted load case data for: %s", specific_load_case)
 
         # if combinations
         if comb:
-            # output_load_comb_dict = []  # {name: datarray, .... name: dataarray}
-            # load comb name,  load case in load comb
-            # this format: self.load_combination_dict.setdefault(load_combination_name, load_case_dict_list)
-            # comb = [{road:1.2, DL: 1.5},{} , {} ]
+            if isinstance(comb, list):
+                # list of combinations, evaluated along a Combination dimension
+                return self.get_combinations(comb, local_forces=local_force_flag)
             if not isinstance(comb, dict):
                 raise ValueError(
                     "Combination argument requires a dict or a list of dict: e.g. {'DL':1.2,'SIDL':1.5}"
                 )
-
-            # for load_case_dict_list in comb:  # {0:[{'loadcase':LoadCase object, 'load_command': list of str}
             if self.diagnostics:
                 logger.info("Obtaining load combinations")
+            load_case_names = list(comb.keys())
+            factors = np.array([[comb[name] for name in load_case_names]], dtype=float)
+            return self._combine_load_cases(
+                basic_da, factors, load_case_names, combination_names=[0]
+            ).isel(Combination=0, drop=True)
 
-            summation_array = None  # instantiate
-            factored_array = None  # instantiate
-            # check and add load cases to load combinations for basic non moving load cases
-            for (
-                load_case_name,
-                load_factor,
-            ) in (
-                comb.items()
-            ):  # [{'loadcase':LoadCase object, 'load_command': list of str}.]
-                # if load case is a moving load, skip to next step
-                if load_case_name in self.moving_load_case_dict.keys():
-                    list_of_moving_load_case.append(
-                        {load_case_name: load_factor}
-                    )  # store dict combination for later
-                    continue
+        else:
+            # return raw data array for manual post processing
+            if save_filename:
+                basic_da.to_netcdf(save_filename)
+            return basic_da
+
+    def get_combinations(self, combinations, **kwargs):
+        """
+        Function to evaluate many load combinations at once. Combinations are given as a factor matrix of
+        combinations by load cases (including moving load cases), and are evaluated with a single contraction of the
+        factors with the results over the ``Loadcase`` dimension. Result format is xarray DataSet with a
+        ``Combination`` dimension.
+
+        As in :func:`~ospgrillage.osp_grillage.OspGrillage.get_results`, the factored static load cases of a
+        combination are added to *each* increment of its moving load cases. If any combination has moving load
+        cases, the DataSet has a ``Loadcase`` dimension of the increments of all moving load cases of the
+        combinations, and the increments of moving load cases not in a combination hold its static load cases only.
+
+        :param combinations: Factor matrix. Pass as a ``dict`` of combination names to ``dict`` of load case name
+            strings and load factors, a list of such dicts (combinations are numbered), or an array-like of shape
+            (combination, load case) with the load case names given by ``load_case``.
+        :type combinations: dict, list or array-like
+        :param load_case: Load case names of the columns of an array-like factor matrix.
+        :type load_case: list of str
+        :param combination_names: Names of the rows of an array-like factor matrix. Defaults to numbering.
+        :type combination_names: list
+        :param local_forces: If ``True``, combine local element forces. Defaults to ``False``.
+        :type local_forces: bool
+        :returns: Xarray DataSet of load combinations
+        :raises ValueError: If the factor matrix does not match the load case names, or if a load case of the
+            combinations has not been analysed.
+        """
+        load_case_names = kwargs.get("load_case", None)
+        combination_names = kwargs.get("combination_names", None)
+        if isinstance(combinations, dict):
+            combination_names = list(combinations.keys())
+            combinations = list(combinations.values())
+        if isinstance(combinations, list) and all(
+            isinstance(comb, dict) for comb in combinations
+        ):
+            load_case_names = list(
+                dict.fromkeys(name for comb in combinations for name in comb)
+            )
+            factors = np.array(
+                [
+                    [comb.get(name, 0) for name in load_case_names]
+                    for comb in combinations
+                ],
+                dtype=float,
+            )
+        else:
+            factors = np.atleast_2d(np.asarray(combinations, dtype=float))
+            if load_case_names is None or len(load_case_names) != factors.shape[1]:
+                raise ValueError(
+                    "Factor matrix of shape {} does not match load case names: hint: provide load_case= with a "
+                    "name for each column".format(factors.shape)
+                )
+        if combination_names is None:
+            combination_names = list(range(factors.shape[0]))
+        basic_ds = self.results.compile_data_array(
+            local_force_option=kwargs.get("local_forces", False),
+            main_ele_tags=self.Mesh_obj.element_counter,
+        )
+        return self._combine_load_cases(
+            basic_ds, factors, list(load_case_names), combination_names
+        )
 
-                # load_case_name = load_case_dict['loadcase'].name
-                # if first load case, the first extracted array becomes the summation array
-                # TODO, coordinate is now Load case Object
-                if summation_array is None:
-                    summation_array = (
-                        basic_da.sel(Loadcase=load_case_name) * load_factor
+    def _combine_load_cases(
+        self,
+        basic_ds: xr.Dataset,
+        factors: np.ndarray,
+        load_case_names: list,
+        combination_names: list,
+    ) -> xr.Dataset:
+        """
+        Evaluates load combinations of a factor matrix (combination, load case) from a DataSet of results, see
+        :func:`get_combinations`.
+        """
+        if basic_ds is None:
+            raise ValueError("No results to combine: hint: run analyze() first")
+        loadcase_index = {
+            name: ind for ind, name in enumerate(basic_ds["Loadcase"].values.tolist())
+        }
+        # weights of static load cases, and factors and result rows of each moving load case
+        static_weights = np.zeros((factors.shape[0], len(loadcase_index)))
+        moving_list = []  # [(factor of combinations, rows of increments)]
+        increment_names = []
+        increment_rows = []
+        for col, name in enumerate(load_case_names):
+            if name in self.moving_load_case_dict:
+                names = [inc["name"] for inc in self.moving_load_case_dict[name]]
+                rows = [loadcase_index.get(inc_name) for inc_name in names]
+                if None in rows:
+                    raise ValueError(
+                        "Moving load case {} not in results: hint: analyze() it without envelope=".format(
+                            name
+                        )
                     )
-                else:  # add to summation array
-                    summation_array += (
-                        basic_da.sel(Loadcase=load_case_name) * load_factor
+                moving_list.append((factors[:, col], rows))
+                increment_names += names
+                increment_rows += rows
+            elif name in loadcase_index:
+                static_weights[:, loadcase_index[name]] += factors[:, col]
+            else:
+                raise ValueError(
+                    "Load case {} not in results: hint: analyze() the load case first".format(
+                        name
                     )
+                )
+        # contract only the load cases with factors, keeping NaN of others out of the combinations
+        static_rows = np.flatnonzero(static_weights.any(axis=0))
 
-            # check and add load cases to load combinations for moving load cases
-            # get the list of increm load case correspond to matching moving load case of load combination
-            # list_of_moving_load_case.append(self.moving_load_case_dict.get(load_case_name, []))
-            for moving_lc_combo_dict in list_of_moving_load_case:
-                coordinate_name_list = []
-                for moving_lc_name, load_factor in moving_lc_combo_dict.items():
-                    for incremental_load_case_dict in self.moving_load_case_dict[
-                        moving_lc_name
-                    ]:
-                        load_case_name = incremental_load_case_dict["name"]
-                        if factored_array is None:
-                            factored_array = (
-                                basic_da.sel(Loadcase=load_case_name) * load_factor
-                                + summation_array
-                            )
-                        else:
-                            factored_array = xr.concat(
-                                [
-                                    factored_array,
-                                    basic_da.sel(Loadcase=load_case_name) * load_factor
-                                    + summation_array,
-                                ],
-                                dim="Loadcase",
-                            )
-                        # store new coordinate name for load case
-                        coordinate_name_list.append(load_case_name)
-            # check if combination has moving load, if no, combination output is array summed among basic load case
-            if not factored_array:
-                combination_array = summation_array
-            else:  # comb has moving load, assign the coordinates along the load case dimension for identification
-                combination_array = factored_array.assign_coords(
-                    Loadcase=coordinate_name_list
+        data_vars = dict()
+        for var_name, data_array in basic_ds.data_vars.items():
+            if "Loadcase" not in data_array.dims:
+                data_vars[var_name] = data_array
+                continue
+            values = data_array.values
+            combined = np.tensordot(
+                static_weights[:, static_rows], values[static_rows], axes=(1, 0)
+            )
+            dims = ["Combination", *data_array.dims[1:]]
+            coords = {
+                dim: data_array[dim].values
+                for dim in data_array.dims[1:]
+                if dim in data_array.coords
+            }
+            coords["Combination"] = combination_names
+            if moving_list:
+                # static combination added to each factored increment of the moving load cases
+                combined = np.concatenate(
+                    [
+                        combined[:, None]
+                        + moving_factors.reshape((-1, 1) + (1,) * (values.ndim - 1))
+                        * values[rows][None]
+                        for moving_factors, rows in moving_list
+                    ],
+                    axis=1,
+                )
+                dims.insert(1, "Loadcase")
+                coords["Loadcase"] = increment_names
+                # positions of the increments, see Results.compile_data_array()
+                coords.update(
+                    {
+                        name: ("Loadcase", coord.values[increment_rows])
+                        for name, coord in basic_ds.coords.items()
+                        if coord.dims == ("Loadcase",) and name != "Loadcase"
+                    }
                 )
-            return combination_array
+            data_vars[var_name] = xr.DataArray(
+                combined.astype(values.dtype, copy=False), dims=dims, coords=coords
+            )
+        return xr.Dataset(data_vars)
 
-        else:
-            # return raw data array for manual post processing
-            if save_filename:
-                basic_da.to_netcdf(save_filename)
-            return basic_da
+    def get_envelope(self, load_case: str, **kwargs):
+        """
+        Function to get the envelope of a moving load case analysed with ``analyze(envelope=...)``. Result format
+        is xarray DataSet with the data variables of :func:`~ospgrillage.osp_grillage.OspGrillage.get_results`
+        along an ``Extrema`` dimension of ``"max"`` and ``"min"``, and ``<variable>_loadcase`` data variables of
+        the names of the increments where the extrema occur.
+
+        :param load_case: Name string of moving load case.
+        :type load_case: str
+        :param local_forces: If ``True``, envelope local element forces. Defaults to ``False``.
+        :type local_forces: bool
+        :returns: Xarray DataSet of envelope
+        :raises ValueError: If the moving load case was not analysed with an envelope.
+        """
+        if load_case not in self.results.envelope_record:
+            raise ValueError(
+                "No envelope for load case {}: hint: run analyze(envelope=True) for moving load cases".format(
+                    load_case
+                )
+            )
+        return self.results.envelope_record[load_case].compile_data_array(
+            local_force_option=kwargs.get("local_forces", False),
+            main_ele_tags=self.Mesh_obj.element_counter,
+        )
 
     def get_element(self, **kwargs) -> Union[List[float]]:
         """
@@ -2483,7 +3450,9 @@ class OspGrillage:
             self.load_case_list = []  # reset load case
 
         # remove all results
-        self.results = Results(self.Mesh_obj)  # reset results
+        self.results = Results(
+            self.Mesh_obj, dtype=self.results_dtype, store=self.results_store
+        )  # reset results
 
     @staticmethod
     def get_MCK():
@@ -2637,12 +3606,16 @@ class Analysis:
         # list recording load commands, time series and pattern for the input load case
         self.load_cases_dict_list = (
             []
-        )  # keys # [{time_series,pattern,load_command},... ]
+        )  # keys # [{time_series,pattern,nodal_loads,load_factor},... ]
         # counters
         self.time_series_counter = time_series_counter
         self.plain_counter = pattern_counter
         # variables from keyword args
         self.constraint_type = kwargs.get("constraint_type", "Plain")  # Default plain
+        self.system = kwargs.get("system", "BandGeneral")
+        self.numberer = kwargs.get("numberer", "Plain")
+        # responses to extract, see OspGrillage._get_output_spec(). Defaults to all nodes and elements
+        self.output = kwargs.get("output", None)
         # Variables recording results of analysis
         self.node_disp = dict()  # key node tag, val list of dof
         self.node_vel = dict()  # key node tag, val list of dof
@@ -2659,8 +3632,8 @@ class Analysis:
         )  # ditto for global ele force except only for shells
         self.mesh_node_counter = node_counter  # set node counter based on current Mesh
         self.mesh_ele_counter = ele_counter  # set ele counter based on current Mesh
-        # save deepcopy of load case object
-        self.load_cases_obj = deepcopy(load_case)
+        # reference to load case object, not modified by the analysis
+        self.load_cases_obj = load_case
         # var to store all eval command
         self.all_command = []
         # if true for pyfile, create pyfile for analysis command
@@ -2713,8 +3686,8 @@ class Analysis:
         """
         Add a load case with specified load commands and scaling factor.
 
-        Creates and registers a new load case by generating time series and
-        load pattern commands with the given load factor applied.
+        Load commands are consolidated into a nodal load vector, with the loads of
+        duplicated nodes summed, see :func:`add_nodal_loads`.
 
         Parameters
         ----------
@@ -2723,6 +3696,26 @@ class Analysis:
         load_factor : float
             Scaling factor to apply to all loads in this case.
         """
+        node_tags, loads = _get_nodal_load_vector(load_str)
+        self.add_nodal_loads(node_tags, loads, load_factor)
+
+    def add_nodal_loads(self, node_tags: np.ndarray, loads: np.ndarray, load_factor=1):
+        """
+        Add a load case given as a nodal load vector and scaling factor.
+
+        Creates and registers a new load case by generating time series and
+        load pattern commands with the given load factor applied. The nodal
+        loads are applied in bulk, with one load command per node.
+
+        Parameters
+        ----------
+        node_tags : numpy.ndarray
+            Tags of loaded nodes, without duplicates.
+        loads : numpy.ndarray
+            Array of load components (node, dof), in the order of ``node_tags``.
+        load_factor : float
+            Scaling factor to apply to all loads in this case.
+        """
         # create time series for added load case
         time_series = self._time_series_command(
             load_factor
@@ -2731,10 +3724,39 @@ class Analysis:
         time_series_dict = {
             "time_series": time_series,
             "pattern": pattern_command,
-            "load_command": load_str,
+            "nodal_loads": (node_tags, loads),
+            "load_factor": load_factor,
         }
         self.load_cases_dict_list.append(time_series_dict)  # add dict to list
 
+    def get_nodal_loads(self) -> tuple:
+        """
+        Returns the nodal load vector of all load cases of the analysis, scaled by their load factors, with the
+        loads of duplicated nodes summed.
+
+        Returns
+        -------
+        tuple
+            (node_tags, loads) arrays of shape (node,) and (node, dof).
+        """
+        if not self.load_cases_dict_list:
+            return np.zeros(0, dtype=int), np.zeros((0, 6))
+        if len(self.load_cases_dict_list) == 1:
+            load_dict = self.load_cases_dict_list[0]
+            node_tags, loads = load_dict["nodal_loads"]
+            return node_tags, loads * load_dict["load_factor"]
+        return _sum_nodal_loads(
+            np.concatenate(
+                [load_dict["nodal_loads"][0] for load_dict in self.load_cases_dict_list]
+            ),
+            np.concatenate(
+                [
+                    load_dict["nodal_loads"][1] * load_dict["load_factor"]
+                    for load_dict in self.load_cases_dict_list
+                ]
+            ),
+        )
+
     def evaluate_analysis(self):
         """
         Execute analysis or generate commands for the configured load cases.
@@ -2754,19 +3776,22 @@ class Analysis:
             for count in range(1, self.plain_counter - 1):
                 self._ops.remove("loadPattern", count)
 
+        # static load cases are solved from the undeformed state, independent of preceding analyses
+        if self.analysis_type == "Static":
+            self._ops.reset()
+
         for load_dict in self.load_cases_dict_list:
             self._ops._dispatch(load_dict["time_series"])
             self._ops._dispatch(load_dict["pattern"])
-            for call in load_dict["load_command"]:
-                self._ops._dispatch(call)
+            self._ops._apply_nodal_loads(*load_dict["nodal_loads"])
 
         # Analysis settings - call proxy directly
         if self.analysis_type == "Static":
             self._ops.integrator("LoadControl", 1)
         else:  # Transient
             self._ops.integrator("Newmark", self.gamma, self.beta)
-        self._ops.numberer("Plain")
-        self._ops.system("BandGeneral")
+        self._ops.numberer(self.numberer)
+        self._ops.system(self.system)
         self._ops.constraints(self.constraint_type)
         self._ops.algorithm("Linear")
         self._ops.analysis(self.analysis_type)
@@ -2785,6 +3810,42 @@ class Analysis:
             self._ops.command_log,
         )
 
+    @staticmethod
+    def evaluate_factor_once(analysis_list: list):
+        """
+        Execute a sequence of linear static load cases using a single factorisation of the stiffness matrix.
+
+        The Analysis objects are solved in an :class:`AnalysisSession` with ``factor_once=True``: the stiffness
+        matrix is assembled and factorised on the first load case, and every subsequent load case is a back
+        substitution of its load vector. Responses are stored in each :class:`Analysis` object.
+
+        .. note::
+
+            Only valid for linear elastic models under static analysis, where the stiffness matrix
+            does not change between load cases.
+
+        :param analysis_list: Analysis objects with load commands added via :func:`add_load_command`.
+        :type analysis_list: list
+        :returns: Command log of the analysis commands.
+        """
+        if not analysis_list:
+            return []
+        lead = analysis_list[0]
+        # tags past those reserved by the load cases of every Analysis object
+        session = AnalysisSession(
+            pattern_tag=max(analysis.plain_counter for analysis in analysis_list),
+            time_series_tag=max(
+                analysis.time_series_counter for analysis in analysis_list
+            ),
+            step=lead.step,
+            constraint_type=lead.constraint_type,
+            system=lead.system,
+            numberer=lead.numberer,
+            factor_once=True,
+            output=lead.output,
+        )
+        return session.evaluate(analysis_list)
+
     # function to extract grillage model responses (dx,dy,dz,rotx,roty,rotz,N,Vy,Vz,Mx,My,Mz) and store to Result class
     def extract_grillage_responses(self):
         """
@@ -2794,21 +3855,24 @@ class Analysis:
         :returns: None. Results are stored in the ``global_ele_force`` and ``node_disp`` instance variables.
         """
         if not self.pyfile:
+            node_tags, ele_tags, responses = _get_output_responses(self.output)
             # first loop extract node displacements
-            for node_tag in ops.getNodeTags():
-                disp_list = ops.nodeDisp(node_tag)
-                vel_list = ops.nodeVel(node_tag)
-                accel_list = ops.nodeAccel(node_tag)
-                self.node_disp.setdefault(node_tag, disp_list)
-                self.node_vel.setdefault(node_tag, vel_list)
-                self.node_accel.setdefault(node_tag, accel_list)
+            for node_tag in node_tags:
+                if "disp" in responses:
+                    self.node_disp.setdefault(node_tag, ops.nodeDisp(node_tag))
+                if "vel" in responses:
+                    self.node_vel.setdefault(node_tag, ops.nodeVel(node_tag))
+                if "accel" in responses:
+                    self.node_accel.setdefault(node_tag, ops.nodeAccel(node_tag))
 
             # loop through all elements in Mesh, extract local forces
-            for ele_tag in ops.getEleTags():
-                ele_force = ops.eleResponse(ele_tag, "localForces")
-                self.ele_force.setdefault(ele_tag, ele_force)
-                global_ele_force = ops.eleResponse(ele_tag, "forces")
-                self.global_ele_force.setdefault(ele_tag, global_ele_force)
+            for ele_tag in ele_tags:
+                if "localForces" in responses:
+                    ele_force = ops.eleResponse(ele_tag, "localForces")
+                    self.ele_force.setdefault(ele_tag, ele_force)
+                if "forces" in responses:
+                    global_ele_force = ops.eleResponse(ele_tag, "forces")
+                    self.global_ele_force.setdefault(ele_tag, global_ele_force)
         else:
             logger.info(
                 "OspGrillage is at output mode (pyfile=True). Procedure for %s generated.",
@@ -2816,20 +3880,575 @@ class Analysis:
             )
 
 
+class AnalysisSession:
+    """
+    Class to hold a persistent OpenSees analysis for a sequence of load cases, e.g. the incremental load cases of
+    a moving load analysis. Analysis class objects are evaluated in a session created by the OspGrillage class.
+
+    The analysis (integrator, numberer, system, constraints and algorithm) is set up once for the session, and a
+    single load pattern is kept active. Between load cases, only the loads of this pattern are replaced.
+    If ``factor_once`` is True, the stiffness matrix is assembled and factorised for the first load case only,
+    and subsequent static load cases are solved by back substitution of their load vectors.
+
+    For static analyses, responses are extracted in bulk by OpenSees binary recorders of node displacements and
+    element forces, which write one record per solve. The records are read into arrays and stored in the
+    Analysis objects on :func:`collect` (called by :func:`close`), instead of querying ``nodeDisp()`` and
+    ``eleResponse()`` of each node and element through Python after every solve.
+    """
+
+    def __init__(
+        self,
+        pattern_tag: int,
+        time_series_tag: int,
+        analysis_type="Static",
+        step: int = 1,
+        constraint_type="Plain",
+        system="BandGeneral",
+        numberer="Plain",
+        factor_once: bool = False,
+        **kwargs,
+    ):
+        self.pattern_tag = pattern_tag
+        self.time_series_tag = time_series_tag
+        self.analysis_type = analysis_type
+        self.step = int(step)
+        self.constraint_type = constraint_type
+        self.system = system
+        self.numberer = numberer
+        self.factor_once = factor_once
+        # default newmark parameters for Average Accelerations
+        self.gamma = 0.5
+        self.beta = 1 / 6 if kwargs.get("linear_acceleration") else 0.25
+        self.time_increment = kwargs.get("time_increment", 0.01)
+        self.is_setup = False
+        self._ops = _OpsProxy(ops)
+        self.command_log = self._ops.command_log
+        # responses to extract, see OspGrillage._get_output_spec(). Defaults to all nodes and elements
+        self.output = kwargs.get("output", None)
+        # bulk response extraction via recorders, static analyses only
+        self.record_responses = self.analysis_type == "Static"
+        self.recorder_dir = None
+        self._recorder_tags = []
+        self._record_count = 0
+        self._pending_analysis = []  # list of (Analysis, record row)
+
+    def setup(self):
+        """
+        Sets up the analysis in OpenSees, removing all existing load patterns of the domain.
+        """
+        self._ops.wipeAnalysis()
+        for pattern_tag in ops.getPatterns():
+            self._ops.remove("loadPattern", pattern_tag)
+        self._ops.timeSeries("Constant", self.time_series_tag, "-factor", 1.0)
+        if self.analysis_type == "Static":
+            self._ops.integrator("LoadControl", 1)
+        else:  # Transient
+            self._ops.integrator("Newmark", self.gamma, self.beta)
+        self._ops.numberer(self.numberer)
+        self._ops.system(self.system)
+        self._ops.constraints(self.constraint_type)
+        if self.factor_once:
+            self._ops.algorithm("Linear", "-factorOnce")
+        else:
+            self._ops.algorithm("Linear")
+        self._ops.analysis(self.analysis_type)
+        if self.record_responses:
+            self.node_tags, self.ele_tags, self.responses = _get_output_responses(
+                self.output
+            )
+            self.ndf = len(ops.nodeDisp(ops.getNodeTags()[0]))
+            # offsets of each element's response within a record, element response sizes are fixed per element
+            self.ele_force_offsets = {
+                response: np.cumsum(
+                    [0] + [len(ops.eleResponse(tag, response)) for tag in self.ele_tags]
+                )
+                for response in ["localForces", "forces"]
+                if response in self.responses
+            }
+            self.recorder_dir = tempfile.mkdtemp(prefix="ospgrillage_")
+            self._add_recorders()
+        self.is_setup = True
+
+    def _add_recorders(self):
+        """
+        Adds binary recorders of node displacements, local and global element forces to the OpenSees domain.
+        Recorders are created directly in OpenSees and are not part of the command log.
+        """
+        if "disp" in self.responses and self.node_tags:
+            self._recorder_tags.append(
+                ops.recorder(
+                    "Node",
+                    "-binary",
+                    os.path.join(self.recorder_dir, "disp.bin"),
+                    "-node",
+                    *self.node_tags,
+                    "-dof",
+                    *range(1, self.ndf + 1),
+                    "disp",
+                )
+            )
+        if self.ele_tags:
+            for response in self.ele_force_offsets:
+                self._recorder_tags.append(
+                    ops.recorder(
+                        "Element",
+                        "-binary",
+                        os.path.join(self.recorder_dir, response + ".bin"),
+                        "-ele",
+                        *self.ele_tags,
+                        response,
+                    )
+                )
+        self._record_count = 0
+
+    def _remove_recorders(self):
+        """
+        Removes the recorders of the session, closing and flushing their files.
+        """
+        for recorder_tag in self._recorder_tags:
+            ops.remove("recorder", recorder_tag)
+        self._recorder_tags = []
+
+    def _read_records(self, response: str, record_size: int) -> np.ndarray:
+        """
+        Reads a binary recorder file. Each record is written as ``record_size`` doubles followed by a newline.
+
+        :returns: Array of shape (number of records, ``record_size``)
+        """
+        record_dtype = np.dtype(
+            [("values", np.float64, (record_size,)), ("end", np.uint8)]
+        )
+        return np.fromfile(
+            os.path.join(self.recorder_dir, response + ".bin"), dtype=record_dtype
+        )["values"]
+
+    def solve(self, analysis: "Analysis"):
+        """
+        Replaces the loads of the active pattern with the load commands of an Analysis object, runs the analysis
+        and extracts the responses into the Analysis object. Recorded responses of static analyses are stored in
+        the Analysis object on :func:`collect`.
+
+        :param analysis: Analysis object with load commands added via :func:`Analysis.add_load_command`.
+        :type analysis: :class:`Analysis`
+        """
+        if not self.is_setup:
+            self.setup()
+        self._ops.remove("loadPattern", self.pattern_tag)
+        self._ops.pattern("Plain", self.pattern_tag, self.time_series_tag)
+        self._ops._apply_nodal_loads(*analysis.get_nodal_loads())
+        if self.analysis_type == "Static":
+            # static load cases are solved from the undeformed state, independent of preceding load cases
+            self._ops.reset()
+            self._ops.analyze(self.step)
+        else:  # Transient
+            self._ops.analyze(self.step, self.time_increment)
+        # recorders write a record for each committed step of the load case, counted by the pseudo time
+        recorded_steps = int(round(ops.getTime())) if self.record_responses else 0
+        if recorded_steps:
+            self._record_count += recorded_steps
+            self._pending_analysis.append((analysis, self._record_count - 1))
+        else:
+            analysis.extract_grillage_responses()
+
+    def collect(self):
+        """
+        Reads the responses recorded since the last collect, and stores them in the ``node_disp``,
+        ``node_vel``, ``node_accel``, ``ele_force`` and ``global_ele_force`` variables of the solved Analysis objects.
+        """
+        if not self._pending_analysis:
+            return
+        self._remove_recorders()
+        node_disp = None
+        if "disp" in self.responses and self.node_tags:
+            node_disp = self._read_records("disp", len(self.node_tags) * self.ndf)
+        ele_force_records = {}
+        if self.ele_tags:
+            for response, offsets in self.ele_force_offsets.items():
+                ele_force_records[response] = (
+                    self._read_records(response, offsets[-1]),
+                    list(zip(self.ele_tags, offsets[:-1], offsets[1:])),
+                )
+        zero_resp = np.zeros((len(self.node_tags), self.ndf))
+        for analysis, row in self._pending_analysis:
+            if node_disp is not None:
+                analysis.node_disp = dict(
+                    zip(self.node_tags, node_disp[row].reshape(-1, self.ndf).tolist())
+                )
+            # static analyses have no velocity and acceleration
+            if "vel" in self.responses:
+                analysis.node_vel = dict(zip(self.node_tags, zero_resp.tolist()))
+            if "accel" in self.responses:
+                analysis.node_accel = dict(zip(self.node_tags, zero_resp.tolist()))
+            for response, (records, ele_force_slices) in ele_force_records.items():
+                row_force = records[row].tolist()
+                ele_force = {
+                    tag: row_force[start:end] for tag, start, end in ele_force_slices
+                }
+                if response == "localForces":
+                    analysis.ele_force = ele_force
+                else:
+                    analysis.global_ele_force = ele_force
+        self._pending_analysis = []
+        if self.is_setup:
+            # recorders write to new files for the next load cases of the session
+            self._add_recorders()
+
+    def close(self):
+        """
+        Collects the recorded responses and removes the active load pattern and recorders of the session from
+        the domain.
+        """
+        self.is_setup = False
+        self.collect()
+        if self.recorder_dir is not None:
+            self._remove_recorders()
+            shutil.rmtree(self.recorder_dir, ignore_errors=True)
+            self.recorder_dir = None
+        self._ops.remove("loadPattern", self.pattern_tag)
+
+    def evaluate(self, analysis_list: list) -> list:
+        """
+        Solves a list of Analysis objects in the session, then closes the session.
+
+        :param analysis_list: Analysis objects with load commands added via :func:`Analysis.add_load_command`.
+        :type analysis_list: list
+        :returns: Command log of the session.
+        """
+        for analysis in analysis_list:
+            self.solve(analysis)
+        self.close()
+        return self.command_log
+
+
+class InfluenceSurface:
+    """
+    Class to store the responses of a grillage model to unit nodal loads, i.e. the influence surfaces of node
+    displacements and element forces. Class object is created by
+    :func:`~ospgrillage.osp_grillage.OspGrillage.build_influence_surfaces`.
+
+    Responses of a load case are evaluated as the sparse product of its nodal load vector (with components at the
+    unit load degrees of freedom) with the stored response matrices, which holds for linear static analysis.
+    """
+
+    def __init__(self, unit_loads: list):
+        # list of (node tag, dof) pairs of unit loads, and its lookup to row index of the response matrices
+        self.unit_loads = unit_loads
+        self.unit_load_index = {unit: ind for ind, unit in enumerate(unit_loads)}
+        # tags and sizes of responses, taken from the first solved unit load
+        self.node_tags = []
+        self.ele_tags = []
+        self.ele_force_size = []
+        self.global_ele_force_size = []
+        # response matrices, rows are unit loads
+        self.node_disp = None  # (unit load, node x 6 dof)
+        self.ele_force = None  # (unit load, concatenated local element forces)
+        self.global_ele_force = None  # (unit load, concatenated global element forces)
+
+    def add_unit_responses(self, unit_analysis_list: list):
+        """
+        Stores responses of evaluated unit load :class:`Analysis` objects as rows of the response matrices.
+
+        :param unit_analysis_list: Evaluated Analysis objects, in the order of ``unit_loads``.
+        :type unit_analysis_list: list
+        """
+        if not self.node_tags:
+            first = unit_analysis_list[0]
+            self.node_tags = list(first.node_disp.keys())
+            self.ele_tags = list(first.ele_force.keys())
+            self.ele_force_size = [len(force) for force in first.ele_force.values()]
+            self.global_ele_force_size = [
+                len(force) for force in first.global_ele_force.values()
+            ]
+        node_disp = np.array(
+            [list(a.node_disp.values()) for a in unit_analysis_list], dtype=float
+        ).reshape(len(unit_analysis_list), -1)
+        ele_force = np.array(
+            [np.concatenate(list(a.ele_force.values())) for a in unit_analysis_list]
+        )
+        global_ele_force = np.array(
+            [
+                np.concatenate(list(a.global_ele_force.values()))
+                for a in unit_analysis_list
+            ]
+        )
+        if self.node_disp is None:
+            self.node_disp = node_disp
+            self.ele_force = ele_force
+            self.global_ele_force = global_ele_force
+        else:
+            self.node_disp = np.vstack([self.node_disp, node_disp])
+            self.ele_force = np.vstack([self.ele_force, ele_force])
+            self.global_ele_force = np.vstack([self.global_ele_force, global_ele_force])
+
+    def get_load_matrix(self, analysis_list: list) -> sparse.csr_matrix:
+        """
+        Returns the sparse matrix of nodal load vectors (analysis, unit load) of the load commands of Analysis
+        objects, scaled by their load factors. Components of duplicated nodes are summed.
+
+        :param analysis_list: Analysis objects with load commands added via :func:`Analysis.add_load_command`.
+        :type analysis_list: list
+        :raises ValueError: If a load component is not at a node and dof of the unit loads.
+        """
+        rows, cols, values = [], [], []
+        for row, analysis in enumerate(analysis_list):
+            node_tags, loads = analysis.get_nodal_loads()
+            node_ind, dof_ind = np.nonzero(loads)
+            for node_tag, dof, magnitude in zip(
+                node_tags[node_ind].tolist(),
+                (dof_ind + 1).tolist(),
+                loads[node_ind, dof_ind].tolist(),
+            ):
+                col = self.unit_load_index.get((node_tag, dof))
+                if col is None:
+                    raise ValueError(
+                        "Load at node {} dof {} is not within the influence surfaces: hint: rebuild with "
+                        "node= and dof= covering the loaded nodes".format(node_tag, dof)
+                    )
+                rows.append(row)
+                cols.append(col)
+                values.append(magnitude)
+        return sparse.csr_matrix(
+            (values, (rows, cols)), shape=(len(analysis_list), len(self.unit_loads))
+        )
+
+    def evaluate(self, analysis_list: list):
+        """
+        Evaluates responses of Analysis objects from the influence surfaces, storing them in the Analysis objects
+        as :func:`Analysis.evaluate_analysis` would.
+
+        :param analysis_list: Analysis objects with load commands added via :func:`Analysis.add_load_command`.
+        :type analysis_list: list
+        """
+        if not analysis_list:
+            return
+        load_matrix = self.get_load_matrix(analysis_list)
+        output = analysis_list[0].output
+        if output is None:
+            node_tags, ele_tags = self.node_tags, self.ele_tags
+            responses = ["disp", "vel", "accel", "localForces", "forces"]
+        else:
+            node_tags, ele_tags, responses = _get_output_responses(output)
+        # columns of requested nodes and elements in the response matrices
+        ndf = self.node_disp.shape[1] // len(self.node_tags)
+        node_index = {tag: ind for ind, tag in enumerate(self.node_tags)}
+        node_cols = [
+            node_index[tag] * ndf + dof for tag in node_tags for dof in range(ndf)
+        ]
+        ele_index = {tag: ind for ind, tag in enumerate(self.ele_tags)}
+
+        node_disp = None
+        if "disp" in responses:
+            node_disp = (load_matrix @ self.node_disp[:, node_cols]).reshape(
+                len(analysis_list), len(node_tags), ndf
+            )
+        ele_forces = {}
+        for response, matrix, sizes in [
+            ("localForces", self.ele_force, self.ele_force_size),
+            ("forces", self.global_ele_force, self.global_ele_force_size),
+        ]:
+            if response not in responses:
+                continue
+            offsets = np.cumsum([0] + sizes)
+            ele_cols = [
+                col
+                for tag in ele_tags
+                for col in range(offsets[ele_index[tag]], offsets[ele_index[tag] + 1])
+            ]
+            ele_forces[response] = np.split(
+                load_matrix @ matrix[:, ele_cols],
+                np.cumsum([sizes[ele_index[tag]] for tag in ele_tags])[:-1],
+                axis=1,
+            )
+        zeros = [0.0] * ndf
+        for ind, analysis in enumerate(analysis_list):
+            for node_ind, node_tag in enumerate(node_tags):
+                if node_disp is not None:
+                    analysis.node_disp.setdefault(
+                        node_tag, node_disp[ind, node_ind].tolist()
+                    )
+                if "vel" in responses:
+                    analysis.node_vel.setdefault(node_tag, list(zeros))
+                if "accel" in responses:
+                    analysis.node_accel.setdefault(node_tag, list(zeros))
+            for ele_ind, ele_tag in enumerate(ele_tags):
+                if "localForces" in ele_forces:
+                    analysis.ele_force.setdefault(
+                        ele_tag, ele_forces["localForces"][ele_ind][ind].tolist()
+                    )
+                if "forces" in ele_forces:
+                    analysis.global_ele_force.setdefault(
+                        ele_tag, ele_forces["forces"][ele_ind][ind].tolist()
+                    )
+
+
+class ResultStore:
+    """
+    Chunked on-disk store of the results of a grillage model, in a NetCDF4 (HDF5) file with an unlimited
+    ``Loadcase`` dimension. Load cases are appended to the file as they are analysed, and the file is closed after
+    each append, so that the load cases analysed before an interruption are kept. Results are read back as a
+    lazily loaded DataSet with the data variables of :func:`~ospgrillage.osp_grillage.OspGrillage.get_results`.
+
+    Requires the optional netCDF4 package, install with ``pip install "ospgrillage[store]"``.
+    """
+
+    def __init__(self, filename: str, local_forces: bool = False, chunk_size: int = 64):
+        """
+        :param filename: Path of the NetCDF4 file. An existing file is overwritten by the first appended load case.
+        :type filename: str
+        :param local_forces: If ``True``, stores local element forces instead of global element forces.
+            Defaults to ``False``.
+        :type local_forces: bool
+        :param chunk_size: Number of load cases per HDF5 chunk of the data variables. Defaults to ``64``.
+        :type chunk_size: int
+        :raises ImportError: If netCDF4 is not installed.
+        """
+        if not _NETCDF4_AVAILABLE:
+            raise ImportError(
+                'ResultStore requires netCDF4, which is not installed: hint: pip install "ospgrillage[store]"'
+            )
+        self.filename = filename
+        self.local_forces = local_forces
+        self.chunk_size = chunk_size
+        self.load_case_count = 0  # number of load cases in the file
+        # datasets opened by open_dataset(), closed before the file is appended
+        self._readers = []
+
+    def reset(self):
+        """
+        Discards the stored load cases, the file is overwritten by the next appended load case.
+        """
+        self._close_readers()
+        self.load_case_count = 0
+
+    def append(self, data_set: xr.Dataset) -> int:
+        """
+        Appends the load cases of a DataSet compiled by :func:`Results.compile_data_array` to the file.
+
+        :param data_set: DataSet of load cases to append.
+        :type data_set: xarray.Dataset
+        :returns: Index of the first appended load case along the ``Loadcase`` dimension of the file.
+        :raises ValueError: If the nodes, elements or components of the DataSet differ from the stored load cases.
+        """
+        start = self.load_case_count
+        end = start + data_set.sizes["Loadcase"]
+        # a file open for reading cannot be opened for writing, datasets of open_dataset() reopen it on access
+        self._close_readers()
+        with netCDF4.Dataset(self.filename, "w" if start == 0 else "a") as nc:
+            if start == 0:
+                self._create_variables(nc, data_set)
+            elif any(
+                len(nc.dimensions[dim]) != size
+                for dim, size in data_set.sizes.items()
+                if dim != "Loadcase"
+            ) or set(nc.variables) != set(data_set.variables):
+                raise ValueError(
+                    "Load cases have different responses than the stored load cases: hint: use the same output "
+                    "request for all analyses of a result store"
+                )
+            for name, variable in data_set.variables.items():
+                if "Loadcase" in variable.dims:
+                    values = variable.values
+                    nc[name][start:end] = (
+                        values.astype(object) if values.dtype.kind in "OU" else values
+                    )
+        self.load_case_count = end
+        return start
+
+    def _create_variables(self, nc, data_set: xr.Dataset):
+        """
+        Creates the dimensions, coordinates and data variables of a DataSet in a new file, with an unlimited
+        ``Loadcase`` dimension.
+        """
+        nc.createDimension("Loadcase", None)
+        for dim, size in data_set.sizes.items():
+            if dim != "Loadcase":
+                nc.createDimension(dim, size)
+        # coordinates along Loadcase other than load case names, e.g. positions of moving load increments
+        loadcase_coords = [
+            name
+            for name, coord in data_set.coords.items()
+            if coord.dims == ("Loadcase",) and name != "Loadcase"
+        ]
+        for name, variable in data_set.variables.items():
+            values = variable.values
+            if values.dtype.kind in "OU":  # string coordinates
+                nc_variable = nc.createVariable(name, str, variable.dims)
+                if "Loadcase" not in variable.dims:
+                    nc_variable[:] = values.astype(object)
+            elif "Loadcase" in variable.dims:
+                nc_variable = nc.createVariable(
+                    name,
+                    values.dtype,
+                    variable.dims,
+                    fill_value=np.nan if values.dtype.kind == "f" else None,
+                    chunksizes=(self.chunk_size,) + values.shape[1:],
+                )
+                if name in data_set.data_vars and loadcase_coords:
+                    # read back as coordinates by xarray
+                    nc_variable.coordinates = " ".join(loadcase_coords)
+            else:
+                nc.createVariable(name, values.dtype, variable.dims)[:] = values
+
+    def open_dataset(self) -> Union[xr.Dataset, None]:
+        """
+        Returns the stored load cases as a lazily loaded DataSet, or None if no load cases were stored.
+        """
+        if self.load_case_count == 0:
+            return None
+        data_set = xr.open_dataset(self.filename)
+        self._readers.append(data_set)
+        # load cases appended after opening are not part of the returned DataSet
+        return data_set.isel(Loadcase=slice(0, self.load_case_count))
+
+    def _close_readers(self):
+        for data_set in self._readers:
+            data_set.close()
+        self._readers = []
+
+
 class Results:
     """
     Main class to store results of an Analysis class object, process into data array output for post processing/plotting.
     Class object is accessed within OspGrillage class object.
+
+    Responses are stored in contiguous numeric arrays of shape (Loadcase, Node, Component) and
+    (Loadcase, Element, Component), with rows allocated in geometrically growing blocks as load cases are added.
+    With a :class:`ResultStore`, responses of load cases are instead appended to its file as they are extracted,
+    and rows are the indices of load cases in the file.
     """
 
-    def __init__(self, mesh_obj: Mesh):
+    def __init__(self, mesh_obj: Mesh, dtype=np.float64, store: ResultStore = None):
         # instantiate variables
-        self.basic_load_case_record = dict()
-        self.basic_load_case_record_global_forces = dict()
+        self.basic_load_case_record = dict()  # {load case name: row of response arrays}
+        # [{increment load case name: row}, ...] of each moving load case
         self.moving_load_case_record = []
-        self.moving_load_case_record_global_forces = []
+        # moving load case name of each entry of moving_load_case_record
+        self.moving_load_case_names = []
         self.moving_load_counter = 0
         self.result = None
+        # components of output request, None to keep all components
+        self.output_components = None
+        # response arrays, rows are load cases in order of extraction. Rows are allocated with geometric growth
+        self.dtype = np.dtype(dtype)
+        self.load_case_count = 0  # number of rows in use
+        self.row_capacity = 0
+        self.node_tags = None
+        self.node_responses = dict()  # {"disp"/"vel"/"accel": array (row, node, dof)}
+        # element forces grouped by number of force components, {"localForces"/"forces": {size: [tags]}}
+        self.ele_tags = dict()
+        # {"localForces"/"forces": {size: array (row, element, size)}}
+        self.ele_responses = dict()
+        # {ele tag: row of connectivity of mesh_obj.get_element_connectivity()} of elements with extracted forces
+        self.ele_nodes = dict()
+        # {increment load case name: (x, y, z)} of moving load increments
+        self.increment_positions = dict()
+        # compiled data arrays of get_results(), per force option, see compile_data_array()
+        self.compiled = dict()
+        self.envelope_record = dict()  # {moving load case name: MovingLoadEnvelope}
+        # on-disk store of responses, None to keep responses in memory
+        self.store = store
+        if store is not None:
+            store.reset()
         # store mesh data of holding model
         self.mesh_obj = mesh_obj
         # coordinates for dimensions
@@ -2905,14 +4524,18 @@ class Results:
         self.dim_ele_shell = ["i", "j", "k", "l"]
 
     def extract_analysis(
-        self, analysis_obj: Analysis = None, list_of_inc_analysis: list = None
+        self,
+        analysis_obj: Analysis = None,
+        list_of_inc_analysis: list = None,
+        moving_load_name: str = None,
+        extend: bool = False,
     ):
         """
         Parse and store analysis results from single or incremental load analyses.
 
-        Extracts node displacements, element forces, and node connectivity from
-        analysis results. Handles both single load case and moving load analysis
-        (multiple incremental load cases).
+        Writes node displacements, velocities, accelerations and element forces of the analyses as rows of the
+        numeric response arrays, and records the element node connectivity. Handles both single load case and
+        moving load analysis (multiple incremental load cases).
 
         Parameters
         ----------
@@ -2920,95 +4543,313 @@ class Results:
             Single Analysis object with results to extract.
         list_of_inc_analysis : list, optional
             List of Analysis objects for incremental/moving load analysis.
+        moving_load_name : str, optional
+            Name of the moving load case of ``list_of_inc_analysis``, for selection in
+            :func:`get_load_case_index`.
+        extend : bool, optional
+            If True, ``list_of_inc_analysis`` are further increments of the last extracted moving load case,
+            e.g. a chunk of increments appended to a :class:`ResultStore`.
 
         Notes
         -----
-        Stores results internally in basic_load_case_record, basic_load_case_record_global_forces,
-        moving_load_case_record, and moving_load_case_record_global_forces dictionaries.
+        Stores the rows of load cases in basic_load_case_record and moving_load_case_record dictionaries. Only
+        the nodes, elements and responses extracted by the Analysis objects (see :class:`OutputRequest`) are
+        stored.
         """
         # Create/parse data based on incoming analysis object or list of analysis obj (moving load)
         if analysis_obj:
-            # compile ele forces for each node
-            node_disp = analysis_obj.node_disp
-            node_vel = analysis_obj.node_vel
-            node_accel = analysis_obj.node_accel
-            ele_force_dict = dict.fromkeys(
-                list(ops.getEleTags())
-            )  # dict key is element tag, value is ele force from
-            global_ele_force_dict = dict.fromkeys(
-                list(ops.getEleTags())
-            )  # dict key is element tag, value is ele force from
-            ele_nodes_dict = dict.fromkeys(list(ops.getEleTags()))
-            # analysis_obj.ele_force
-            # extract element forces and sort them to according to nodes - summing in the process
-            for ele_num, ele_forces in analysis_obj.ele_force.items():
-                ele_force_dict.update({ele_num: ele_forces})
-                # get ele nodes
-                ele_nodes = ops.eleNodes(ele_num)
-                ele_nodes_dict.update({ele_num: ele_nodes})
-            self.basic_load_case_record.setdefault(
-                analysis_obj.analysis_name, [node_disp, ele_force_dict, ele_nodes_dict]
-            )
-
-            # repeat to extract global forces instead
-            # extract element forces and sort them to according to nodes - summing in the process
-            for ele_num, ele_forces in analysis_obj.global_ele_force.items():
-                global_ele_force_dict.update({ele_num: ele_forces})
-                ele_nodes = ops.eleNodes(ele_num)  # get ele nodes
-                ele_nodes_dict.update({ele_num: ele_nodes})
-            self.basic_load_case_record_global_forces.setdefault(
-                analysis_obj.analysis_name,
-                [
-                    node_disp,
-                    node_vel,
-                    node_accel,
-                    global_ele_force_dict,
-                    ele_nodes_dict,
-                ],
-            )
+            if analysis_obj.analysis_name not in self.basic_load_case_record:
+                self.basic_load_case_record[analysis_obj.analysis_name] = (
+                    self._store_analysis_rows([analysis_obj])[0]
+                    if self.store is not None
+                    else self._add_analysis_row(analysis_obj)
+                )
         # if moving load, input is a list of analysis obj
         elif list_of_inc_analysis:
-            inc_load_case_record = dict()
-            inc_load_case_global_force_record = (
-                dict()
-            )  # inc_load_case_record but with forces in global
-
+            # records are only modified once all analyses are checked and written
+            extend = extend and bool(self.moving_load_case_record)
+            inc_load_case_record = (
+                self.moving_load_case_record[-1] if extend else dict()
+            )
+            # increments already in the store are not appended again
+            skipped_names = (
+                set(inc_load_case_record).union(*self.moving_load_case_record)
+                if self.store is not None
+                else inc_load_case_record
+            )
+            new_analysis_dict = dict()
             for inc_analysis_obj in list_of_inc_analysis:
-                # compile ele forces for each node
-                node_disp = inc_analysis_obj.node_disp
-                node_vel = inc_analysis_obj.node_vel
-                node_accel = inc_analysis_obj.node_accel
-                ele_force_dict = dict.fromkeys(list(ops.getEleTags()))
-                ele_force_global_dict = dict.fromkeys(list(ops.getEleTags()))
-                ele_nodes_dict = dict.fromkeys(list(ops.getEleTags()))
-                # extract element forces and sort them to according to nodes - summing in the process
-                for ele_num, ele_forces in inc_analysis_obj.ele_force.items():
-                    ele_force_dict.update({ele_num: ele_forces})
-                    # get ele nodes
-                    ele_nodes = ops.eleNodes(ele_num)
-                    ele_nodes_dict.update({ele_num: ele_nodes})
-
-                inc_load_case_record.setdefault(
-                    inc_analysis_obj.analysis_name,
-                    [node_disp, ele_force_dict, ele_nodes_dict],
+                if inc_analysis_obj.analysis_name not in skipped_names:
+                    new_analysis_dict.setdefault(
+                        inc_analysis_obj.analysis_name, inc_analysis_obj
+                    )
+            if not new_analysis_dict:
+                rows = []
+            elif self.store is not None:
+                rows = self._store_analysis_rows(
+                    list(new_analysis_dict.values()),
+                    moving_load_name=moving_load_name,
+                    increment_start=len(inc_load_case_record),
                 )
-                for ele_num, ele_forces in inc_analysis_obj.global_ele_force.items():
-                    ele_force_global_dict.update({ele_num: ele_forces})
-                inc_load_case_global_force_record.setdefault(
-                    inc_analysis_obj.analysis_name,
-                    [
-                        node_disp,
-                        node_vel,
-                        node_accel,
-                        ele_force_global_dict,
-                        ele_nodes_dict,
-                    ],
+            else:
+                self._check_analysis_outputs(list(new_analysis_dict.values()))
+                rows = [
+                    self._add_analysis_row(inc_analysis_obj)
+                    for inc_analysis_obj in new_analysis_dict.values()
+                ]
+            inc_load_case_record.update(zip(new_analysis_dict.keys(), rows))
+            if not extend:
+                self.moving_load_case_record.append(inc_load_case_record)
+                self.moving_load_case_names.append(moving_load_name)
+            for inc_analysis_obj in new_analysis_dict.values():
+                load_case_obj = inc_analysis_obj.load_cases_obj
+                if load_case_obj is not None and load_case_obj.position is not None:
+                    self.increment_positions[inc_analysis_obj.analysis_name] = tuple(
+                        load_case_obj.position
+                    )
+
+    def _store_analysis_rows(
+        self, analysis_list: list, moving_load_name: str = None, increment_start=0
+    ) -> list:
+        """
+        Appends the responses of analyses, with unique names, to the result store.
+
+        :param moving_load_name: Name of the moving load case of the analyses, None for basic load cases.
+        :param increment_start: Increment index of the first analysis within its moving load case.
+        :returns: Rows of the analyses, i.e. their indices along the Loadcase dimension of the store
+        """
+        chunk_results = Results(self.mesh_obj, dtype=self.dtype)
+        chunk_results.extract_analysis(
+            list_of_inc_analysis=analysis_list, moving_load_name=moving_load_name
+        )
+        data_set = chunk_results.compile_data_array(
+            local_force_option=self.store.local_forces,
+            main_ele_tags=self.mesh_obj.element_counter,
+        )
+        if increment_start:
+            data_set = data_set.assign_coords(
+                Increment=data_set["Increment"] + increment_start
+            )
+        start = self.store.append(data_set)
+        return list(range(start, start + len(analysis_list)))
+
+    def _get_load_case_layout(self) -> tuple:
+        """
+        Returns the rows of load cases in order of the Loadcase dimension of :func:`compile_data_array` - all
+        basic load cases, followed by each increment of moving load cases - and the contiguous range of each
+        moving load case along the dimension.
+
+        :returns: Tuple of ``{load case name: row}`` and ``{moving load case name: slice}`` dicts
+        """
+        load_case_rows = dict(self.basic_load_case_record)
+        moving_load_case_slices = dict()
+        for moving_load_name, moving_load_case_inc_dict in zip(
+            self.moving_load_case_names, self.moving_load_case_record
+        ):
+            if self.store is not None:
+                # load cases are in order of extraction, and increments are appended together
+                load_case_rows.update(moving_load_case_inc_dict)
+                rows = list(moving_load_case_inc_dict.values())
+                if moving_load_name is not None and rows:
+                    moving_load_case_slices[moving_load_name] = slice(
+                        min(rows), max(rows) + 1
+                    )
+                continue
+            start = len(load_case_rows)
+            load_case_rows.update(moving_load_case_inc_dict)
+            # increments of a moving load case analysed again keep their previous positions
+            if moving_load_name is not None and len(load_case_rows) > start:
+                moving_load_case_slices[moving_load_name] = slice(
+                    start, len(load_case_rows)
                 )
+        return load_case_rows, moving_load_case_slices
+
+    def get_load_case_index(self, load_case_names: list) -> np.ndarray:
+        """
+        Resolves names of basic and moving load cases to an integer index array along the Loadcase dimension of
+        :func:`compile_data_array`. Moving load cases are resolved to the contiguous range of their increments.
+
+        Parameters
+        ----------
+        load_case_names : list
+            Names of basic load cases, moving load cases, or increments of moving load cases.
+
+        Returns
+        -------
+        numpy.ndarray
+            Indices along the Loadcase dimension, in order of ``load_case_names``.
+
+        Raises
+        ------
+        ValueError
+            If a load case has no results.
+        """
+        load_case_rows, moving_load_case_slices = self._get_load_case_layout()
+        position = None  # {load case name: index}, only built to look up increments
+        index_list = []
+        for name in load_case_names:
+            if name in moving_load_case_slices:
+                load_case_slice = moving_load_case_slices[name]
+                index_list.append(
+                    np.arange(load_case_slice.start, load_case_slice.stop)
+                )
+                continue
+            if position is None:
+                position = (
+                    load_case_rows
+                    if self.store is not None
+                    else {lc: ind for ind, lc in enumerate(load_case_rows)}
+                )
+            if name not in position:
+                raise ValueError(
+                    "Load case {} not in results: hint: analyze() the load case first".format(
+                        name
+                    )
+                )
+            index_list.append(np.array([position[name]]))
+        if not index_list:
+            return np.zeros(0, dtype=int)
+        return np.concatenate(index_list)
+
+    def _add_analysis_row(self, analysis_obj: Analysis) -> int:
+        """
+        Writes the responses of an analysis to a new row of the response arrays.
+
+        :returns: Row index of the analysis
+        :raises ValueError: If the analysis extracted responses of different nodes or elements than previously
+            stored analyses.
+        """
+        self._check_analysis_outputs([analysis_obj])
+        if analysis_obj.output is not None:
+            self.output_components = analysis_obj.output["components"]
+        row = self.load_case_count
+        if row == self.row_capacity:
+            self._grow_rows(max(2 * self.row_capacity, 8))
+        self.load_case_count += 1
+
+        for response, resp_dict in [
+            ("disp", analysis_obj.node_disp),
+            ("vel", analysis_obj.node_vel),
+            ("accel", analysis_obj.node_accel),
+        ]:
+            if not resp_dict:
+                continue
+            if self.node_tags is None:
+                self.node_tags = list(resp_dict.keys())
+            values = np.array(list(resp_dict.values()), dtype=self.dtype)
+            if response not in self.node_responses:
+                self.node_responses[response] = self._new_rows(values.shape)
+            self.node_responses[response][row] = values
+
+        for response, force_dict in [
+            ("localForces", analysis_obj.ele_force),
+            ("forces", analysis_obj.global_ele_force),
+        ]:
+            if not force_dict:
+                continue
+            if response not in self.ele_tags:
+                # group elements by size of force response, e.g. 12 for beams and 24 for shells
+                size_groups = dict()
+                for ele_tag, force in force_dict.items():
+                    size_groups.setdefault(len(force), []).append(ele_tag)
+                self._add_ele_nodes(force_dict.keys())
+                self.ele_tags[response] = size_groups
+                self.ele_responses[response] = {
+                    size: self._new_rows((len(tags), size))
+                    for size, tags in size_groups.items()
+                }
+            for size, tags in self.ele_tags[response].items():
+                self.ele_responses[response][size][row] = [
+                    force_dict[tag] for tag in tags
+                ]
+        return row
+
+    def _check_analysis_outputs(self, analysis_list: list):
+        """
+        Checks that analyses extracted the same nodes and elements as each other and as the stored results,
+        before any of them is written.
+
+        :raises ValueError: If an analysis extracted responses of different nodes or elements.
+        """
+        node_tags = self.node_tags
+        ele_counts = {
+            response: sum(len(tags) for tags in size_groups.values())
+            for response, size_groups in self.ele_tags.items()
+        }
+        for analysis_obj in analysis_list:
+            for resp_dict in [
+                analysis_obj.node_disp,
+                analysis_obj.node_vel,
+                analysis_obj.node_accel,
+            ]:
+                if not resp_dict:
+                    continue
+                if node_tags is None:
+                    node_tags = list(resp_dict.keys())
+                elif len(resp_dict) != len(node_tags) or (
+                    list(resp_dict.keys()) != node_tags
+                ):
+                    raise ValueError(
+                        "Analysis {} extracted different nodes than the stored results: hint: reset results "
+                        "between analyses with different output requests".format(
+                            analysis_obj.analysis_name
+                        )
+                    )
+            for response, force_dict in [
+                ("localForces", analysis_obj.ele_force),
+                ("forces", analysis_obj.global_ele_force),
+            ]:
+                if not force_dict:
+                    continue
+                if len(force_dict) != ele_counts.setdefault(response, len(force_dict)):
+                    raise ValueError(
+                        "Analysis {} extracted different elements than the stored results: hint: reset results "
+                        "between analyses with different output requests".format(
+                            analysis_obj.analysis_name
+                        )
+                    )
+
+    def _add_ele_nodes(self, ele_tags):
+        """
+        Records the rows of elements in the connectivity of the mesh, captured once per model by
+        :func:`~ospgrillage.mesh.Mesh.get_element_connectivity` instead of querying OpenSees per element.
+        """
+        _, _, ele_row = self.mesh_obj.get_element_connectivity()
+        for ele_tag in ele_tags:
+            if ele_tag in self.ele_nodes:
+                continue
+            if ele_tag not in ele_row:
+                # element created outside the grillage model, recorded once to the mesh
+                self.mesh_obj.add_element_nodes(ele_tag, ops.eleNodes(ele_tag))
+                _, _, ele_row = self.mesh_obj.get_element_connectivity()
+            self.ele_nodes[ele_tag] = ele_row[ele_tag]
+
+    def _new_rows(self, shape: tuple) -> np.ndarray:
+        """
+        Returns a response array of ``shape`` per row, allocated for the current row capacity and filled with NaN.
+        """
+        return np.full((self.row_capacity,) + tuple(shape), np.nan, dtype=self.dtype)
+
+    def _grow_rows(self, row_capacity: int):
+        """
+        Reallocates all response arrays with ``row_capacity`` rows, copying the rows in use.
+        """
 
-            self.moving_load_case_record.append(inc_load_case_record)
-            self.moving_load_case_record_global_forces.append(
-                inc_load_case_global_force_record
+        def grow(array):
+            new_array = np.full(
+                (row_capacity,) + array.shape[1:], np.nan, dtype=self.dtype
             )
+            new_array[: self.load_case_count] = array[: self.load_case_count]
+            return new_array
+
+        self.node_responses = {
+            response: grow(array) for response, array in self.node_responses.items()
+        }
+        self.ele_responses = {
+            response: {size: grow(array) for size, array in size_arrays.items()}
+            for response, size_arrays in self.ele_responses.items()
+        }
+        self.row_capacity = row_capacity
 
     def compile_data_array(self, local_force_option=True, main_ele_tags=None):
         """
@@ -3018,6 +4859,11 @@ class Results:
         into multidimensional xarray structures indexed by load case, node/element,
         and response component.
 
+        Compiled data arrays are cached per force option. Load cases analysed after the previous compile are
+        appended to the cached arrays, and the returned DataSet holds a copy of them. The cache is
+        rebuilt if load cases are inserted before compiled load cases (e.g. a basic load case analysed after a
+        moving load case), or if the requested components change.
+
         Parameters
         ----------
         local_force_option : bool, optional
@@ -3031,257 +4877,399 @@ class Results:
             Dictionary containing xarray DataArrays for node displacements, velocities,
             accelerations, and element forces organized by load case.
         """
-        # Function called to compile analysis results into xarray
-        # Coordinates of dimension
-        node = list(self.mesh_obj.node_spec.keys())  # for Node
-        ele = list(ops.getEleTags())
-
-        # Sort data for dataArrays
-        # for basic load case  {loadcasename:[{1:,2:...},{1:,2:...}], ... , loadcasename:[{1:,2:...},{1:,2:...} }
-        basic_node_disp_list = []
-        basic_node_vel_list = []
-        basic_node_accel_list = []
-        basic_load_case_coord = []
-        basic_ele_force_list = []
-        extracted_ele_nodes_list = False  # a 2D array of ele node i and ele node j
-        ele_nodes_list = []
-        base_ele_force_list_beam = []
-        base_ele_force_list_shell = []
-        ele_tag = []
-        # check if force option is global or local
-        if local_force_option:
-            basic_dict = self.basic_load_case_record
-            moving_dict = self.moving_load_case_record
-        else:  # global forces
-            basic_dict = self.basic_load_case_record_global_forces
-            moving_dict = self.moving_load_case_record_global_forces
-
-        # loop all basic load case
-        for load_case_name, resp_list_of_2_dict in basic_dict.items():
-            # extract displacement
-            basic_node_disp_list.append(
-                [a for a in list(resp_list_of_2_dict[0].values())]
-            )  # list index 0 is disp
-            basic_node_vel_list.append(
-                [a for a in list(resp_list_of_2_dict[1].values())]
-            )
-            basic_node_accel_list.append(
-                [a for a in list(resp_list_of_2_dict[2].values())]
-            )
-            # extract force
-            basic_ele_force_list.append(
-                [a for a in list(resp_list_of_2_dict[3].values())]
-            )  # list index 1 is force
-            # extract based on element type
-            base_ele_force_list_beam.append(
-                [
-                    a
-                    for a in list(resp_list_of_2_dict[3].values())
-                    if len(a) == len(self.force_component)
-                ]
+        if self.store is not None:
+            if local_force_option != self.store.local_forces:
+                raise ValueError(
+                    "Result store holds {} element forces: hint: get_results(local_forces={})".format(
+                        "local" if self.store.local_forces else "global",
+                        self.store.local_forces,
+                    )
+                )
+            self.result = self.store.open_dataset()
+            return self.result
+        # rows of all basic load cases, followed by each increment of moving load cases
+        load_case_rows, _ = self._get_load_case_layout()
+        # create data array for each basic load case if any, else return
+        if not load_case_rows:
+            self.result = None
+            return None
+        if main_ele_tags is None:
+            main_ele_tags = math.inf
+        rows = list(load_case_rows.values())
+        cache_key = (
+            main_ele_tags,
+            None if self.output_components is None else tuple(self.output_components),
+        )
+        compiled = self.compiled.get(local_force_option)
+        if (
+            compiled is None
+            or compiled["key"] != cache_key
+            or rows[: len(compiled["rows"])] != compiled["rows"]
+        ):
+            compiled = self._compile_layout(local_force_option, main_ele_tags)
+            compiled["key"] = cache_key
+            self.compiled[local_force_option] = compiled
+        if len(rows) > len(compiled["rows"]):
+            self._append_compiled_rows(compiled, rows[len(compiled["rows"]) :])
+        # Coordinate of Load Case dimension
+        load_case_coord = list(load_case_rows.keys())
+        increment_coords = self._get_increment_coords(load_case_coord)
+
+        data_vars = dict()
+        for var_name, var in compiled["variables"].items():
+            # copies of the cached arrays, so that DataSets can be modified in place
+            if var["source"] is None:  # no Loadcase dimension
+                data_vars[var_name] = var["data_array"].copy()
+                continue
+            data_vars[var_name] = xr.DataArray(
+                data=var["data"][: len(rows)].copy(),
+                dims=var["dims"],
+                coords={var["dims"][0]: load_case_coord, **var["coords"]},
             )
-            base_ele_force_list_shell.append(
-                [
-                    a
-                    for a in list(resp_list_of_2_dict[3].values())
-                    if len(a) == len(self.force_component_shell)
-                ]
+        result = xr.Dataset(data_vars).assign_coords(increment_coords)
+        self.result = result  # store to Result class
+        return result
+
+    def _get_increment_coords(self, load_case_names: list) -> dict:
+        """
+        Returns numeric coordinates of load cases along the Loadcase dimension: ``Movingload`` (name of the
+        moving load case), ``Increment`` (index of the increment within the moving load case) and ``X``, ``Y``,
+        ``Z`` (global position of the increment). Basic load cases have an empty name, increment -1 and NaN
+        positions.
+
+        :param load_case_names: Names of load cases along the Loadcase dimension.
+        :returns: Dict of coordinates for ``xarray.Dataset.assign_coords()``
+        """
+        # {increment load case name: (moving load case name, increment index)}
+        increment_dict = dict()
+        for moving_load_name, moving_load_case_inc_dict in zip(
+            self.moving_load_case_names, self.moving_load_case_record
+        ):
+            if moving_load_name is None:
+                continue
+            for index, name in enumerate(moving_load_case_inc_dict):
+                increment_dict.setdefault(name, (moving_load_name, index))
+        count = len(load_case_names)
+        moving_load = np.full(count, "", dtype=object)
+        increment = np.full(count, -1)
+        position = np.full((count, 3), np.nan)
+        for ind, name in enumerate(load_case_names):
+            if name in increment_dict:
+                moving_load[ind], increment[ind] = increment_dict[name]
+            if name in self.increment_positions:
+                position[ind] = self.increment_positions[name]
+        return {
+            "Movingload": (self.dim[0], moving_load.astype(str)),
+            "Increment": (self.dim[0], increment),
+            "X": (self.dim[0], position[:, 0]),
+            "Y": (self.dim[0], position[:, 1]),
+            "Z": (self.dim[0], position[:, 2]),
+        }
+
+    def _compile_layout(self, local_force_option: bool, main_ele_tags) -> dict:
+        """
+        Returns the layout of compiled data arrays of a force option, with no load cases. Data variables are
+        aligned on common coordinates of the Node, Element, Component and Nodes dimensions - the union of the
+        coordinates of each variable - and hold, per variable, the indices of its own coordinates in the common
+        coordinates.
+        """
+        # {var name: (source key, element index or None, DataArray without load cases)}, see _get_response_rows()
+        variables = dict()
+        for response, var_name, component in [
+            ("disp", "displacements", self.displacement_component),
+            ("vel", "velocity", self.vel_component),
+            ("accel", "acceleration", self.acc_component),
+        ]:
+            if response not in self.node_responses:  # response not extracted
+                continue
+            variables[var_name] = (
+                (response,),
+                None,
+                xr.DataArray(
+                    data=np.empty((0, len(self.node_tags), len(component))),
+                    dims=self.dim,
+                    coords={
+                        self.dim[1]: self.node_tags,
+                        self.dim[2]: component,
+                    },
+                ),
             )
-            if not extracted_ele_nodes_list:
-                ele_nodes_list = list(
-                    resp_list_of_2_dict[4].values()
-                )  # list index 2 is ele nodes variable
-                extracted_ele_nodes_list = (
-                    True  # set to true, only extract if its the first time extracting
-                )
-                ele_tag = list(resp_list_of_2_dict[4].keys())
-            # for section forces of each element
-            # Coordinate of Load Case dimension
-            basic_load_case_coord.append(load_case_name)
-            # combine disp and force with respect to Component axis : size 12
-
-        # loop all moving load cases
-        for moving_load_case_inc_dict in moving_dict:
-            # for each load case increment in moving load case
-            for (
-                increment_load_case_name,
-                inc_resp_list_of_2_dict,
-            ) in moving_load_case_inc_dict.items():
-                # basic_array_list.append([a + b for (a, b) in zip(list(inc_resp_list_of_2_dict[0].values()),
-                #                                                       list(inc_resp_list_of_2_dict[1].values()))])
-                basic_node_disp_list.append(
-                    [a for a in list(inc_resp_list_of_2_dict[0].values())]
-                )
-                basic_node_vel_list.append(
-                    [a for a in list(inc_resp_list_of_2_dict[1].values())]
-                )
-                basic_node_accel_list.append(
-                    [a for a in list(inc_resp_list_of_2_dict[2].values())]
-                )
-                if local_force_option:
-                    basic_ele_force_list.append(
-                        [
-                            a
-                            for a in list(inc_resp_list_of_2_dict[3].values())
-                            if len(a) == len(self.force_component)
-                        ]
-                    )
-                else:
-                    # global force
-                    basic_ele_force_list.append(
-                        [a for a in list(inc_resp_list_of_2_dict[3].values())]
-                    )
 
-                # lists for shell model output
-                base_ele_force_list_beam.append(
-                    [
-                        a
-                        for key, a in zip(
-                            list(inc_resp_list_of_2_dict[3].keys()),
-                            list(inc_resp_list_of_2_dict[3].values()),
-                        )
-                        if len(a) == len(self.force_component)
-                        if key < main_ele_tags
-                    ]
-                )
-                base_ele_force_list_shell.append(
-                    [
-                        a
-                        for a in list(inc_resp_list_of_2_dict[3].values())
-                        if len(a) == len(self.force_component_shell)
-                    ]
-                )
-                # Coordinate of Load Case dimension
-                # inc_moving_load_case_coord.append(increment_load_case_name)
-                basic_load_case_coord.append(increment_load_case_name)
-                if not extracted_ele_nodes_list:
-                    ele_nodes_list = list(inc_resp_list_of_2_dict[4].values())
-                    ele_tag = list(inc_resp_list_of_2_dict[4].keys())
-                    extracted_ele_nodes_list = True
-        # convert to np array format
-        basic_array_disp = np.array(basic_node_disp_list, dtype=object)
-        basic_array_vel = np.array(basic_node_vel_list, dtype=object)
-        basic_array_accel = np.array(basic_node_accel_list, dtype=object)
-        force_array = np.array(basic_ele_force_list, dtype=object)
-        ele_array = np.array(ele_nodes_list, dtype=object)
-
-        ele_tag = np.array(ele_tag)
-        ele_tag_shell = [tag for tag, e in zip(ele_tag, ele_array) if len(e) > 2]
-        ele_array_shell = [e for tag, e in zip(ele_tag, ele_array) if len(e) > 2]
+        # element forces
+        response = "localForces" if local_force_option else "forces"
+        size_groups = self.ele_tags.get(response, dict())
+        _, connectivity, _ = self.mesh_obj.get_element_connectivity()
+        node_count = (connectivity >= 0).sum(axis=1)
         ele_tag_beam = [
             tag
-            for tag, e in zip(ele_tag, ele_array)
-            if len(e) == 2
+            for tag, row in self.ele_nodes.items()
+            if node_count[row] == 2
             if tag < main_ele_tags
         ]
-        ele_array_beam = [
-            e
-            for tag, e in zip(ele_tag, ele_array)
-            if len(e) == 2
-            if tag < main_ele_tags
+        ele_tag_shell = [
+            tag for tag, row in self.ele_nodes.items() if node_count[row] > 2
         ]
-        force_array_shell = np.array(base_ele_force_list_shell)
-        force_array_beam = np.array(base_ele_force_list_beam)
 
-        # create data array for each basic load case if any, else return
-        if basic_array_disp.size:
-            # displacement data array
-            basic_da_d = xr.DataArray(
-                data=basic_array_disp,
-                dims=self.dim,
-                coords={
-                    self.dim[0]: basic_load_case_coord,
-                    self.dim[1]: node,
-                    self.dim[2]: self.displacement_component,
-                },
-            )
-            basic_da_v = xr.DataArray(
-                data=basic_array_vel,
-                dims=self.dim,
-                coords={
-                    self.dim[0]: basic_load_case_coord,
-                    self.dim[1]: node,
-                    self.dim[2]: self.vel_component,
-                },
+        def force_variable(ele_tags, component):
+            # elements with forces of all components
+            group_tags = size_groups.get(len(component), [])
+            ele_tags = set(ele_tags)
+            ele_index = [ind for ind, tag in enumerate(group_tags) if tag in ele_tags]
+            if not ele_index:
+                return None
+            return (
+                (response, len(component)),
+                ele_index,
+                xr.DataArray(
+                    data=np.empty((0, len(ele_index), len(component))),
+                    dims=self.dim2,
+                    coords={
+                        self.dim2[1]: [group_tags[ind] for ind in ele_index],
+                        self.dim2[2]: component,
+                    },
+                ),
             )
 
-            basic_da_a = xr.DataArray(
-                data=basic_array_accel,
-                dims=self.dim,
-                coords={
-                    self.dim[0]: basic_load_case_coord,
-                    self.dim[1]: node,
-                    self.dim[2]: self.acc_component,
-                },
+        def ele_nodes_variable(ele_tags, nodes_dim):
+            if not ele_tags:
+                return None
+            return (
+                None,
+                None,
+                xr.DataArray(
+                    data=connectivity[
+                        [self.ele_nodes[tag] for tag in ele_tags], : len(nodes_dim)
+                    ],
+                    dims=[self.dim2[1], "Nodes"],
+                    coords={self.dim2[1]: ele_tags, "Nodes": nodes_dim},
+                ),
             )
 
-            ele_nodes_beam = xr.DataArray(
-                data=ele_array_beam,
-                dims=[self.dim2[1], "Nodes"],
-                coords={self.dim2[1]: ele_tag_beam, "Nodes": self.dim_ele_beam},
+        # create data set based on
+        if isinstance(self.mesh_obj, ShellLinkMesh):
+            ele_vars = {
+                "forces_beam": force_variable(ele_tag_beam, self.force_component),
+                "forces_shell": force_variable(
+                    ele_tag_shell, self.force_component_shell
+                ),
+                "ele_nodes_beam": ele_nodes_variable(ele_tag_beam, self.dim_ele_beam),
+                "ele_nodes_shell": ele_nodes_variable(
+                    ele_tag_shell, self.dim_ele_shell
+                ),
+            }
+        else:
+            ele_vars = {
+                "forces": force_variable(
+                    (
+                        list(self.ele_nodes.keys())
+                        if not local_force_option
+                        else ele_tag_beam
+                    ),
+                    self.force_component,
+                ),
+                "ele_nodes": ele_nodes_variable(ele_tag_beam, self.dim_ele_beam),
+            }
+        variables.update(
+            {name: var for name, var in ele_vars.items() if var is not None}
+        )
+
+        # common coordinates of data set
+        aligned = xr.Dataset({name: var[2] for name, var in variables.items()})
+        # keep only requested components of output request
+        if self.output_components is not None:
+            aligned = aligned.sel(
+                Component=[
+                    comp
+                    for comp in aligned.Component.values
+                    if comp in self.output_components
+                ]
             )
-            # create data set based on
-            if isinstance(self.mesh_obj, ShellLinkMesh):
-                force_da_beam = xr.DataArray(
-                    data=force_array_beam,
-                    dims=self.dim2,
-                    coords={
-                        self.dim2[0]: basic_load_case_coord,
-                        self.dim2[1]: ele_tag_beam,
-                        self.dim2[2]: self.force_component,
-                    },
-                )
-                force_da_shell = xr.DataArray(
-                    data=force_array_shell,
-                    dims=self.dim2,
-                    coords={
-                        self.dim2[0]: basic_load_case_coord,
-                        self.dim2[1]: ele_tag_shell,
-                        self.dim2[2]: self.force_component_shell,
-                    },
-                )
-                ele_nodes_shell = xr.DataArray(
-                    data=ele_array_shell,
-                    dims=[self.dim2[1], "Nodes"],
-                    coords={self.dim2[1]: ele_tag_shell, "Nodes": self.dim_ele_shell},
+        compiled = {"rows": [], "variables": dict()}
+        for name, (source, ele_index, data_array) in variables.items():
+            if source is None:
+                compiled["variables"][name] = {
+                    "source": None,
+                    "data_array": aligned[name],
+                }
+                continue
+            dims = data_array.dims
+            common_coords = {dim: aligned.indexes[dim] for dim in dims[1:]}
+            # positions of variable coordinates in common coordinates, -1 if not in common coordinates
+            axis_index = common_coords[dims[1]].get_indexer(data_array.indexes[dims[1]])
+            comp_index = common_coords[dims[2]].get_indexer(data_array.indexes[dims[2]])
+            compiled["variables"][name] = {
+                "source": source,
+                "ele_index": ele_index,
+                "axis_index": axis_index,
+                "comp_index": comp_index,
+                "dims": dims,
+                "coords": {dim: index.values for dim, index in common_coords.items()},
+                "data": np.full(
+                    (0,) + tuple(len(index) for index in common_coords.values()),
+                    np.nan,
+                    dtype=self.dtype,
+                ),
+            }
+        return compiled
+
+    def _get_response_rows(self, source: tuple) -> np.ndarray:
+        """
+        Returns the current response array of a source key of compiled data arrays - ``(response,)`` of node
+        responses, or ``(response, size)`` of element forces grouped by number of force components.
+        """
+        if len(source) == 1:
+            return self.node_responses[source[0]]
+        return self.ele_responses[source[0]][source[1]]
+
+    def _append_compiled_rows(self, compiled: dict, new_rows: list):
+        """
+        Writes response array rows of load cases to the end of compiled data arrays, growing their capacity
+        geometrically.
+        """
+        start = len(compiled["rows"])
+        end = start + len(new_rows)
+        for var in compiled["variables"].values():
+            if var["source"] is None:
+                continue
+            data = var["data"]
+            if end > len(data):
+                new_data = np.full(
+                    (max(2 * len(data), end),) + data.shape[1:],
+                    np.nan,
+                    dtype=self.dtype,
                 )
-                result = xr.Dataset(
-                    {
-                        "displacements": basic_da_d,
-                        "velocity": basic_da_v,
-                        "acceleration": basic_da_a,
-                        "forces_beam": force_da_beam,
-                        "forces_shell": force_da_shell,
-                        "ele_nodes_beam": ele_nodes_beam,
-                        "ele_nodes_shell": ele_nodes_shell,
-                    }
+                new_data[:start] = data[:start]
+                data = var["data"] = new_data
+            # response arrays are reallocated as rows grow, look up the current array
+            values = self._get_response_rows(var["source"])[new_rows]
+            if var["ele_index"] is not None:
+                values = values[:, var["ele_index"]]
+            # keep components in common coordinates only
+            comp_mask = var["comp_index"] >= 0
+            data[
+                np.ix_(
+                    np.arange(start, end),
+                    var["axis_index"],
+                    var["comp_index"][comp_mask],
                 )
-            else:
-                force_da_beam = xr.DataArray(
-                    data=force_array,
-                    dims=self.dim2,
-                    coords={
-                        self.dim2[0]: basic_load_case_coord,
-                        self.dim2[1]: (
-                            ele_tag if not local_force_option else ele_tag_beam
-                        ),
-                        self.dim2[2]: self.force_component,
-                    },
-                )
-                result = xr.Dataset(
-                    {
-                        "displacements": basic_da_d,
-                        "velocity": basic_da_v,
-                        "acceleration": basic_da_a,
-                        "forces": force_da_beam,
-                        "ele_nodes": ele_nodes_beam,
+            ] = values[:, :, comp_mask]
+        compiled["rows"] = compiled["rows"] + list(new_rows)
+
+
+class MovingLoadEnvelope:
+    """
+    Running envelope of the responses of a moving load case, updated as chunks of its increments are analysed.
+
+    Stores the maxima and minima of each response over the increments, and the increments where they occur,
+    instead of the responses of every increment. Memory is independent of the number of increments of the
+    moving path.
+    """
+
+    def __init__(self, mesh_obj: Mesh, dtype=np.float64):
+        # load case names of enveloped increments, in order of analysis
+        self.increment_names = []
+        # responses of the chunk of increments being enveloped
+        self.increments = Results(mesh_obj, dtype=dtype)
+        # rows of maxima and minima of responses, and of the increment indices where they occur
+        self.extrema = Results(mesh_obj, dtype=dtype)
+        self.locations = Results(mesh_obj)
+
+    @staticmethod
+    def _response_arrays(results: Results) -> list:
+        """
+        Returns the response arrays of a Results object, in order of the responses of the enveloped increments.
+        """
+        return list(results.node_responses.values()) + [
+            array
+            for size_arrays in results.ele_responses.values()
+            for array in size_arrays.values()
+        ]
+
+    def update(self, list_of_inc_analysis: list):
+        """
+        Reduces the responses of analysed increments of the moving load case into the running envelope.
+
+        :param list_of_inc_analysis: Analysis objects of increments, with extracted responses.
+        :type list_of_inc_analysis: list
+        """
+        increments = self.increments
+        increments.load_case_count = 0  # overwrite rows of previous chunk
+        for inc_analysis_obj in list_of_inc_analysis:
+            increments._add_analysis_row(inc_analysis_obj)
+        count = increments.load_case_count
+        if count == 0:
+            return
+        offset = len(self.increment_names)
+        self.increment_names += [a.analysis_name for a in list_of_inc_analysis]
+        if offset == 0:
+            # rows of maxima and minima with the nodes, elements and components of the increments
+            for results in [self.extrema, self.locations]:
+                results.basic_load_case_record = {"max": 0, "min": 1}
+                results.load_case_count = results.row_capacity = 2
+                results.output_components = increments.output_components
+                results.node_tags = increments.node_tags
+                results.ele_tags = increments.ele_tags
+                results.ele_nodes = increments.ele_nodes
+                results.node_responses = {
+                    response: results._new_rows(array.shape[1:])
+                    for response, array in increments.node_responses.items()
+                }
+                results.ele_responses = {
+                    response: {
+                        size: results._new_rows(array.shape[1:])
+                        for size, array in size_arrays.items()
                     }
+                    for response, size_arrays in increments.ele_responses.items()
+                }
+        for block, extrema, locations in zip(
+            self._response_arrays(increments),
+            self._response_arrays(self.extrema),
+            self._response_arrays(self.locations),
+        ):
+            block = block[:count]
+            for row, values, indices, compare in [
+                (0, block.max(axis=0), block.argmax(axis=0), np.greater),
+                (1, block.min(axis=0), block.argmin(axis=0), np.less),
+            ]:
+                # first increment of ties is kept, as in DataArray.idxmax()
+                mask = (
+                    np.ones(values.shape, dtype=bool)
+                    if offset == 0
+                    else compare(values, extrema[row])
                 )
+                extrema[row][mask] = values[mask]
+                locations[row][mask] = indices[mask] + offset
 
-        else:  # no result return None
-            result = None
-        self.result = result  # store to Result class
-        return result
+    def compile_data_array(self, local_force_option=True, main_ele_tags=None):
+        """
+        Compile the envelope into an xarray DataSet with the data variables of
+        :func:`Results.compile_data_array`, along an ``Extrema`` dimension of ``"max"`` and ``"min"`` in place of
+        the ``Loadcase`` dimension. For each data variable with responses, a ``<variable>_loadcase`` data variable
+        holds the load case names of the increments where the extrema occur.
+
+        :returns: xarray DataSet, or None if no increments were enveloped.
+        """
+        if not self.increment_names:
+            return None
+        # rows of extrema are updated in place, recompile instead of reusing compiled arrays
+        self.extrema.compiled = dict()
+        self.locations.compiled = dict()
+        extrema_ds = self.extrema.compile_data_array(
+            local_force_option=local_force_option, main_ele_tags=main_ele_tags
+        ).rename(Loadcase="Extrema")
+        locations_ds = self.locations.compile_data_array(
+            local_force_option=local_force_option, main_ele_tags=main_ele_tags
+        ).rename(Loadcase="Extrema")
+        increment_names = np.array(self.increment_names + [""], dtype=object)
+        for var_name, data_array in locations_ds.data_vars.items():
+            if "Extrema" not in data_array.dims:
+                continue
+            # components not in the response (NaN) have no load case
+            indices = np.nan_to_num(data_array.values, nan=-1).astype(int)
+            extrema_ds[var_name + "_loadcase"] = data_array.copy(
+                data=increment_names[indices]
+            )
+        return extrema_ds
 
 
 # ---------------------------------------------------------------------------------------------------------------------
@@ -3419,7 +5407,10 @@ class OspGrillageShell(OspGrillage):
         # create rigid link command
         self._write_rigid_link()
         # create the result file for the Mesh object
-        self.results = Results(self.Mesh_obj)
+        self.results = Results(
+            self.Mesh_obj, dtype=self.results_dtype, store=self.results_store
+        )
+        self.influence_surfaces = None
 
     # overwrites base class for beam element grillage - specific for Shell model
     def _create_standard_element_list(self):
@@ -3561,6 +5552,7 @@ class OspGrillageShell(OspGrillage):
                 sectiontag=section_tag,
             )
             self.shell_element_command_list.append(ele_str)
+            self.Mesh_obj.add_element_nodes(shell_counter, grid_nodes_list)
             self.global_ele_counter += 1
 
     # overwrite base fix() command procedure
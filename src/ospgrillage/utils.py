@@ -9,7 +9,7 @@ for their workflow.
 import logging
 import numpy as np
 from scipy.spatial import distance
-from scipy.optimize import fsolve, root
+from scipy.optimize import root
 import warnings
 
 logger = logging.getLogger(__name__)
@@ -35,6 +35,7 @@ __all__ = [
     "check_point_in_grid",
     "check_points_direction",
     "calculate_area_given_vertices",
+    "clip_polygons",
     "create_arc_points",
     "find_plane_centroid",
     "get_patch_centroid",
@@ -511,55 +512,103 @@ def solve_zeta_eta(xp, zp, x1, z1, x2, z2, x3, z3, x4, z4):
     """
     Solve for natural coordinates (eta, zeta) from global coordinates.
 
-    Maps a global point (xp, zp) to isoparametric coordinates (eta, zeta) on a
-    quadrilateral element with corners at (x1, z1), (x2, z2), (x3, z3), (x4, z4).
-    Uses bilinear mapping and numerical root finding.
+    Maps global points (xp, zp) to isoparametric coordinates (eta, zeta) on
+    quadrilateral elements with corners at (x1, z1), (x2, z2), (x3, z3), (x4, z4),
+    by inverting the bilinear mapping analytically. Arguments may be arrays of
+    points and/or quadrilaterals, which are broadcast against each other and
+    solved at once. Degenerate quadrilaterals, for which the closed form has no
+    solution, are solved by Newton iteration.
 
     Parameters
     ----------
-    xp, zp : float
-        Global coordinates of the point to map.
-    x1, z1, x2, z2, x3, z3, x4, z4 : float
+    xp, zp : float or array_like
+        Global coordinates of the points to map.
+    x1, z1, x2, z2, x3, z3, x4, z4 : float or array_like
         Global coordinates of element corners.
 
     Returns
     -------
     tuple
-        (eta, zeta) natural coordinates in range [-1, 1] for bilinear elements.
+        (eta, zeta) natural coordinates in range [-1, 1] for points within the
+        elements. Floats if all arguments are scalars, else arrays.
     """
-    # create function to solve for eta and zeta - dynamically for varying parameters x1-x4, z1-z4, zp,xp
-
-    # mapping of natural coordinate eta{-1:1}, zeta{-1:1} to global coordinate (x,z)
-    def obj_func(x, xp, zp, x1, x2, x3, x4, z1, z2, z3, z4):
-        eta = 4 * zp - (
-            (1 - x[0]) * (1 - x[1]) * z1
-            + (1 + x[0]) * (1 - x[1]) * z2
-            + (1 + x[0]) * (1 + x[1]) * z3
-            + (1 - x[0]) * (1 + x[1]) * z4
-        )
-        zeta = 4 * xp - (
-            (1 - x[0]) * (1 - x[1]) * x1
-            + (1 + x[0]) * (1 - x[1]) * x2
-            + (1 + x[0]) * (1 + x[1]) * x3
-            + (1 - x[0]) * (1 + x[1]) * x4
-        )
-        return eta, zeta
-
-    # if initial xp zp is very close (order 1e-8) to the centre (0,0,0) of natural coordinate,
-    # avoid fsolve RunTimeWarning by
-    if all([np.isclose(xp, (x1 + x2) / 2), np.isclose(zp, (z1 + z3) / 2)]):
-        root_func = [0, 0]
-
-    else:
-        root_func = fsolve(
-            obj_func,
-            np.array([-0.4444444444444, 0.99999999]),
-            args=(xp, zp, x1, x2, x3, x4, z1, z2, z3, z4),
-        )  # here the initial values are chosen to avoid RunTimeWarning where initial guess is very close
-        # to the final solution of eta and zeta
-
-    eta = root_func[0]
-    zeta = root_func[1]
+    args = np.broadcast_arrays(
+        *[
+            np.asarray(arg, dtype=float)
+            for arg in (xp, zp, x1, z1, x2, z2, x3, z3, x4, z4)
+        ]
+    )
+    scalar = args[0].ndim == 0
+    xp, zp, x1, z1, x2, z2, x3, z3, x4, z4 = [np.atleast_1d(arg) for arg in args]
+
+    def cross(ux, uz, vx, vz):
+        return ux * vz - uz * vx
+
+    # bilinear mapping p = a + b * eta + c * zeta + d * eta * zeta, relative to a
+    qx = xp - (x1 + x2 + x3 + x4) / 4
+    qz = zp - (z1 + z2 + z3 + z4) / 4
+    bx, bz = (-x1 + x2 + x3 - x4) / 4, (-z1 + z2 + z3 - z4) / 4
+    cx, cz = (-x1 - x2 + x3 + x4) / 4, (-z1 - z2 + z3 + z4) / 4
+    dx, dz = (x1 - x2 + x3 - x4) / 4, (z1 - z2 + z3 - z4) / 4
+    # eliminating eta gives a quadratic A * zeta**2 + B * zeta + C = 0
+    quad_a = cross(dx, dz, cx, cz)
+    quad_b = cross(qx, qz, dx, dz) + cross(bx, bz, cx, cz)
+    quad_c = cross(qx, qz, bx, bz)
+    scale = np.maximum(np.abs(bx) + np.abs(bz), np.abs(cx) + np.abs(cz)) ** 2
+    tol = 1e-12 * np.where(scale > 0, scale, 1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # parallelograms (A = 0) have a linear equation
+        linear = np.abs(quad_a) <= tol
+        discriminant = quad_b**2 - 4 * quad_a * quad_c
+        sqrt_disc = np.sqrt(np.maximum(discriminant, 0))
+        # numerically stable roots of the quadratic
+        half = -0.5 * (quad_b + np.where(quad_b >= 0, sqrt_disc, -sqrt_disc))
+        root_1 = np.where(linear, -quad_c / quad_b, half / quad_a)
+        root_2 = np.where(linear, root_1, quad_c / half)
+        root_2 = np.where(np.isfinite(root_2), root_2, root_1)
+
+        def solve_eta(zeta):
+            # least squares solution of (q - c * zeta) = eta * (b + d * zeta)
+            ex, ez = bx + dx * zeta, bz + dz * zeta
+            return ((qx - cx * zeta) * ex + (qz - cz * zeta) * ez) / (ex**2 + ez**2)
+
+        eta_1, eta_2 = solve_eta(root_1), solve_eta(root_2)
+        # select root closest to the element
+        take_2 = np.nan_to_num(
+            np.maximum(np.abs(eta_2), np.abs(root_2)), nan=np.inf
+        ) < np.nan_to_num(np.maximum(np.abs(eta_1), np.abs(root_1)), nan=np.inf)
+        eta = np.where(take_2, eta_2, eta_1)
+        zeta = np.where(take_2, root_2, root_1)
+
+    # Newton iteration where the closed form fails, i.e. degenerate elements
+    fallback = ~(np.isfinite(eta) & np.isfinite(zeta)) | (
+        (discriminant < -1e-12 * scale**2) & ~linear
+    )
+    if fallback.any():
+        eta_n = np.zeros(np.count_nonzero(fallback))
+        zeta_n = np.zeros_like(eta_n)
+        qx, qz, bx, bz, cx, cz, dx, dz = [
+            var[fallback] for var in (qx, qz, bx, bz, cx, cz, dx, dz)
+        ]
+        for _ in range(50):
+            rx = bx * eta_n + cx * zeta_n + dx * eta_n * zeta_n - qx
+            rz = bz * eta_n + cz * zeta_n + dz * eta_n * zeta_n - qz
+            j11, j12 = bx + dx * zeta_n, cx + dx * eta_n
+            j21, j22 = bz + dz * zeta_n, cz + dz * eta_n
+            det = j11 * j22 - j12 * j21
+            det = np.where(np.abs(det) > 1e-300, det, 1e-300)
+            d_eta = (j22 * rx - j12 * rz) / det
+            d_zeta = (j11 * rz - j21 * rx) / det
+            eta_n -= d_eta
+            zeta_n -= d_zeta
+            if np.all(np.abs(d_eta) + np.abs(d_zeta) < 1e-12):
+                break
+        eta[fallback] = eta_n
+        zeta[fallback] = zeta_n
+
+    if scalar:
+        return float(eta[0]), float(zeta[0])
     return eta, zeta
 
 
@@ -959,6 +1008,87 @@ def get_patch_centroid(point_list):
     return xc, yc, zc
 
 
+def clip_polygons(subject, clip_vertices, tol=0.0):
+    """
+    Clip a polygon against arrays of convex polygons.
+
+    Vectorised Sutherland-Hodgman clipping of one subject polygon against each
+    convex clip polygon at once, in the x-z plane. The subject may be concave.
+
+    Parameters
+    ----------
+    subject : array_like
+        (N, 2) array of [x, z] vertices of the subject polygon, sorted
+        counter-clockwise. A segment is clipped if N = 2.
+    clip_vertices : array_like
+        (G, M, 2) array of [x, z] vertices of G convex clip polygons, sorted
+        counter-clockwise. Repeated vertices (e.g. triangles padded to four
+        vertices) are allowed.
+    tol : float, optional
+        Distance tolerance of points on the edges of clip polygons, and of
+        coincident vertices of clipped polygons (default 0).
+
+    Returns
+    -------
+    tuple
+        (vertices, counts) where vertices is a (G, K, 2) array of the vertices
+        of the clipped polygons, counter-clockwise and padded after counts[g]
+        vertices, and counts is the (G,) array of the number of vertices.
+    """
+    subject = np.asarray(subject, dtype=float)
+    clip_vertices = np.asarray(clip_vertices, dtype=float)
+    grid_count, clip_count = clip_vertices.shape[:2]
+    poly = np.repeat(subject[None], grid_count, axis=0)
+    counts = np.full(grid_count, len(subject))
+
+    def next_vertex(poly, counts):
+        # index of next vertex of each polygon, wrapping around at counts
+        index = np.arange(poly.shape[1])[None]
+        return np.where(index + 1 < counts[:, None], index + 1, 0)
+
+    def compact(vertices, keep):
+        # move kept vertices to the front of each polygon
+        order = np.argsort(~keep, axis=1, kind="stable")
+        counts = keep.sum(axis=1)
+        size = max(counts.max(initial=0), 1)
+        vertices = np.take_along_axis(vertices, order[..., None], axis=1)
+        return vertices[:, :size], counts
+
+    for edge in range(clip_count):
+        start = clip_vertices[:, edge, None]
+        end = clip_vertices[:, (edge + 1) % clip_count, None]
+        edge_vector = end - start
+        edge_length = np.hypot(edge_vector[..., 0], edge_vector[..., 1])
+        # signed distance (scaled by edge length), positive to the left of clip edge
+        relative = poly - start
+        dist = (
+            edge_vector[..., 0] * relative[..., 1]
+            - edge_vector[..., 1] * relative[..., 0]
+        )
+        valid = np.arange(poly.shape[1])[None] < counts[:, None]
+        nxt = next_vertex(poly, counts)
+        next_dist = np.take_along_axis(dist, nxt, axis=1)
+        next_poly = np.take_along_axis(poly, nxt[..., None], axis=1)
+        inside = dist >= -tol * edge_length
+        next_inside = next_dist >= -tol * edge_length
+        crossing = valid & (inside != next_inside)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = np.where(crossing, dist / (dist - next_dist), 0)
+        cross_point = poly + t[..., None] * (next_poly - poly)
+        # each vertex emits itself if inside, and the crossing point of its edge
+        vertices = np.stack([poly, cross_point], axis=2).reshape(grid_count, -1, 2)
+        keep = np.stack([valid & inside, crossing], axis=2).reshape(grid_count, -1)
+        poly, counts = compact(vertices, keep)
+
+    # remove coincident consecutive vertices
+    index = np.arange(poly.shape[1])[None]
+    nxt = next_vertex(poly, counts)
+    gap = np.take_along_axis(poly, nxt[..., None], axis=1) - poly
+    gap = np.hypot(gap[..., 0], gap[..., 1])
+    keep = (index < counts[:, None]) & ((gap > tol) | (nxt == index))
+    return compact(poly, keep)
+
+
 def check_dict_same_keys(d_1, d_2):
     """
     Merge two nested dictionaries, combining values for common keys.
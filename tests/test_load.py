@@ -758,6 +758,998 @@ def test_moving_load_and_basic_load_together(bridge_model_42_negative):
     print(results)
 
 
+# test factor once linear static mode returns the same results as the default analysis
+def test_factor_once_analysis(bridge_model_42_negative):
+    og.ops.wipeAnalysis()
+    example_bridge = bridge_model_42_negative
+
+    barrierpoint_1 = og.create_load_vertex(x=5, y=0, z=1, p=2)
+    barrierpoint_2 = og.create_load_vertex(x=10, y=0, z=1, p=2)
+    Barrier = og.create_load(
+        loadtype="line",
+        name="Barrier curb load",
+        point1=barrierpoint_1,
+        point2=barrierpoint_2,
+        shape_function="hermite",
+    )
+    barrier_load_case = og.create_load_case(name="Barrier")
+    barrier_load_case.add_load(Barrier)
+    example_bridge.add_load_case(barrier_load_case)
+
+    front_wheel = og.create_load(
+        loadtype="point",
+        name="front wheel",
+        point1=og.LoadPoint(2, 0, 2, 50),
+        shape_function="hermite",
+    )
+    single_path = og.create_moving_path(
+        start_point=og.Point(2, 0, 2), end_point=og.Point(8, 0, 3), increments=5
+    )
+    move_point = og.create_moving_load(name="single_moving_point")
+    move_point.set_path(single_path)
+    move_point.add_load(load_obj=front_wheel)
+    example_bridge.add_load_case(move_point)
+
+    example_bridge.analyze()
+    ref_results = example_bridge.get_results()
+
+    # rerun all load cases with a single factorisation of the stiffness matrix
+    example_bridge.results = og.Results(example_bridge.Mesh_obj)
+    example_bridge.analyze(factor_once=True)
+    results = example_bridge.get_results()
+
+    assert list(results.Loadcase.values) == list(ref_results.Loadcase.values)
+    assert og.np.allclose(
+        results.displacements.values.astype(float),
+        ref_results.displacements.values.astype(float),
+        equal_nan=True,
+    )
+    assert og.np.allclose(
+        results.forces.values.astype(float),
+        ref_results.forces.values.astype(float),
+        equal_nan=True,
+    )
+
+    # evaluate the load cases directly with Analysis objects
+    load_case_dict_list = example_bridge.load_case_list + [
+        inc_dict
+        for inc_list in example_bridge.moving_load_case_dict.values()
+        for inc_dict in inc_list
+    ]
+    ref_analysis_list = [
+        example_bridge._create_analysis(load_case_dict)
+        for load_case_dict in load_case_dict_list
+    ]
+    for analysis in ref_analysis_list:
+        analysis.evaluate_analysis()
+    analysis_list = [
+        example_bridge._create_analysis(load_case_dict)
+        for load_case_dict in load_case_dict_list
+    ]
+    og.Analysis.evaluate_factor_once(analysis_list)
+    for analysis, ref_analysis in zip(analysis_list, ref_analysis_list):
+        assert analysis.node_disp.keys() == ref_analysis.node_disp.keys()
+        assert og.np.allclose(
+            list(analysis.node_disp.values()), list(ref_analysis.node_disp.values())
+        )
+        assert og.np.allclose(
+            list(analysis.ele_force.values()), list(ref_analysis.ele_force.values())
+        )
+
+    with pytest.raises(ValueError):
+        example_bridge.analyze(analysis_type="Transient", factor_once=True)
+
+
+# test analysis session sets up the analysis once and swaps the loads of a single pattern
+def test_analysis_session(bridge_model_42_negative):
+    og.ops.wipeAnalysis()
+    example_bridge = bridge_model_42_negative
+
+    front_wheel = og.create_load(
+        loadtype="point",
+        name="front wheel",
+        point1=og.LoadPoint(2, 0, 2, 50),
+        shape_function="hermite",
+    )
+    single_path = og.create_moving_path(
+        start_point=og.Point(2, 0, 2), end_point=og.Point(8, 0, 3), increments=5
+    )
+    move_point = og.create_moving_load(name="single_moving_point")
+    move_point.set_path(single_path)
+    move_point.add_load(load_obj=front_wheel)
+    example_bridge.add_load_case(move_point)
+
+    example_bridge.analyze()
+    command_log = "".join(example_bridge.analysis_command)
+    assert command_log.count("ops.analysis(") == 1
+    assert command_log.count("ops.timeSeries(") == 1
+    assert command_log.count("ops.pattern(") == 5
+    # session removes its pattern once complete
+    assert len(og.ops.getPatterns()) == 0
+
+    # responses match standalone evaluation of each load case
+    increment_analysis = example_bridge._create_analysis(
+        load_case_dict=example_bridge.moving_load_case_dict["single_moving_point"][2]
+    )
+    increment_analysis.evaluate_analysis()
+    results = example_bridge.get_results()
+    assert og.np.allclose(
+        results.displacements.isel(Loadcase=2)
+        .sel(Component=["x", "y", "z", "theta_x", "theta_y", "theta_z"])
+        .values.astype(float),
+        [
+            increment_analysis.node_disp[node]
+            for node in results.displacements.Node.values
+        ],
+    )
+
+
+# test analyses sharded across worker processes return the same results as serial analysis
+def test_analysis_in_worker_processes(bridge_model_42_negative):
+    og.ops.wipeAnalysis()
+    example_bridge = bridge_model_42_negative
+
+    barrierpoint_1 = og.create_load_vertex(x=5, y=0, z=1, p=2)
+    barrierpoint_2 = og.create_load_vertex(x=10, y=0, z=1, p=2)
+    Barrier = og.create_load(
+        loadtype="line",
+        name="Barrier curb load",
+        point1=barrierpoint_1,
+        point2=barrierpoint_2,
+        shape_function="hermite",
+    )
+    barrier_load_case = og.create_load_case(name="Barrier")
+    barrier_load_case.add_load(Barrier)
+    example_bridge.add_load_case(barrier_load_case)
+
+    front_wheel = og.create_load(
+        loadtype="point",
+        name="front wheel",
+        point1=og.LoadPoint(2, 0, 2, 50),
+        shape_function="hermite",
+    )
+    single_path = og.create_moving_path(
+        start_point=og.Point(2, 0, 2), end_point=og.Point(8, 0, 3), increments=5
+    )
+    move_point = og.create_moving_load(name="single_moving_point")
+    move_point.set_path(single_path)
+    move_point.add_load(load_obj=front_wheel)
+    example_bridge.add_load_case(move_point)
+
+    example_bridge.analyze()
+    ref_results = example_bridge.get_results()
+
+    example_bridge.results = og.Results(example_bridge.Mesh_obj)
+    example_bridge.analyze(workers=2)
+    results = example_bridge.get_results()
+
+    assert list(results.Loadcase.values) == list(ref_results.Loadcase.values)
+    assert og.np.allclose(
+        results.displacements.values.astype(float),
+        ref_results.displacements.values.astype(float),
+        equal_nan=True,
+    )
+    assert og.np.allclose(
+        results.forces.values.astype(float),
+        ref_results.forces.values.astype(float),
+        equal_nan=True,
+    )
+
+
+# test analysis with user selected and automatically selected system and numberer
+def test_analysis_solver_options(shell_link_bridge):
+    og.ops.wipeAnalysis()
+    shell_link_model = shell_link_bridge
+
+    assert shell_link_model._get_solver_options() == ("BandGeneral", "Plain")
+    assert shell_link_model._get_solver_options(system="auto") == ("BandSPD", "RCM")
+    assert shell_link_model._get_solver_options(
+        system="auto", analysis_type="Transient"
+    ) == ("BandGeneral", "RCM")
+    shell_link_model.AUTO_BAND_DOF_LIMIT = 0
+    # sparse SPD solver is not used for shell link models with transformation constraints
+    assert shell_link_model._get_solver_options(system="auto") == ("UmfPack", "RCM")
+
+    lane_point_1 = og.create_load_vertex(x=5, y=0, z=3, p=5)
+    lane_point_2 = og.create_load_vertex(x=8, y=0, z=3, p=5)
+    lane_point_3 = og.create_load_vertex(x=8, y=0, z=5, p=5)
+    lane_point_4 = og.create_load_vertex(x=5, y=0, z=5, p=5)
+    Lane = og.PatchLoading(
+        point1=lane_point_1,
+        point2=lane_point_2,
+        point3=lane_point_3,
+        point4=lane_point_4,
+    )
+    ULS_DL = og.LoadCase(name="Lane")
+    ULS_DL.add_load(Lane)
+    shell_link_model.add_load_case(ULS_DL)
+    shell_link_model.analyze()
+    ref_results = shell_link_model.get_results()
+
+    shell_link_model.results = og.Results(shell_link_model.Mesh_obj)
+    shell_link_model.analyze(system="auto")
+    assert "ops.system('UmfPack')\n" in shell_link_model.analysis_command
+    results = shell_link_model.get_results()
+    assert og.np.allclose(
+        results.displacements.values.astype(float),
+        ref_results.displacements.values.astype(float),
+        equal_nan=True,
+    )
+
+
+# test responses recorded in bulk by analysis session match responses queried per node and element
+def test_analysis_session_recorded_responses(shell_link_bridge):
+    og.ops.wipeAnalysis()
+    shell_link_model = shell_link_bridge
+
+    lane_point_1 = og.create_load_vertex(x=5, y=0, z=3, p=5)
+    lane_point_2 = og.create_load_vertex(x=8, y=0, z=3, p=5)
+    lane_point_3 = og.create_load_vertex(x=8, y=0, z=5, p=5)
+    lane_point_4 = og.create_load_vertex(x=5, y=0, z=5, p=5)
+    Lane = og.PatchLoading(
+        point1=lane_point_1,
+        point2=lane_point_2,
+        point3=lane_point_3,
+        point4=lane_point_4,
+    )
+    ULS_DL = og.LoadCase(name="Lane")
+    ULS_DL.add_load(Lane)
+    shell_link_model.add_load_case(ULS_DL)
+
+    analysis = shell_link_model._create_analysis(
+        load_case_dict=shell_link_model.load_case_list[0]
+    )
+    session = shell_link_model._create_session()
+    session.solve(analysis)
+    # recorded responses are stored on collect
+    assert analysis.node_disp == {}
+    session.collect()
+
+    # query responses of the solved domain per node and element
+    ref_analysis = shell_link_model._create_analysis(
+        load_case_dict=shell_link_model.load_case_list[0]
+    )
+    ref_analysis.extract_grillage_responses()
+    session.close()
+
+    assert list(analysis.node_disp) == list(ref_analysis.node_disp)
+    assert og.np.allclose(
+        list(analysis.node_disp.values()), list(ref_analysis.node_disp.values())
+    )
+    assert list(analysis.node_vel.values()) == list(ref_analysis.node_vel.values())
+    for ele_tag, ref_force in ref_analysis.ele_force.items():
+        assert og.np.allclose(analysis.ele_force[ele_tag], ref_force)
+    for ele_tag, ref_force in ref_analysis.global_ele_force.items():
+        assert og.np.allclose(analysis.global_ele_force[ele_tag], ref_force)
+
+
+# test output request extracts and stores only the requested nodes, elements and components
+def test_analysis_output_request(bridge_model_42_negative):
+    og.ops.wipeAnalysis()
+    example_bridge = bridge_model_42_negative
+
+    front_wheel = og.create_load(
+        loadtype="point",
+        name="front wheel",
+        point1=og.LoadPoint(2, 0, 2, 50),
+        shape_function="hermite",
+    )
+    single_path = og.create_moving_path(
+        start_point=og.Point(2, 0, 2), end_point=og.Point(8, 0, 3), increments=5
+    )
+    move_point = og.create_moving_load(name="single_moving_point")
+    move_point.set_path(single_path)
+    move_point.add_load(load_obj=front_wheel)
+    example_bridge.add_load_case(move_point)
+
+    example_bridge.analyze()
+    ref_results = example_bridge.get_results()
+
+    example_bridge.results = og.Results(example_bridge.Mesh_obj)
+    example_bridge.analyze(
+        output=og.OutputRequest(
+            members=["interior_main_beam"], components=["y", "Mz_i", "Mz_j"]
+        )
+    )
+    results = example_bridge.get_results()
+    member_elements = [
+        tag
+        for z_group_num in range(3)
+        for tag in example_bridge.get_element(
+            member="interior_main_beam", options="elements", z_group_num=z_group_num
+        )
+    ]
+    assert sorted(results.Element.values) == sorted(member_elements)
+    assert set(results.Component.values) == {"y", "Mz_i", "Mz_j"}
+    assert "velocity" not in results
+    assert og.np.allclose(
+        results.forces.sel(Component=["Mz_i", "Mz_j"]).values.astype(float),
+        ref_results.forces.sel(
+            Element=results.Element.values, Component=["Mz_i", "Mz_j"]
+        ).values.astype(float),
+    )
+    assert og.np.allclose(
+        results.displacements.sel(Component="y").values.astype(float),
+        ref_results.displacements.sel(
+            Node=results.Node.values, Component="y"
+        ).values.astype(float),
+    )
+
+    # local forces
+    example_bridge.results = og.Results(example_bridge.Mesh_obj)
+    example_bridge.analyze(output={"elements": [14, 22], "forces": "local"})
+    results = example_bridge.get_results(local_forces=True)
+    assert list(results.Element.values) == [14, 22]
+
+    with pytest.raises(ValueError):
+        example_bridge.analyze(output={"components": ["Mz"]})
+    with pytest.raises(ValueError):
+        example_bridge.analyze(output={"members": ["main_beam"]})
+
+
+# test results are stored in numeric arrays growing with the number of load cases
+def test_numeric_results(bridge_model_42_negative):
+    og.ops.wipeAnalysis()
+    example_bridge = bridge_model_42_negative
+
+    front_wheel = og.create_load(
+        loadtype="point",
+        name="front wheel",
+        point1=og.LoadPoint(2, 0, 2, 50),
+        shape_function="hermite",
+    )
+    single_path = og.create_moving_path(
+        start_point=og.Point(2, 0, 2), end_point=og.Point(8, 0, 3), increments=20
+    )
+    move_point = og.create_moving_load(name="single_moving_point")
+    move_point.set_path(single_path)
+    move_point.add_load(load_obj=front_wheel)
+    example_bridge.add_load_case(move_point)
+
+    example_bridge.analyze()
+    results = example_bridge.get_results()
+    assert example_bridge.results.load_case_count == 20
+    assert example_bridge.results.row_capacity == 32
+    assert results.displacements.dtype == og.np.float64
+    assert results.forces.dtype == og.np.float64
+    envelope = results.forces.sel(Component="Mz_i").max(dim="Loadcase")
+    assert og.np.allclose(
+        envelope.values,
+        og.np.max(
+            example_bridge.results.ele_responses["forces"][12][:20, :, 5], axis=0
+        ),
+    )
+
+    example_bridge.results = og.Results(example_bridge.Mesh_obj, dtype=og.np.float32)
+    example_bridge.analyze()
+    results_32 = example_bridge.get_results()
+    assert results_32.displacements.dtype == og.np.float32
+    assert og.np.allclose(
+        results_32.forces.sel(Component="Mz_i").values,
+        results.forces.sel(Component="Mz_i").values,
+        rtol=1e-4,
+        atol=1e-6,
+    )
+
+
+def test_compiled_results_cache(bridge_model_42_negative):
+    og.ops.wipeAnalysis()
+    example_bridge = bridge_model_42_negative
+
+    point_load = og.create_load(
+        loadtype="point", name="point", point1=og.LoadPoint(5, 0, 3, 20)
+    )
+    point_case = og.create_load_case(name="point case")
+    point_case.add_load(point_load)
+    example_bridge.add_load_case(point_case)
+
+    front_wheel = og.create_load(
+        loadtype="point", name="front wheel", point1=og.LoadPoint(2, 0, 2, 50)
+    )
+    single_path = og.create_moving_path(
+        start_point=og.Point(2, 0, 2), end_point=og.Point(8, 0, 3), increments=5
+    )
+    move_point = og.create_moving_load(name="first moving point")
+    move_point.set_path(single_path)
+    move_point.add_load(load_obj=front_wheel)
+    example_bridge.add_load_case(move_point)
+    example_bridge.analyze()
+
+    results = example_bridge.get_results()
+    compiled = example_bridge.results.compiled[False]
+    compiled_data = compiled["variables"]["forces"]["data"]
+    # compiled arrays are reused by get_results() until new load cases are analysed
+    example_bridge.get_results()
+    assert compiled["variables"]["forces"]["data"] is compiled_data
+    # returned DataSets are copies, modifying them leaves the compiled arrays unchanged
+    modified = example_bridge.get_results()
+    modified["forces"] *= 2
+    assert results.identical(example_bridge.get_results())
+
+    move_point_2 = og.create_moving_load(name="second moving point")
+    move_point_2.set_path(single_path)
+    move_point_2.add_load(load_obj=front_wheel)
+    example_bridge.add_load_case(move_point_2)
+    example_bridge.analyze()
+    appended = example_bridge.get_results()
+    assert appended.sizes["Loadcase"] == 11
+    assert not og.np.shares_memory(
+        appended.forces.values,
+        example_bridge.results.compiled[False]["variables"]["forces"]["data"],
+    )
+
+    example_bridge.results.compiled = dict()
+    recompiled = example_bridge.get_results()
+    assert appended.identical(recompiled)
+    assert results.identical(
+        recompiled.isel(Loadcase=slice(0, results.sizes["Loadcase"]))
+    )
+
+
+# test batch distribution of point loads matches distribution of each point load
+def test_distribute_point_loads(bridge_model_42_negative):
+    example_bridge = bridge_model_42_negative
+    x = og.np.array([2.0, 3.3, 5.0, 8.7, 0.1, 50.0])
+    z = og.np.array([2.0, 1.2, 3.5, 6.9, 0.2, 50.0])
+    mag = og.np.array([10.0, 20.0, 30.0, 40.0, 50.0, 60.0])
+    for shape_function in ["linear", "hermite"]:
+        nodal_loads = example_bridge.distribute_point_loads(
+            x, z, mag, shape_function=shape_function
+        )
+        node_row = {tag: row for row, tag in enumerate(example_bridge.get_nodes())}
+        expected = og.np.zeros((len(node_row), 6))
+        for xp, zp, p in zip(x, z, mag):
+            for _, (node, *load), _ in example_bridge._assign_load_to_four_node(
+                [xp, 0, zp], p, shape_func=shape_function
+            ):
+                expected[node_row[node]] += load
+        assert og.np.allclose(nodal_loads, expected)
+        assert nodal_loads[:, 1].sum() > 0
+    # point loads outside mesh are ignored
+    assert not example_bridge.distribute_point_loads(50, 50, 10).any()
+
+
+# test load distributions of moving load increments are reused from the load distribution cache
+def test_load_distribution_cache(bridge_model_42_negative):
+    example_bridge = bridge_model_42_negative
+    front_wheel = og.create_load(
+        loadtype="point",
+        name="front wheel",
+        point1=og.LoadPoint(2, 0, 2, 50),
+        shape_function="hermite",
+    )
+    single_path = og.create_moving_path(
+        start_point=og.Point(2, 0, 2), end_point=og.Point(8, 0, 3), increments=10
+    )
+    for name in ["first pass", "second pass"]:
+        move_point = og.create_moving_load(name=name)
+        move_point.set_path(single_path)
+        move_point.add_load(load_obj=front_wheel)
+        example_bridge.add_load_case(move_point)
+        # one distribution per position of the wheel
+        assert len(example_bridge.load_distribution_cache) == 10
+
+    # least recently used distributions are evicted
+    example_bridge.load_cache_size = 3
+    example_bridge.load_distribution_cache.clear()
+    move_point = og.create_moving_load(name="third pass")
+    move_point.set_path(single_path)
+    move_point.add_load(load_obj=front_wheel)
+    example_bridge.add_load_case(move_point)
+    assert len(example_bridge.load_distribution_cache) == 3
+
+    # distributions without cache
+    example_bridge.load_cache_size = 0
+    example_bridge.load_distribution_cache.clear()
+    heavy_wheel = og.create_load(
+        loadtype="point",
+        name="heavy wheel",
+        point1=og.LoadPoint(2, 0, 2, 100),
+        shape_function="hermite",
+    )
+    move_point = og.create_moving_load(name="uncached pass")
+    move_point.set_path(single_path)
+    move_point.add_load(load_obj=heavy_wheel)
+    example_bridge.add_load_case(move_point)
+    assert len(example_bridge.load_distribution_cache) == 0
+    for cached, uncached in zip(
+        example_bridge.moving_load_case_dict["first pass"],
+        example_bridge.moving_load_case_dict["uncached pass"],
+    ):
+        for cached_command, uncached_command in zip(
+            cached["load_command"], uncached["load_command"]
+        ):
+            assert cached_command[1][0] == uncached_command[1][0]
+            assert og.np.allclose(
+                2 * og.np.array(cached_command[1][1:]), uncached_command[1][1:]
+            )
+
+    # moving line loads are distributed at each position of the line
+    line = og.create_load(
+        loadtype="line",
+        name="moving line",
+        point1=og.create_load_vertex(x=1, y=0, z=2, p=2),
+        point2=og.create_load_vertex(x=2, y=0, z=3, p=2),
+    )
+    line_path = og.create_moving_path(
+        start_point=og.Point(3, 0, 1), end_point=og.Point(6, 0, 2), increments=5
+    )
+    for name, load_cache_size in [("cached line", 4096), ("uncached line", 0)]:
+        example_bridge.load_cache_size = load_cache_size
+        example_bridge.load_distribution_cache.clear()
+        move_line = og.create_moving_load(name=name)
+        move_line.set_path(line_path)
+        move_line.add_load(load_obj=line)
+        example_bridge.add_load_case(move_line)
+    cached_commands = [
+        inc["load_command"]
+        for inc in example_bridge.moving_load_case_dict["cached line"]
+    ]
+    uncached_commands = [
+        inc["load_command"]
+        for inc in example_bridge.moving_load_case_dict["uncached line"]
+    ]
+    assert all(cached_commands)
+    assert len({str(commands) for commands in cached_commands}) == 5
+    for cached_command_list, uncached_command_list in zip(
+        cached_commands, uncached_commands
+    ):
+        assert len(cached_command_list) == len(uncached_command_list)
+        for cached_command, uncached_command in zip(
+            cached_command_list, uncached_command_list
+        ):
+            assert cached_command[1][0] == uncached_command[1][0]
+            assert og.np.allclose(cached_command[1][1:], uncached_command[1][1:])
+
+
+# test increments of moving loads reference a single copy of the load, moved when distributed
+def test_moving_load_increment_references():
+    front_wheel = og.create_load(
+        loadtype="point",
+        name="front wheel",
+        point1=og.LoadPoint(2, 0, 2, 50),
+    )
+    back_wheel = og.create_load(
+        loadtype="point",
+        name="back wheel",
+        point1=og.LoadPoint(0, 0, 2, 20),
+    )
+    truck = og.create_compound_load(name="truck")
+    truck.add_load(front_wheel)
+    truck.add_load(back_wheel)
+    moving_truck = og.create_moving_load(name="moving truck")
+    moving_truck.set_path(
+        og.create_moving_path(
+            start_point=og.Point(1, 0, 1), end_point=og.Point(3, 0, 1), increments=3
+        )
+    )
+    moving_truck.add_load(truck)
+    increments = moving_truck.parse_moving_load_cases()[0]
+
+    assert len(increments) == 3
+    assert increments[0].load_groups[0]["load"] is increments[2].load_groups[0]["load"]
+    for increment in increments:
+        (truck_loads,) = increment.get_load_groups()
+        moved_wheels = truck_loads["load"].compound_load_obj_list
+        assert [wheel.load_point_1.x for wheel in moved_wheels] == [
+            2 + increment.position.x,
+            0 + increment.position.x,
+        ]
+        assert moved_wheels[0].load_point_1.z == 2 + increment.position.z
+    # referenced loads are not moved
+    referenced_truck = increments[0].load_groups[0]["load"]
+    assert referenced_truck.compound_load_obj_list[0].load_point_1.x == 2
+    assert front_wheel.load_point_1.x == 2
+
+
+# test patch load on grid lines distributes the load on the patch area within the mesh
+def test_patch_load_on_grid_lines(shell_link_bridge):
+    shell_link_model = shell_link_bridge
+    mesh = shell_link_model.Mesh_obj
+    x_lines = sorted(set(coord["coordinate"][0] for coord in mesh.node_spec.values()))
+    z_lines = sorted(set(coord["coordinate"][2] for coord in mesh.node_spec.values()))
+    x1, x2, z1, z2 = x_lines[2], x_lines[6], z_lines[1], z_lines[4]
+    points = [
+        og.create_load_vertex(x=x, y=0, z=z, p=5)
+        for x, z in [(x1, z1), (x2, z1), (x2, z2), (x1, z2)]
+    ]
+    patch = og.create_load(
+        loadtype="patch",
+        point1=points[0],
+        point2=points[1],
+        point3=points[2],
+        point4=points[3],
+    )
+    load_command = shell_link_model._assign_patch_load(patch)
+    total = sum(command[1][2] for command in load_command)
+    assert total == pytest.approx(5 * (x2 - x1) * (z2 - z1))
+
+
+# test load commands are consolidated into a nodal load vector with duplicated nodes summed
+def test_nodal_load_vector(bridge_model_42_negative):
+    og.ops.wipeAnalysis()
+    example_bridge = bridge_model_42_negative
+    static_case = og.create_load_case(name="two wheels")
+    for _ in range(2):
+        static_case.add_load(
+            og.create_load(
+                loadtype="point",
+                name="wheel",
+                point1=og.LoadPoint(5, 0, 2, 20),
+                shape_function="hermite",
+            )
+        )
+    example_bridge.add_load_case(static_case, load_factor=1.5)
+    load_command = example_bridge.load_case_list[0]["load_command"]
+    command_nodes = [args[0] for _, args, _ in load_command]
+    assert len(command_nodes) == 2 * len(set(command_nodes))
+
+    analysis = example_bridge._create_analysis(example_bridge.load_case_list[0])
+    node_tags, loads = analysis.get_nodal_loads()
+    assert node_tags.tolist() == list(dict.fromkeys(command_nodes))
+    assert loads.shape == (len(node_tags), 6)
+    expected = {node: np.zeros(6) for node in node_tags.tolist()}
+    for _, args, _ in load_command:
+        expected[args[0]] += 1.5 * np.array(args[1:])
+    assert np.allclose(loads, [expected[node] for node in node_tags.tolist()])
+
+    example_bridge.analyze()
+    command_log = "".join(example_bridge.analysis_command)
+    assert command_log.count("ops.load(") == len(node_tags)
+
+
+# test lazy load distribution defers distribution to analyze, for the selected load cases only
+def test_lazy_load_distribution(bridge_model_42_negative):
+    og.ops.wipeAnalysis()
+    example_bridge = bridge_model_42_negative
+    wheel = og.create_load(
+        loadtype="point",
+        name="wheel",
+        point1=og.LoadPoint(5, 0, 2, 20),
+        shape_function="hermite",
+    )
+    static_case = og.create_load_case(name="static wheel")
+    static_case.add_load(wheel)
+    example_bridge.add_load_case(static_case, lazy=True)
+    single_path = og.create_moving_path(
+        start_point=og.Point(2, 0, 2), end_point=og.Point(8, 0, 3), increments=5
+    )
+    move_point = og.create_moving_load(name="single_moving_point")
+    move_point.set_path(single_path)
+    move_point.add_load(load_obj=wheel)
+    example_bridge.add_load_case(move_point, lazy=True)
+    increment_list = example_bridge.moving_load_case_dict["single_moving_point"]
+    # load commands of pending load cases are empty until analyzed
+    assert example_bridge.load_case_list[0]["pending"]
+    assert example_bridge.load_case_list[0]["load_command"] == []
+    assert all(inc["pending"] and inc["load_command"] == [] for inc in increment_list)
+
+    example_bridge.analyze(load_case="static wheel")
+    load_command = example_bridge.load_case_list[0]["load_command"]
+    assert load_command == example_bridge._distribute_load_types_to_model(
+        load_case_obj=static_case
+    )
+    assert not example_bridge.load_case_list[0]["pending"]
+    assert all(inc["pending"] for inc in increment_list)
+
+    # increments are distributed in the worker processes
+    example_bridge.analyze(load_case="single_moving_point", workers=2)
+    for inc in increment_list:
+        assert inc["load_command"] == example_bridge._distribute_load_types_to_model(
+            load_case_obj=inc["loadcase"]
+        )
+    results = example_bridge.get_results(load_case="single_moving_point")
+    assert results.sizes["Loadcase"] == len(increment_list)
+
+
+# test load cases are selected in get_results by their index, moving load cases by their range of increments
+def test_load_case_index_selection(bridge_model_42_negative):
+    og.ops.wipeAnalysis()
+    example_bridge = bridge_model_42_negative
+    wheel = og.create_load(
+        loadtype="point", name="wheel", point1=og.LoadPoint(5, 0, 3, 20)
+    )
+    for name in ["Wheel", "Wheel 2"]:
+        wheel_load_case = og.create_load_case(name=name)
+        wheel_load_case.add_load(wheel)
+        example_bridge.add_load_case(wheel_load_case)
+    single_path = og.create_moving_path(
+        start_point=og.Point(2, 0, 2), end_point=og.Point(8, 0, 3), increments=4
+    )
+    move_point = og.create_moving_load(name="single_moving_point")
+    move_point.set_path(single_path)
+    move_point.add_load(load_obj=wheel)
+    example_bridge.add_load_case(move_point)
+    example_bridge.analyze()
+    increment_names = [
+        inc["name"]
+        for inc in example_bridge.moving_load_case_dict["single_moving_point"]
+    ]
+    all_results = example_bridge.get_results()
+
+    index = example_bridge.results.get_load_case_index(["single_moving_point", "Wheel"])
+    assert index.tolist() == [2, 3, 4, 5, 0]
+    moving_results = example_bridge.get_results(load_case="single_moving_point")
+    assert list(moving_results["Loadcase"].values) == increment_names
+    assert np.allclose(
+        moving_results["forces"],
+        all_results["forces"].sel(Loadcase=increment_names),
+        equal_nan=True,
+    )
+    selected = example_bridge.get_results(load_case=["Wheel 2", "single_moving_point"])
+    assert list(selected["Loadcase"].values) == ["Wheel 2"] + increment_names
+    # a single load case is returned without the Loadcase dimension
+    assert "Loadcase" not in example_bridge.get_results(load_case="Wheel").dims
+    with pytest.raises(ValueError):
+        example_bridge.get_results(load_case="not a load case")
+
+
+def test_result_store(bridge_model_42_negative, tmp_path):
+    pytest.importorskip("netCDF4")
+    og.ops.wipeAnalysis()
+    example_bridge = bridge_model_42_negative
+    wheel = og.create_load(
+        loadtype="point", name="wheel", point1=og.LoadPoint(5, 0, 3, 20)
+    )
+    wheel_load_case = og.create_load_case(name="Wheel")
+    wheel_load_case.add_load(wheel)
+    example_bridge.add_load_case(wheel_load_case)
+    single_path = og.create_moving_path(
+        start_point=og.Point(2, 0, 2), end_point=og.Point(8, 0, 3), increments=4
+    )
+    move_point = og.create_moving_load(name="single_moving_point")
+    move_point.set_path(single_path)
+    move_point.add_load(load_obj=wheel)
+    example_bridge.add_load_case(move_point)
+    example_bridge.analyze()
+    memory_results = example_bridge.get_results()
+
+    store = og.ResultStore(str(tmp_path / "results.nc"))
+    example_bridge.results = og.Results(example_bridge.Mesh_obj, store=store)
+    example_bridge.analyze()
+    stored_results = example_bridge.get_results()
+    assert list(stored_results["Loadcase"].values) == list(
+        memory_results["Loadcase"].values
+    )
+    for name in ["displacements", "velocity", "acceleration", "forces"]:
+        assert np.allclose(stored_results[name], memory_results[name], equal_nan=True)
+    # load cases already in the store are not appended again
+    example_bridge.analyze()
+    assert example_bridge.get_results()["Loadcase"].size == 5
+    assert np.allclose(
+        example_bridge.get_results(load_case="single_moving_point")["forces"],
+        memory_results["forces"].isel(Loadcase=slice(1, 5)),
+        equal_nan=True,
+    )
+    with pytest.raises(ValueError):
+        example_bridge.get_results(local_forces=True)
+
+
+def test_increment_position_coordinates(bridge_model_42_negative):
+    og.ops.wipeAnalysis()
+    example_bridge = bridge_model_42_negative
+    wheel = og.create_load(
+        loadtype="point", name="wheel", point1=og.LoadPoint(5, 0, 3, 20)
+    )
+    wheel_load_case = og.create_load_case(name="Wheel")
+    wheel_load_case.add_load(wheel)
+    example_bridge.add_load_case(wheel_load_case)
+    single_path = og.create_moving_path(
+        start_point=og.Point(2, 0, 2), end_point=og.Point(8, 0, 3), increments=4
+    )
+    move_point = og.create_moving_load(name="single_moving_point")
+    move_point.set_path(single_path)
+    move_point.add_load(load_obj=wheel)
+    example_bridge.add_load_case(move_point)
+    example_bridge.analyze()
+    results = example_bridge.get_results()
+
+    assert results["Movingload"].values.tolist() == ["", *["single_moving_point"] * 4]
+    assert results["Increment"].values.tolist() == [-1, 0, 1, 2, 3]
+    assert np.isnan(results["X"].values[0])
+    assert np.allclose(results["X"].values[1:], [2, 4, 6, 8])
+    assert np.allclose(results["Z"].values[1:], [2, 2 + 1 / 3, 2 + 2 / 3, 3])
+    # range query by position of the moving load
+    in_range = results.isel(Loadcase=((results["X"] >= 3) & (results["X"] <= 7)).values)
+    assert in_range["Increment"].values.tolist() == [1, 2]
+    combination = example_bridge.get_combinations(
+        [{"single_moving_point": 1.2, "Wheel": 1}]
+    )
+    assert combination["Increment"].values.tolist() == [0, 1, 2, 3]
+    assert np.allclose(combination["X"], results["X"].values[1:])
+
+
+def test_element_connectivity_from_mesh(shell_link_bridge, monkeypatch):
+    og.ops.wipeAnalysis()
+    shell_bridge = shell_link_bridge
+    _, connectivity, ele_row = shell_bridge.Mesh_obj.get_element_connectivity()
+    for ele_tag in og.ops.getEleTags():
+        nodes = connectivity[ele_row[ele_tag]]
+        assert nodes[nodes >= 0].tolist() == list(og.ops.eleNodes(ele_tag))
+    # connectivity is captured once from the mesh, not queried per element
+    monkeypatch.setattr(og.ops, "eleNodes", None)
+    point_load = og.create_load(
+        loadtype="point", name="point", point1=og.LoadPoint(5, 0, 3, 20)
+    )
+    point_load_case = og.create_load_case(name="Point")
+    point_load_case.add_load(point_load)
+    shell_bridge.add_load_case(point_load_case)
+    shell_bridge.analyze()
+    ele_nodes_shell = shell_bridge.get_results()["ele_nodes_shell"].dropna("Element")
+    shell_row = [ele_row[tag] for tag in ele_nodes_shell["Element"].values]
+    assert np.array_equal(ele_nodes_shell, connectivity[shell_row])
+
+
+def test_compiled_results_after_growing_rows(bridge_model_42_negative):
+    og.ops.wipeAnalysis()
+    example_bridge = bridge_model_42_negative
+    point_load = og.create_load(
+        loadtype="point", name="point", point1=og.LoadPoint(5, 0, 3, 20)
+    )
+
+    def add_point_load_cases(names):
+        for name in names:
+            point_load_case = og.create_load_case(name=name)
+            point_load_case.add_load(point_load)
+            example_bridge.add_load_case(point_load_case)
+
+    add_point_load_cases(["Point 0"])
+    example_bridge.analyze()
+    first_results = example_bridge.get_results()
+    # more load cases than the initial row capacity of the response arrays
+    add_point_load_cases(["Point {}".format(ind) for ind in range(1, 12)])
+    example_bridge.analyze()
+    results = example_bridge.get_results()
+    assert results["Loadcase"].size == 12
+    assert np.allclose(
+        results["forces"].isel(Loadcase=-1),
+        first_results["forces"],
+        equal_nan=True,
+    )
+
+
+def test_rejected_extract_analysis_leaves_results_unchanged(bridge_model_42_negative):
+    results = og.Results(bridge_model_42_negative.Mesh_obj)
+
+    def node_analysis(name, node_tags):
+        analysis = og.Analysis(
+            analysis_name=name,
+            ops_grillage_name="test",
+            pyfile=False,
+            node_counter=None,
+            ele_counter=None,
+        )
+        analysis.node_disp = {tag: [float(tag)] * 6 for tag in node_tags}
+        return analysis
+
+    results.extract_analysis(analysis_obj=node_analysis("first", [1, 2, 3]))
+    # last increment extracted different nodes, no increment is stored
+    with pytest.raises(ValueError):
+        results.extract_analysis(
+            list_of_inc_analysis=[
+                node_analysis("increment 1", [1, 2, 3]),
+                node_analysis("increment 2", [1, 2]),
+            ],
+            moving_load_name="moving",
+        )
+    with pytest.raises(ValueError):
+        results.extract_analysis(analysis_obj=node_analysis("second", [1, 2]))
+    assert results.load_case_count == 1
+    assert list(results.basic_load_case_record) == ["first"]
+    assert results.moving_load_case_record == []
+    assert results.moving_load_case_names == []
+    compiled = results.compile_data_array(local_force_option=False)
+    assert list(compiled["Loadcase"].values) == ["first"]
+
+
+# test static load cases are solved from the undeformed state, independent of the load cases analysed before them
+def test_static_analysis_independent_of_preceding_load_cases(shell_link_bridge):
+    og.ops.wipeAnalysis()
+    shell_link_model = shell_link_bridge
+
+    lane_point_1 = og.create_load_vertex(x=5, y=0, z=3, p=5)
+    lane_point_2 = og.create_load_vertex(x=8, y=0, z=3, p=5)
+    lane_point_3 = og.create_load_vertex(x=8, y=0, z=5, p=5)
+    lane_point_4 = og.create_load_vertex(x=5, y=0, z=5, p=5)
+    Lane = og.PatchLoading(
+        point1=lane_point_1,
+        point2=lane_point_2,
+        point3=lane_point_3,
+        point4=lane_point_4,
+    )
+    lane_load_case = og.LoadCase(name="Lane")
+    lane_load_case.add_load(Lane)
+    shell_link_model.add_load_case(lane_load_case)
+    point_load_case = og.LoadCase(name="Point")
+    point_load_case.add_load(
+        og.create_load(loadtype="point", name="wheel", point1=og.LoadPoint(4, 0, 4, 20))
+    )
+    shell_link_model.add_load_case(point_load_case)
+
+    shell_link_model.analyze(load_case="Point")
+    ref_results = shell_link_model.get_results().sel(Loadcase="Point")
+
+    shell_link_model.results = og.Results(shell_link_model.Mesh_obj)
+    shell_link_model.analyze()
+    results = shell_link_model.get_results().sel(Loadcase="Point")
+    for var in ref_results.data_vars:
+        assert og.np.allclose(
+            results[var].values.astype(float),
+            ref_results[var].values.astype(float),
+            equal_nan=True,
+        )
+
+
+# test responses evaluated from influence surfaces match the responses of OpenSees analysis
+def test_influence_surfaces(bridge_model_42_negative):
+    og.ops.wipeAnalysis()
+    example_bridge = bridge_model_42_negative
+
+    lane_point_1 = og.create_load_vertex(x=3, z=2, p=5)
+    lane_point_2 = og.create_load_vertex(x=7.5, z=2, p=5)
+    lane_point_3 = og.create_load_vertex(x=7.5, z=5.3, p=5)
+    lane_point_4 = og.create_load_vertex(x=3, z=5.3, p=5)
+    Lane = og.create_load(
+        loadtype="patch",
+        name="Lane 1",
+        point1=lane_point_1,
+        point2=lane_point_2,
+        point3=lane_point_3,
+        point4=lane_point_4,
+        shape_function="hermite",
+    )
+    lane_load_case = og.create_load_case(name="Lane")
+    lane_load_case.add_load(Lane)
+    example_bridge.add_load_case(lane_load_case)
+
+    front_wheel = og.create_load(
+        loadtype="point",
+        name="front wheel",
+        point1=og.LoadPoint(2, 0, 2, 50),
+        shape_function="hermite",
+    )
+    single_path = og.create_moving_path(
+        start_point=og.Point(2, 0, 2), end_point=og.Point(8, 0, 3), increments=5
+    )
+    move_point = og.create_moving_load(name="single_moving_point")
+    move_point.set_path(single_path)
+    move_point.add_load(load_obj=front_wheel)
+    example_bridge.add_load_case(move_point)
+
+    example_bridge.analyze()
+    ref_results = example_bridge.get_results()
+
+    # vertical unit loads only can not represent the moments of hermite shape functions
+    example_bridge.build_influence_surfaces(dof=[2])
+    with pytest.raises(ValueError):
+        example_bridge.analyze(influence_surfaces=True)
+
+    influence_surfaces = example_bridge.build_influence_surfaces()
+    assert influence_surfaces.node_disp.shape == (
+        len(influence_surfaces.unit_loads),
+        len(example_bridge.Mesh_obj.node_spec) * 6,
+    )
+    # influence surfaces are used only when requested, and not with other solution options
+    for conflicting_option in [{"workers": 2}, {"factor_once": True}]:
+        with pytest.raises(ValueError):
+            example_bridge.analyze(influence_surfaces=True, **conflicting_option)
+    example_bridge.results = og.Results(example_bridge.Mesh_obj)
+    example_bridge.analyze(influence_surfaces=True)
+    results = example_bridge.get_results()
+
+    assert list(results.Loadcase.values) == list(ref_results.Loadcase.values)
+    assert og.np.allclose(
+        results.displacements.values.astype(float),
+        ref_results.displacements.values.astype(float),
+        equal_nan=True,
+    )
+    assert og.np.allclose(
+        results.forces.values.astype(float),
+        ref_results.forces.values.astype(float),
+        equal_nan=True,
+    )
+
+
 # test moving compound load, test pass if no errors are returned
 def test_moving_compound_load(bridge_model_42_negative):
     og.ops.wipeAnalysis()
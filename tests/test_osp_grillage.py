@@ -31,6 +31,60 @@ def test_model_instance(bridge_model_42_negative):
     assert a
 
 
+# test spatial index of grids finds the grids of points
+def test_grid_index(bridge_model_42_negative):
+    example_bridge = bridge_model_42_negative
+    mesh = example_bridge.Mesh_obj
+    for grid_tag, grid_nodes in mesh.grid_number_dict.items():
+        coords = [mesh.node_spec[node]["coordinate"] for node in grid_nodes]
+        x = sum(coord[0] for coord in coords) / len(coords)
+        z = sum(coord[2] for coord in coords) / len(coords)
+        assert grid_tag in mesh.get_grids_at_point(x, z)
+        nodes, grid = example_bridge._get_point_load_nodes(og.LoadPoint(x, 0, z, 1))
+        assert grid == grid_tag
+    assert mesh.get_grids_at_point(-100, -100) == []
+
+
+# test node pair index of mesh finds the members between nodes
+def test_element_index(bridge_model_42_negative):
+    mesh = bridge_model_42_negative.Mesh_obj
+    for member_index, ele_list in enumerate(
+        [mesh.long_ele, mesh.trans_ele, mesh.edge_span_ele]
+    ):
+        for ele_index, ele in enumerate(ele_list):
+            assert (
+                ele_index
+                in mesh.get_elements_between_nodes(ele[2], ele[1])[member_index]
+            )
+    assert mesh.get_elements_between_nodes(-1, -2) == ([], [], [])
+
+
+# test walk across grids crossed by a line segment
+def test_grids_along_line(bridge_model_42_negative):
+    bridge = bridge_model_42_negative
+    mesh = bridge.Mesh_obj
+    start = og.create_load_vertex(x=3.1, y=0, z=1.4, p=1)
+    end = og.create_load_vertex(x=8.7, y=0, z=5.6, p=1)
+    _, start_grid = bridge._get_point_load_nodes(start)
+    _, end_grid = bridge._get_point_load_nodes(end)
+    walked = mesh.get_grids_along_line(
+        start.x, start.z, end.x, end.z, start_grids=[start_grid, end_grid]
+    )
+    scanned = mesh.get_grids_along_line(start.x, start.z, end.x, end.z)
+    assert set(walked) <= set(scanned)
+    assert start_grid in walked and end_grid in walked
+    # grids along the segment are walked
+    for t in np.linspace(0, 1, 21):
+        x = start.x + t * (end.x - start.x)
+        z = start.z + t * (end.z - start.z)
+        _, grid = bridge._get_point_load_nodes(
+            og.create_load_vertex(x=x, y=0, z=z, p=1)
+        )
+        assert grid in walked
+    # walked grids are in order of grid_number_dict
+    assert walked == [grid for grid in mesh.grid_number_dict if grid in walked]
+
+
 #  test creating beam model with rigid links
 def test_create_beam_link_model(beam_link_bridge):
     beam_link_model = beam_link_bridge
@@ -98,6 +98,126 @@ def test_envelope(bridge_model_42_negative):
     print(og.ops.nodeDisp(25)[1])
 
 
+def test_streaming_envelope(bridge_model_42_negative):
+    og.ops.wipeAnalysis()
+    example_bridge = bridge_model_42_negative
+
+    front_wheel = og.create_load(
+        loadtype="point", name="front wheel", point1=og.LoadPoint(2, 0, 2, 50)
+    )
+    single_path = og.create_moving_path(
+        start_point=og.Point(2, 0, 2), end_point=og.Point(8, 0, 3), increments=70
+    )
+    move_point = og.create_moving_load(name="single_moving_point")
+    move_point.set_path(single_path)
+    move_point.add_load(load_obj=front_wheel)
+    example_bridge.add_load_case(move_point)
+
+    example_bridge.analyze()
+    results = example_bridge.get_results()
+
+    example_bridge.results = og.Results(example_bridge.Mesh_obj)
+    example_bridge.analyze(envelope=True)
+    # increments are not stored in results
+    assert example_bridge.results.load_case_count == 0
+    envelope = example_bridge.get_envelope("single_moving_point")
+    for var in ["displacements", "forces"]:
+        assert og.np.allclose(
+            envelope[var].sel(Extrema="max").values,
+            results[var].max(dim="Loadcase").values,
+            equal_nan=True,
+        )
+        assert og.np.allclose(
+            envelope[var].sel(Extrema="min").values,
+            results[var].min(dim="Loadcase").values,
+            equal_nan=True,
+        )
+    max_location = results.forces.sel(Component="Mz_i").idxmax(dim="Loadcase")
+    assert (
+        envelope.forces_loadcase.sel(Extrema="max", Component="Mz_i").values
+        == max_location.values
+    ).all()
+    with pytest.raises(ValueError):
+        example_bridge.get_envelope("not a moving load")
+
+
+# test combinations of a factor matrix match combinations evaluated one at a time
+def test_get_combinations(bridge_model_42_negative):
+    og.ops.wipeAnalysis()
+    example_bridge = bridge_model_42_negative
+    barrier = og.create_load(
+        loadtype="line",
+        name="Barrier curb load",
+        point1=og.create_load_vertex(x=5, y=0, z=1, p=2),
+        point2=og.create_load_vertex(x=10, y=0, z=1, p=2),
+    )
+    barrier_load_case = og.create_load_case(name="Barrier")
+    barrier_load_case.add_load(barrier)
+    example_bridge.add_load_case(barrier_load_case)
+    wheel = og.create_load(
+        loadtype="point", name="wheel", point1=og.LoadPoint(5, 0, 3, 20)
+    )
+    wheel_load_case = og.create_load_case(name="Wheel")
+    wheel_load_case.add_load(wheel)
+    example_bridge.add_load_case(wheel_load_case)
+    single_path = og.create_moving_path(
+        start_point=og.Point(2, 0, 2), end_point=og.Point(8, 0, 3), increments=4
+    )
+    move_point = og.create_moving_load(name="single_moving_point")
+    move_point.set_path(single_path)
+    move_point.add_load(load_obj=wheel)
+    example_bridge.add_load_case(move_point)
+    example_bridge.analyze()
+
+    results = example_bridge.get_results()
+    static_combinations = {
+        "ULS": {"Barrier": 1.2, "Wheel": 1.5},
+        "SLS": {"Barrier": 1, "Wheel": 0.7},
+    }
+    combined = example_bridge.get_combinations(static_combinations)
+    assert list(combined["Combination"].values) == ["ULS", "SLS"]
+    assert "Loadcase" not in combined["displacements"].dims
+    for name, comb in static_combinations.items():
+        expected = sum(
+            results["displacements"].sel(Loadcase=lc) * factor
+            for lc, factor in comb.items()
+        )
+        assert np.allclose(
+            combined["displacements"].sel(Combination=name), expected, equal_nan=True
+        )
+        # single combination of get_results() evaluated by the same engine
+        assert np.allclose(
+            combined["forces"].sel(Combination=name),
+            example_bridge.get_results(combinations=comb)["forces"],
+            equal_nan=True,
+        )
+
+    # factor matrix with a moving load case, static load cases added to each increment
+    factors = [[1.2, 0, 2], [1, 0.5, 1.8]]
+    load_case = ["Barrier", "Wheel", "single_moving_point"]
+    combined = example_bridge.get_combinations(factors, load_case=load_case)
+    assert combined["forces"].dims[:2] == ("Combination", "Loadcase")
+    increment_names = [
+        inc["name"]
+        for inc in example_bridge.moving_load_case_dict["single_moving_point"]
+    ]
+    assert list(combined["Loadcase"].values) == increment_names
+    for row, (barrier_factor, wheel_factor, moving_factor) in enumerate(factors):
+        static = (
+            results["forces"].sel(Loadcase="Barrier") * barrier_factor
+            + results["forces"].sel(Loadcase="Wheel") * wheel_factor
+        )
+        for inc_name in increment_names:
+            expected = static + results["forces"].sel(Loadcase=inc_name) * moving_factor
+            assert np.allclose(
+                combined["forces"].isel(Combination=row).sel(Loadcase=inc_name),
+                expected,
+                equal_nan=True,
+            )
+    with pytest.raises(ValueError):
+        example_bridge.get_combinations(factors, load_case=load_case[:2])
+
+
 def test_plot_force(bridge_model_42_negative):
     # test functionality of plot_force and its output
     og.ops.wipeAnalysis()
@@ -23,6 +23,33 @@ def test_sort_vertices():
     assert actual == ref_ans
 
 
+# test clipping of a polygon against arrays of convex polygons
+def test_clip_polygons():
+    subject = og.np.array([[0.5, 0.5], [2.5, 0.5], [2.5, 1.5], [0.5, 1.5]])
+    clip = og.np.array(
+        [
+            [[0, 0], [1, 0], [1, 1], [0, 1]],  # partially covered
+            [[1, 0.5], [2, 0.5], [2, 1.5], [1, 1.5]],  # fully covered
+            [[3, 0], [4, 0], [4, 1], [3, 1]],  # outside
+            [[0, 0], [1, 0], [1, 1], [1, 1]],  # triangle, repeated vertex
+        ]
+    )
+    vertices, counts = og.clip_polygons(subject, clip, tol=1e-12)
+    assert list(counts) == [4, 4, 0, 3]
+    assert sorted(map(tuple, vertices[0, :4].tolist())) == [
+        (0.5, 0.5),
+        (0.5, 1.0),
+        (1.0, 0.5),
+        (1.0, 1.0),
+    ]
+    assert sorted(map(tuple, vertices[1, :4].tolist())) == sorted(
+        map(tuple, clip[1].tolist())
+    )
+    # segments are clipped too
+    _, counts = og.clip_polygons(subject[:2], clip, tol=1e-12)
+    assert list(counts) == [2, 2, 0, 2]
+
+
 def test_create_arc_equation():
     a = og.find_circle(
         x1=0,
@@ -48,3 +75,36 @@ def test_rotating_points():
     print(rotated_coord)
     assert og.np.isclose(rotated_coord[0], 5.585100198856649)
     assert og.np.isclose(rotated_coord[1], -1.3146163850505417)
+
+
+# test inverse bilinear mapping of points to natural coordinates of grids
+def test_solve_zeta_eta():
+    # skew quadrilateral and parallelogram
+    for corners in [
+        og.np.array([[0, 0], [2, 0.2], [2.5, 1.5], [0.3, 1.2]]),
+        og.np.array([[0, 0], [2, 0], [2.5, 1], [0.5, 1]]),
+    ]:
+        eta, zeta = og.np.meshgrid(og.np.linspace(-1, 1, 5), og.np.linspace(-1, 1, 5))
+        shape = (
+            og.np.stack(
+                [
+                    (1 - eta) * (1 - zeta),
+                    (1 + eta) * (1 - zeta),
+                    (1 + eta) * (1 + zeta),
+                    (1 - eta) * (1 + zeta),
+                ],
+                axis=-1,
+            )
+            / 4
+        )
+        points = shape @ corners
+        # all points at once
+        eta_solved, zeta_solved = og.solve_zeta_eta(
+            points[..., 0], points[..., 1], *corners.ravel()
+        )
+        assert og.np.allclose(eta_solved, eta)
+        assert og.np.allclose(zeta_solved, zeta)
+        # single point
+        assert og.solve_zeta_eta(
+            points[1, 3, 0], points[1, 3, 1], *corners.ravel()
+        ) == pytest.approx((eta[1, 3], zeta[1, 3]))